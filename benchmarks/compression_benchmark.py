@@ -0,0 +1,86 @@
+"""
+Serialization and compression benchmark.
+
+Measures, for synthetic parameter listings of increasing size:
+- json.dumps vs orjson.dumps serialization time
+- CPU time and compressed size for each available encoding and level
+
+Usage:
+    python benchmarks/compression_benchmark.py [--sizes 100 1000 10000] [--repeat 20]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "services" / "auxiliary-service"))
+
+from app.compression import available_encodings, compress  # noqa: E402
+
+LEVELS = {
+    "gzip": [1, 6, 9],
+    "br": [1, 4, 11],
+    "zstd": [1, 3, 10],
+}
+
+
+def build_listing(count: int) -> dict:
+    """Build a parameter listing shaped like GET /aws/parameters."""
+    return {
+        "parameters": [
+            {
+                "name": f"/aws-challenge/dev/service-{i % 50}/setting-{i}",
+                "type": "SecureString" if i % 7 == 0 else "String",
+                "last_modified": "2025-10-24T08:00:00+00:00",
+                "version": i % 13 + 1
+            }
+            for i in range(count)
+        ],
+        "count": count,
+        "path_prefix": None,
+        "next_cursor": None,
+        "auxiliary_service_version": "1.0.0"
+    }
+
+
+def timed(fn, repeat: int) -> float:
+    """Average CPU seconds per call."""
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        listing = build_listing(size)
+        body = orjson.dumps(listing)
+
+        json_ms = timed(lambda: json.dumps(listing).encode(), args.repeat) * 1000
+        orjson_ms = timed(lambda: orjson.dumps(listing), args.repeat) * 1000
+
+        print(f"\n{size} parameters, {len(body):,} bytes uncompressed")
+        print(f"  serialize  json {json_ms:8.3f} ms   orjson {orjson_ms:8.3f} ms   ({json_ms / orjson_ms:.1f}x)")
+        print(f"  {'encoding':<10}{'level':>6}{'bytes':>12}{'ratio':>8}{'cpu ms':>10}{'MB/s':>10}")
+
+        for encoding in available_encodings():
+            for level in LEVELS[encoding]:
+                compressed = compress(body, encoding, level)
+                cpu_ms = timed(lambda: compress(body, encoding, level), args.repeat) * 1000
+                throughput = len(body) / (cpu_ms / 1000) / 1e6 if cpu_ms else float("inf")
+                print(
+                    f"  {encoding:<10}{level:>6}{len(compressed):>12,}"
+                    f"{len(body) / len(compressed):>8.1f}{cpu_ms:>10.3f}{throughput:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
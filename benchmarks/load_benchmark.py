@@ -0,0 +1,395 @@
+"""
+Load and latency benchmark for both services.
+
+Boots the auxiliary service (AWS mocked with moto and seeded with buckets,
+objects and parameters) and the Main API in front of it on localhost, then
+drives each endpoint with a fixed number of concurrent clients and reports,
+as JSON:
+- throughput, errors and p50/p95/p99 latency per endpoint
+- resident and peak memory of each service
+
+With --baseline, results are compared with a stored report and the run
+fails when throughput drops, p95 latency or peak memory grows by more than
+--tolerance, or when an endpoint errors more often than in the baseline.
+Endpoints answering 404 (absent from an older revision) are reported as
+skipped and left out of the comparison.
+Baselines are machine-specific and are not committed: record one (with
+--save-baseline) on the machine that runs the comparison. CI does this per
+pull request, benchmarking the base commit and then the head on one runner.
+
+Usage:
+    python benchmarks/load_benchmark.py [--duration 5] [--concurrency 32 | NAME=N ...]
+        [--endpoints NAME ...] [--output report.json]
+        [--baseline benchmarks/load_baseline.json [--save-baseline] [--tolerance 0.25]]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+MAIN_API_DIR = ROOT / "services" / "main-api"
+AUXILIARY_DIR = ROOT / "services" / "auxiliary-service"
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "load_baseline.json"
+
+# Seed data of the mocked AWS account
+BUCKETS = 20
+OBJECTS = 500
+PARAMETERS = 200
+REGION = "eu-west-1"
+
+# name -> (service, path, default concurrency)
+ENDPOINTS = {
+    "main_live": ("main", "/health/live", 32),
+    "main_s3_buckets": ("main", "/api/v1/s3/buckets", 32),
+    "main_s3_objects": ("main", "/api/v1/s3/buckets/bench-bucket-0/objects", 8),
+    "main_parameters": ("main", "/api/v1/parameters?path_prefix=/bench/", 32),
+    "main_parameter_value": ("main", "/api/v1/parameters/value?name=/bench/service-1/setting-1", 32),
+    "main_parameters_by_path": ("main", "/api/v1/parameters/by-path?path=/bench/service-2/", 8),
+    "aux_s3_buckets": ("aux", "/aws/s3/buckets", 16),
+    "aux_parameters": ("aux", "/aws/parameters?path_prefix=/bench/", 16),
+}
+
+# Liveness paths tried in order; older revisions (e.g. a PR base) lack /health/live
+LIVENESS_PATHS = ("/health/live", "/health", "/")
+
+# Relative changes beyond the tolerance count as regressions
+HIGHER_IS_WORSE = ("p95_ms",)
+LOWER_IS_WORSE = ("throughput_rps",)
+
+
+def free_port() -> int:
+    """Ask the OS for an unused localhost port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def serve_auxiliary(port: int) -> None:
+    """Run the auxiliary service with moto-backed, seeded S3 and SSM (subprocess entry point)."""
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN"):
+        os.environ[name] = "testing"
+    os.environ["AWS_DEFAULT_REGION"] = os.environ["AWS_REGION"] = REGION
+
+    import boto3
+    import uvicorn
+    from moto import mock_s3, mock_ssm
+
+    mock_s3().start()
+    mock_ssm().start()
+
+    s3 = boto3.client("s3", region_name=REGION)
+    for i in range(BUCKETS):
+        s3.create_bucket(Bucket=f"bench-bucket-{i}", CreateBucketConfiguration={"LocationConstraint": REGION})
+    for i in range(OBJECTS):
+        s3.put_object(Bucket="bench-bucket-0", Key=f"logs/{i:05d}.txt", Body=b"x" * 1024)
+
+    ssm = boto3.client("ssm", region_name=REGION)
+    for i in range(PARAMETERS):
+        ssm.put_parameter(
+            Name=f"/bench/service-{i % 10}/setting-{i}",
+            Value=f"value-{i}",
+            Type="SecureString" if i % 7 == 0 else "String"
+        )
+
+    sys.path.insert(0, str(AUXILIARY_DIR))
+    from app.main import app
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def start_services(aux_port: int, main_port: int) -> Dict[str, subprocess.Popen]:
+    """Start the auxiliary service, then the Main API pointed at it."""
+    env = {
+        **os.environ,
+        "LOG_LEVEL": "WARNING",
+        "AUXILIARY_SERVICE_URL": f"http://127.0.0.1:{aux_port}",
+    }
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+
+    processes: Dict[str, subprocess.Popen] = {}
+    try:
+        processes["aux"] = subprocess.Popen(
+            [sys.executable, __file__, "--serve-auxiliary", str(aux_port)],
+            cwd=AUXILIARY_DIR, env=env, stdout=subprocess.DEVNULL
+        )
+        wait_until_live(f"http://127.0.0.1:{aux_port}", processes["aux"])
+
+        processes["main"] = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(main_port),
+             "--log-level", "warning", "--no-access-log"],
+            cwd=MAIN_API_DIR, env=env, stdout=subprocess.DEVNULL
+        )
+        wait_until_live(f"http://127.0.0.1:{main_port}", processes["main"])
+    except BaseException:
+        # Don't leave a started service behind (it would also hold our stderr open)
+        stop_services(processes)
+        raise
+    return processes
+
+
+def stop_services(processes: Dict[str, subprocess.Popen]) -> None:
+    """Terminate the services, killing any that do not exit within 10 s."""
+    for process in processes.values():
+        process.terminate()
+    for process in processes.values():
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def wait_until_live(base_url: str, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    """Poll the first liveness path the service has until it answers 200."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{base_url} exited with code {process.returncode} during startup")
+        for path in LIVENESS_PATHS:
+            try:
+                status_code = httpx.get(f"{base_url}{path}", timeout=1.0).status_code
+            except httpx.HTTPError:
+                break
+            if status_code == 200:
+                return
+            if status_code != 404:
+                break
+        time.sleep(0.2)
+    raise RuntimeError(f"{base_url} did not become live within {timeout:.0f}s")
+
+
+def memory_mb(pid: int) -> Dict[str, Optional[float]]:
+    """Current and peak resident memory of a process from /proc (None where unavailable)."""
+    fields = {"VmRSS": None, "VmHWM": None}
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as status:
+            for line in status:
+                name, _, value = line.partition(":")
+                if name in fields:
+                    fields[name] = round(int(value.split()[0]) / 1024, 1)
+    except OSError:
+        pass
+    return {"rss_mb": fields["VmRSS"], "peak_rss_mb": fields["VmHWM"]}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    index = max(0, min(len(values) - 1, round(q / 100 * len(values)) - 1))
+    return values[index]
+
+
+async def drive(client: httpx.AsyncClient, url: str, concurrency: int, duration: float, warmup: int) -> dict:
+    """Keep `concurrency` requests in flight for `duration` seconds and summarize latencies."""
+    for _ in range(warmup):
+        await client.get(url)
+
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                response = await client.get(url)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    # Latencies are of successful requests only; None if there were none
+    ms = sorted(latency * 1000 for latency in latencies)
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "error_rate": round(errors / (len(latencies) + errors), 4) if latencies or errors else 0.0,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(ms), 2) if ms else None,
+        "p50_ms": round(percentile(ms, 50), 2) if ms else None,
+        "p95_ms": round(percentile(ms, 95), 2) if ms else None,
+        "p99_ms": round(percentile(ms, 99), 2) if ms else None,
+    }
+
+
+async def run_benchmark(
+    base_urls: Dict[str, str],
+    processes: Dict[str, subprocess.Popen],
+    endpoints: List[str],
+    concurrency: Dict[str, int],
+    duration: float,
+    warmup: int
+) -> dict:
+    """Benchmark the selected endpoints one after another."""
+    results = {}
+    limits = httpx.Limits(max_connections=max(concurrency.values()), max_keepalive_connections=None)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0, headers={"Accept-Encoding": "identity"}) as client:
+        for name in endpoints:
+            service, path, _ = ENDPOINTS[name]
+            url = base_urls[service] + path
+            try:
+                missing = (await client.get(url)).status_code == 404
+            except httpx.HTTPError:
+                missing = False
+            if missing:
+                # Not in this revision (e.g. a PR base older than the endpoint)
+                results[name] = {"skipped": "not found"}
+            else:
+                results[name] = await drive(client, url, concurrency[name], duration, warmup)
+            print(f"  {name:<26}{json.dumps(results[name])}", file=sys.stderr)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "duration_s": duration,
+        },
+        "endpoints": results,
+        "memory": {service: memory_mb(process.pid) for service, process in processes.items()},
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> dict:
+    """
+    Relative change of each tracked value against the baseline, flagging regressions.
+
+    Values are only skipped when the baseline lacks them (or skipped the
+    endpoint). A value the current run could not measure (e.g. no latency
+    because every request failed, or the endpoint now answers 404) is a
+    regression, and so is any error rate above the baseline's.
+    """
+    changes = []
+
+    def add(name: str, metric: str, current: Optional[float], previous: float, change: Optional[float], regression: bool):
+        changes.append({
+            "name": name,
+            "metric": metric,
+            "baseline": previous,
+            "current": current,
+            "change": round(change, 3) if change is not None else None,
+            "regression": regression,
+        })
+
+    def check(name: str, metric: str, current: Optional[float], previous: Optional[float], higher_is_worse: bool):
+        if previous is None:
+            return
+        if current is None:
+            add(name, metric, current, previous, None, True)
+            return
+        if previous == 0:
+            # No relative change from zero; any move in the bad direction counts
+            add(name, metric, current, previous, None, current > 0 if higher_is_worse else False)
+            return
+        change = (current - previous) / previous
+        add(name, metric, current, previous, change, change > tolerance if higher_is_worse else change < -tolerance)
+
+    for name, result in report["endpoints"].items():
+        previous = baseline.get("endpoints", {}).get(name)
+        if previous is None or "skipped" in previous:
+            continue
+        if "skipped" in result:
+            # Served by the baseline but gone now
+            add(name, "requests", None, previous["requests"], None, True)
+            continue
+        for metric in HIGHER_IS_WORSE:
+            check(name, metric, result[metric], previous.get(metric), True)
+        for metric in LOWER_IS_WORSE:
+            check(name, metric, result[metric], previous.get(metric), False)
+
+        previous_rate = previous.get("error_rate", 0.0)
+        add(
+            name, "error_rate", result["error_rate"], previous_rate,
+            None, result["errors"] > 0 and result["error_rate"] > previous_rate
+        )
+
+    for service, memory in report["memory"].items():
+        previous = baseline.get("memory", {}).get(service, {})
+        check(service, "peak_rss_mb", memory["peak_rss_mb"], previous.get("peak_rss_mb"), True)
+
+    return {
+        "tolerance": tolerance,
+        "regressions": [change for change in changes if change["regression"]],
+        "changes": changes,
+    }
+
+
+def parse_concurrency(values: List[str], endpoints: List[str]) -> Dict[str, int]:
+    """Per-endpoint concurrency from defaults, a global N and NAME=N overrides."""
+    concurrency = {name: ENDPOINTS[name][2] for name in endpoints}
+    for value in values:
+        name, sep, count = value.rpartition("=")
+        if not sep:
+            concurrency = {endpoint: int(count) for endpoint in concurrency}
+        elif name in ENDPOINTS:
+            concurrency[name] = int(count)
+        else:
+            raise SystemExit(f"Unknown endpoint in --concurrency: {name}")
+    return concurrency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--serve-auxiliary", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    parser.add_argument("--endpoints", nargs="+", choices=list(ENDPOINTS), default=list(ENDPOINTS))
+    parser.add_argument("--concurrency", nargs="+", default=[], metavar="N|NAME=N")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per endpoint")
+    parser.add_argument("--warmup", type=int, default=20, help="Sequential requests per endpoint before measuring")
+    parser.add_argument("--output", type=Path, help="Also write the report to this file")
+    parser.add_argument("--baseline", type=Path, nargs="?", const=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Write the report as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative change (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    if args.serve_auxiliary:
+        serve_auxiliary(args.serve_auxiliary)
+        return
+
+    concurrency = parse_concurrency(args.concurrency, args.endpoints)
+    ports = {"aux": free_port(), "main": free_port()}
+    base_urls = {service: f"http://127.0.0.1:{port}" for service, port in ports.items()}
+
+    processes = start_services(ports["aux"], ports["main"])
+    try:
+        report = asyncio.run(
+            run_benchmark(base_urls, processes, args.endpoints, concurrency, args.duration, args.warmup)
+        )
+    finally:
+        stop_services(processes)
+
+    regressed = False
+    if args.baseline and args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+    elif args.baseline:
+        report["comparison"] = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+        regressed = bool(report["comparison"]["regressions"])
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        args.output.write_text(output + "\n")
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
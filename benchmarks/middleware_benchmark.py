@@ -0,0 +1,146 @@
+"""
+Middleware overhead benchmark.
+
+Drives the Main API middleware stack directly through ASGI (no server, no
+network) and reports the mean time per request for:
+- no middleware (baseline)
+- the previous @app.middleware("http") implementations (BaseHTTPMiddleware)
+- the pure ASGI implementations in app.middleware
+
+for a small JSON response and a streamed NDJSON response. The difference
+to the baseline is the per-request middleware overhead.
+
+Usage:
+    python benchmarks/middleware_benchmark.py [--requests 5000] [--chunks 20]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "services" / "main-api"))
+
+from app.metrics import REQUEST_COUNT, REQUEST_DURATION, route_template  # noqa: E402
+from app.middleware import MetricsMiddleware, VersionHeadersMiddleware  # noqa: E402
+
+VERSION_HEADERS = {"X-Main-API-Version": "1.0.0", "X-Auxiliary-Service-Version": "1.0.0"}
+
+
+def build_app(stack: str, chunks: int) -> FastAPI:
+    """Build an app with one JSON and one streaming endpoint behind the given middleware stack."""
+    app = FastAPI(default_response_class=ORJSONResponse)
+
+    @app.get("/json")
+    async def json_endpoint():
+        return {"status": "ok", "count": 1}
+
+    @app.get("/stream")
+    async def stream_endpoint():
+        async def body():
+            for i in range(chunks):
+                yield b'{"key": "logs/%d.txt", "size": 1024}\n' % i
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    if stack == "base_http":
+        # The implementations these replaced
+        @app.middleware("http")
+        async def add_version_headers(request: Request, call_next):
+            response = await call_next(request)
+            for name, value in VERSION_HEADERS.items():
+                response.headers[name] = value
+            return response
+
+        @app.middleware("http")
+        async def metrics_middleware(request: Request, call_next):
+            method = request.method
+            start = time.perf_counter()
+            response = await call_next(request)
+            endpoint = route_template(request.scope)
+            REQUEST_DURATION.labels(method=method, endpoint=endpoint).observe(time.perf_counter() - start)
+            REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=response.status_code).inc()
+            return response
+
+    elif stack == "asgi":
+        app.add_middleware(VersionHeadersMiddleware, headers=lambda: VERSION_HEADERS)
+        app.add_middleware(MetricsMiddleware)
+
+    return app
+
+
+async def request(app: FastAPI, path: str) -> int:
+    """Send one GET through the ASGI app and return the number of body bytes."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"host", b"benchmark")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("benchmark", 80),
+    }
+    size = 0
+    received = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal received
+        if received:
+            # Like a server: nothing more until the client goes away
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    disconnected.set()
+    return size
+
+
+async def measure(app: FastAPI, path: str, requests: int) -> float:
+    """Mean microseconds per request after a warm-up."""
+    for _ in range(min(requests // 10, 500)):
+        await request(app, path)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request(app, path)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def run(requests: int, chunks: int) -> None:
+    stacks = ("none", "base_http", "asgi")
+    print(f"{requests} requests per case, {chunks} chunks per streamed response\n")
+    print(f"  {'endpoint':<10}{'stack':<12}{'us/request':>12}{'overhead us':>14}")
+
+    for path in ("/json", "/stream"):
+        baseline = None
+        for stack in stacks:
+            per_request = await measure(build_app(stack, chunks), path, requests)
+            baseline = per_request if baseline is None else baseline
+            print(f"  {path:<10}{stack:<12}{per_request:>12.1f}{per_request - baseline:>14.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--chunks", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, args.chunks))
+
+
+if __name__ == "__main__":
+    main()
@@ -20,11 +20,75 @@ class Settings(BaseSettings):
     # When running in EKS with IRSA, boto3 will automatically use the service account token
     # No need to configure credentials explicitly
     
+    # AWS call execution: worker threads per service and pending-call bound
+    aws_s3_max_workers: int = 8
+    aws_ssm_max_workers: int = 16
+    aws_executor_max_queue: int = 200
+    
+    # Build AWS clients and resolve credentials in the background at startup;
+    # readiness waits for it (otherwise clients are built on first use)
+    aws_prewarm_clients: bool = True
+    
+    # Background health checks
+    health_check_interval: float = 15.0
+    health_check_timeout: float = 5.0
+    
+    # Bucket details (?details=true)
+    s3_details_concurrency: int = 16
+    s3_details_cache_ttl: float = 300.0
+    s3_details_cache_max_entries: int = 5000
+    
+    # Parameter value cache (TTLs in seconds; 0 disables that kind of entry)
+    parameter_cache_enabled: bool = True
+    parameter_cache_max_entries: int = 10000
+    parameter_cache_ttl: float = 300.0
+    parameter_cache_secure_ttl: float = 30.0
+    parameter_cache_negative_ttl: float = 30.0
+    parameter_cache_revalidate_interval: float = 60.0
+    
+    # Parameter name index (path trie) for tree browsing and prefix listings
+    parameter_index_enabled: bool = True
+    parameter_index_refresh_interval: float = 60.0
+    parameter_index_max_age: float = 180.0
+    
+    # Parameter listing pagination
+    parameters_page_size: int = 50
+    parameters_max_pages_per_request: int = 10
+    
+    # Batch parameter retrieval
+    ssm_batch_concurrency: int = 5
+    parameter_values_max_names: int = 500
+    
+    # Response compression (negotiated via Accept-Encoding)
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    compression_zstd_level: int = 3
+    
     # API Configuration
     debug: bool = os.getenv("DEBUG", "false").lower() == "true"
     
+    # Debug endpoints (/debug/profile, /debug/tasks): 404 unless enabled;
+    # when a token is set, requests must send it in X-Debug-Token
+    debug_endpoints_enabled: bool = False
+    debug_token: str = ""
+    debug_profile_max_seconds: float = 60.0
+    debug_profile_interval: float = 0.01
+    
+    # Tracing (OpenTelemetry; exporter is "otlp" or "file")
+    tracing_enabled: bool = False
+    tracing_exporter: str = "otlp"
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    tracing_file_path: str = "traces.jsonl"
+    tracing_sample_ratio: float = 1.0
+    
     # Logging
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    log_json: bool = True
+    log_queue_size: int = 10000
+    log_rate_limit_per_second: float = 50.0
+    log_rate_limit_burst: int = 200
     
     class Config:
         env_file = ".env"
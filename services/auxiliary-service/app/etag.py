@@ -0,0 +1,81 @@
+"""ETag helpers - Content validators for conditional GET."""
+
+import hashlib
+import json
+from typing import Dict, Iterable, Optional
+
+
+def compute_etag(*parts: Iterable) -> str:
+    """
+    Build a strong ETag from the fields that determine a response.
+
+    Hashing a handful of identifying fields (names, versions, dates) is much
+    cheaper than serializing the response body and hashing that.
+
+    Args:
+        *parts: Iterables of values that identify the response content
+
+    Returns:
+        Quoted ETag value
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        for value in part:
+            digest.update(str(value).encode())
+            digest.update(b"\x1f")
+        digest.update(b"\x1e")
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def bucket_list_etag(result: Dict, version: str) -> str:
+    """ETag over bucket names and creation dates (and details, when present)."""
+    return compute_etag(
+        [version],
+        (
+            f"{bucket['name']}@{bucket['creation_date']}"
+            + (json.dumps(bucket["details"], sort_keys=True) if "details" in bucket else "")
+            for bucket in result["buckets"]
+        )
+    )
+
+
+def parameter_list_etag(result: Dict, version: str) -> str:
+    """ETag over parameter names, types, versions and last-modified dates of one listing page."""
+    return compute_etag(
+        [version, result.get("path_prefix"), result.get("next_cursor")],
+        (
+            f"{param['name']}@{param['type']}@{param['version']}@{param['last_modified']}"
+            for param in result["parameters"]
+        )
+    )
+
+
+def parameter_value_etag(result: Dict, decrypt: bool, version: str) -> str:
+    """ETag for a single parameter value; SSM bumps the version whenever the value changes."""
+    return compute_etag(
+        [version, decrypt, result["name"], result["type"], result["version"], result["last_modified"]]
+    )
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against the current ETag.
+
+    Handles lists of validators, the "*" wildcard and weak validators
+    (weak comparison is what If-None-Match uses).
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current ETag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+
+    return etag.removeprefix("W/") in {candidate.removeprefix("W/") for candidate in candidates}
@@ -1,100 +1,224 @@
 """Auxiliary Service - Handles AWS interactions."""
 
+# First, so the startup report covers the imports below
+from app.startup import startup_timer
+
+import asyncio
+import hmac
 import logging
-import sys
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
-from prometheus_client import Counter, Histogram, generate_latest
+import orjson
+from botocore.exceptions import ClientError
+from fastapi import Depends, FastAPI, HTTPException, Header, Query, Request
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
+from prometheus_client import Counter
+from pydantic import BaseModel, Field
 from starlette.responses import Response
 
 from app import __version__
+from app.compression import CompressionMiddleware
 from app.config import get_settings
+from app.logging_config import configure_logging
+from app.etag import bucket_list_etag, etag_matches, parameter_list_etag, parameter_value_etag
+from app.metrics import render_metrics
+from app.middleware import MetricsMiddleware, VersionHeadersMiddleware
+from app.profiler import ProfileInProgress, dump_tasks, sampler
+from app.services.aws_executor import AWSExecutorSaturatedError, aws_executor
 from app.services.aws_service import aws_service
+from app.services.health import health_prober
+from app.services.parameter_index import ParameterIndexUnavailableError, ParameterPathNotFoundError
+from app.tracing import TracingMiddleware, configure_tracing
+
+settings = get_settings()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
+# Configure logging: records are queued and written as JSON by a background thread
+configure_logging(
+    level=settings.log_level,
+    json_logs=settings.log_json,
+    queue_size=settings.log_queue_size,
+    rate=settings.log_rate_limit_per_second,
+    burst=settings.log_rate_limit_burst
 )
 logger = logging.getLogger(__name__)
 
-settings = get_settings()
+if settings.tracing_enabled:
+    configure_tracing(
+        service_name="auxiliary-service",
+        service_version=settings.app_version,
+        exporter=settings.tracing_exporter,
+        otlp_endpoint=settings.tracing_otlp_endpoint,
+        file_path=settings.tracing_file_path,
+        sample_ratio=settings.tracing_sample_ratio
+    )
 
 # Prometheus metrics
-REQUEST_COUNT = Counter(
-    'auxiliary_service_requests_total',
-    'Total request count',
-    ['method', 'endpoint', 'status']
-)
-REQUEST_DURATION = Histogram(
-    'auxiliary_service_request_duration_seconds',
-    'Request duration in seconds',
-    ['method', 'endpoint']
-)
 AWS_API_CALLS = Counter(
     'auxiliary_service_aws_api_calls_total',
     'Total AWS API calls',
     ['service', 'operation', 'status']
 )
 
+# AWS error codes mapped to 404 and 503 (everything else is a 500)
+NOT_FOUND_ERROR_CODES = {'NoSuchBucket', 'NoSuchKey', 'ParameterNotFound'}
+THROTTLING_ERROR_CODES = {
+    'Throttling', 'ThrottlingException', 'ThrottledException', 'TooManyRequestsException',
+    'RequestLimitExceeded', 'SlowDown', 'TooManyUpdates'
+}
+
+
+# Background AWS client prewarm; readiness checks wait for it
+aws_prewarm: Optional[asyncio.Task] = None
+
+
+async def prewarm_aws() -> None:
+    """Build AWS clients off the event loop, then report startup timings."""
+    try:
+        with startup_timer.phase("aws_prewarm"):
+            await aws_executor.run('s3', aws_service.prewarm)
+    except Exception as e:
+        logger.warning("AWS client prewarm failed: %s", e)
+    startup_timer.report()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage application lifespan."""
+    global aws_prewarm
+    startup_timer.record("import", startup_timer.elapsed())
+    logger.info("Starting %s v%s", settings.app_name, settings.app_version)
+    logger.info("Environment: %s", settings.environment)
+    logger.info("AWS Region: %s", settings.aws_region)
+    
+    with startup_timer.phase("lifespan"):
+        # Startup: Prewarm AWS clients; liveness is served meanwhile and
+        # readiness waits for the clients
+        if settings.aws_prewarm_clients:
+            aws_prewarm = asyncio.create_task(prewarm_aws(), name="aws-prewarm")
+        
+        # Check dependencies in the background; probes only read the results
+        health_prober.start()
+        
+        if aws_service.parameter_cache is not None:
+            aws_service.parameter_cache.start(
+                lambda: aws_executor.run('ssm', aws_service.revalidate_parameter_cache),
+                settings.parameter_cache_revalidate_interval
+            )
+        
+        if aws_service.parameter_index is not None:
+            aws_service.parameter_index.start(
+                lambda: aws_executor.run('ssm', aws_service.refresh_parameter_index),
+                settings.parameter_index_refresh_interval
+            )
+    
+    if aws_prewarm is None:
+        startup_timer.report()
+    
+    yield
+    
+    # Shutdown: Stop background tasks and the AWS executor pools
+    logger.info("Shutting down %s", settings.app_name)
+    with startup_timer.phase("shutdown"):
+        await health_prober.stop()
+        if aws_service.parameter_cache is not None:
+            await aws_service.parameter_cache.stop()
+        if aws_service.parameter_index is not None:
+            await aws_service.parameter_index.stop()
+        aws_executor.shutdown()
+    logger.info("Shutdown complete in %.1f ms", startup_timer.phases["shutdown"] * 1000)
+
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Auxiliary Service for AWS SDK interactions",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
 
-@app.middleware("http")
-async def metrics_middleware(request: Request, call_next):
-    """Record metrics for each request."""
-    method = request.method
-    path = request.url.path
-    
-    with REQUEST_DURATION.labels(method=method, endpoint=path).time():
-        response = await call_next(request)
-    
-    REQUEST_COUNT.labels(
-        method=method,
-        endpoint=path,
-        status=response.status_code
-    ).inc()
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        levels={
+            "gzip": settings.compression_gzip_level,
+            "br": settings.compression_brotli_quality,
+            "zstd": settings.compression_zstd_level
+        }
+    )
+
+
+# Pure ASGI middleware: headers are set on the response start message and
+# bodies stream through untouched. Added last, so metrics and the request
+# span wrap everything.
+app.add_middleware(
+    VersionHeadersMiddleware,
+    headers=lambda: {"X-Auxiliary-Service-Version": settings.app_version}
+)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
+
+
+async def check_aws() -> None:
+    """
+    Dependency check: AWS answers a cheap S3 call.
     
-    return response
+    Raises:
+        Exception: If AWS is unreachable or rejects the call
+    """
+    if aws_prewarm is not None:
+        # Shielded: a timed-out check must not cancel the prewarm itself
+        await asyncio.shield(aws_prewarm)
+    AWS_API_CALLS.labels(service='s3', operation='health_check', status='attempt').inc()
+    try:
+        await aws_executor.run('s3', lambda: aws_service.s3_client.list_buckets())
+    except Exception:
+        AWS_API_CALLS.labels(service='s3', operation='health_check', status='error').inc()
+        raise
+    AWS_API_CALLS.labels(service='s3', operation='health_check', status='success').inc()
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Log startup information."""
-    logger.info(f"Starting {settings.app_name} v{settings.app_version}")
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"AWS Region: {settings.aws_region}")
+health_prober.register("aws", check_aws)
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Log shutdown information."""
-    logger.info(f"Shutting down {settings.app_name}")
+@app.get("/health/live", tags=["Health"])
+async def liveness():
+    """Liveness probe: the process is serving requests. Checks no dependencies."""
+    return {
+        "status": "alive",
+        "version": settings.app_version,
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    }
+
+
+@app.get("/health/ready", tags=["Health"])
+async def readiness():
+    """Readiness probe: cached results of the background dependency checks."""
+    await health_prober.ensure_checked()
+    ready = health_prober.is_ready
+    
+    return ORJSONResponse(
+        content={
+            "status": "ready" if ready else "not_ready",
+            "version": settings.app_version,
+            "checks": {name: result.to_dict() for name, result in health_prober.results.items()},
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        },
+        status_code=200 if ready else 503
+    )
 
 
 @app.get("/health", tags=["Health"])
 async def health_check():
-    """Health check endpoint."""
-    # Try to test AWS connectivity
-    aws_healthy = True
-    try:
-        # Simple test: try to list buckets (doesn't need to succeed, just needs to connect)
-        aws_service.s3_client.list_buckets()
-    except Exception as e:
-        logger.warning(f"AWS connectivity check failed: {e}")
-        aws_healthy = False
+    """Health check endpoint, served from the background dependency checks."""
+    await health_prober.ensure_checked()
+    aws_healthy = health_prober.is_ready
     
     health_status = {
         "status": "healthy" if aws_healthy else "degraded",
@@ -105,7 +229,7 @@ async def health_check():
     }
     
     status_code = 200 if aws_healthy else 503
-    return JSONResponse(content=health_status, status_code=status_code)
+    return ORJSONResponse(content=health_status, status_code=status_code)
 
 
 @app.get("/version", tags=["Info"])
@@ -121,76 +245,172 @@ async def get_version():
 
 @app.get("/metrics", tags=["Monitoring"])
 async def metrics():
-    """Prometheus metrics endpoint."""
+    """Prometheus metrics endpoint (aggregated across workers in multiprocess mode)."""
     return Response(
-        content=generate_latest(),
+        content=render_metrics(),
         media_type="text/plain"
     )
 
 
+def require_debug_endpoints(x_debug_token: Optional[str] = Header(None)) -> None:
+    """
+    Guard for /debug/* endpoints.
+    
+    Raises:
+        HTTPException: 404 if debug endpoints are disabled, 403 if the debug token does not match
+    """
+    if not settings.debug_endpoints_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if settings.debug_token and not hmac.compare_digest(x_debug_token or "", settings.debug_token):
+        raise HTTPException(status_code=403, detail="Invalid debug token")
+
+
+@app.get("/debug/profile", tags=["Debug"], dependencies=[Depends(require_debug_endpoints)])
+async def debug_profile(
+    seconds: float = Query(10.0, gt=0, le=settings.debug_profile_max_seconds, description="Sampling duration"),
+    format: str = Query("collapsed", pattern="^(collapsed|speedscope)$", description="collapsed or speedscope")
+):
+    """
+    Sample the stacks of all threads (event loop and worker threads) for a while.
+    
+    Returns:
+        Collapsed stacks as text (for flamegraph.pl or speedscope), or a speedscope JSON document
+    
+    Raises:
+        HTTPException: 409 if another profile is already running
+    """
+    try:
+        profile = await sampler.profile(seconds, settings.debug_profile_interval)
+    except ProfileInProgress as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
+    if format == "speedscope":
+        return ORJSONResponse(
+            content=profile.to_speedscope(f"auxiliary-service ({seconds:g}s)"),
+            headers={"Content-Disposition": 'attachment; filename="auxiliary-service.speedscope.json"'}
+        )
+    return PlainTextResponse(profile.to_collapsed())
+
+
+@app.get("/debug/tasks", tags=["Debug"], dependencies=[Depends(require_debug_endpoints)])
+async def debug_tasks(limit: Optional[int] = Query(None, ge=1, description="Innermost frames per task")):
+    """List pending asyncio tasks with the chain of coroutines each one is waiting in."""
+    tasks = dump_tasks(limit)
+    return {"count": len(tasks), "tasks": tasks}
+
+
+def _conditional_response(request: Request, etag: str, result: Dict) -> Response:
+    """
+    Build a response honouring If-None-Match.
+    
+    Returns 304 with no body (and no JSON serialization) when the client's
+    validator matches, otherwise the result with version information.
+    """
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    # Add version information
+    return ORJSONResponse(
+        content={
+            **result,
+            "auxiliary_service_version": settings.app_version
+        },
+        headers={"ETag": etag}
+    )
+
+
 @app.get("/aws/s3/buckets", tags=["AWS"])
-async def list_s3_buckets():
+async def list_s3_buckets(
+    request: Request,
+    details: bool = Query(False, description="Add region, tags, versioning and encryption per bucket")
+):
     """
     List all S3 buckets in the AWS account.
     
+    Supports conditional GET: if If-None-Match matches the ETag of the
+    current listing, 304 is returned without a body.
+    
+    Args:
+        details: Whether to look up per-bucket details (partial results on errors)
+    
     Returns:
         JSON response with list of S3 buckets and version information
         
     Raises:
         HTTPException: If AWS API call fails
     """
+    # Each stage is counted under its own operation label
+    operation = 'list_buckets'
     try:
-        AWS_API_CALLS.labels(service='s3', operation='list_buckets', status='attempt').inc()
-        result = aws_service.list_s3_buckets()
-        AWS_API_CALLS.labels(service='s3', operation='list_buckets', status='success').inc()
+        AWS_API_CALLS.labels(service='s3', operation=operation, status='attempt').inc()
+        result = await aws_executor.run('s3', aws_service.list_s3_buckets)
+        AWS_API_CALLS.labels(service='s3', operation=operation, status='success').inc()
         
-        # Add version information
-        return {
-            **result,
-            "auxiliary_service_version": settings.app_version
-        }
+        if details:
+            operation = 'bucket_details'
+            AWS_API_CALLS.labels(service='s3', operation=operation, status='attempt').inc()
+            result = {**result, "buckets": await aws_service.add_bucket_details(result["buckets"])}
+            AWS_API_CALLS.labels(service='s3', operation=operation, status='success').inc()
+        
+        etag = bucket_list_etag(result, settings.app_version)
+        return _conditional_response(request, etag, result)
+    
+    except AWSExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     
     except Exception as e:
-        AWS_API_CALLS.labels(service='s3', operation='list_buckets', status='error').inc()
-        logger.error(f"Error listing S3 buckets: {str(e)}")
+        AWS_API_CALLS.labels(service='s3', operation=operation, status='error').inc()
+        logger.error("Error listing S3 buckets (%s): %s", operation, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/aws/parameters", tags=["AWS"])
 async def list_parameters(
-    path_prefix: Optional[str] = Query(None, description="Filter parameters by path prefix")
+    request: Request,
+    path_prefix: Optional[str] = Query(None, description="Filter parameters by path prefix"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of parameters to return"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by a previous call")
 ):
     """
-    List all parameters from AWS Systems Manager Parameter Store.
+    List parameters from AWS Systems Manager Parameter Store.
+    
+    Without limit or cursor all parameters are returned. Otherwise one page
+    is returned, with next_cursor set while more parameters remain.
     
     Args:
         path_prefix: Optional filter to list parameters under a specific path
+        limit: Optional page size
+        cursor: Optional cursor to continue a previous listing
         
     Returns:
         JSON response with list of parameters
         
     Raises:
-        HTTPException: If AWS API call fails
+        HTTPException: If the cursor is invalid or AWS API call fails
     """
     try:
         AWS_API_CALLS.labels(service='ssm', operation='describe_parameters', status='attempt').inc()
-        result = aws_service.list_parameters(path_prefix)
+        result = await aws_executor.run('ssm', aws_service.list_parameters, path_prefix, limit=limit, cursor=cursor)
         AWS_API_CALLS.labels(service='ssm', operation='describe_parameters', status='success').inc()
         
-        # Add version information
-        return {
-            **result,
-            "auxiliary_service_version": settings.app_version
-        }
+        etag = parameter_list_etag(result, settings.app_version)
+        return _conditional_response(request, etag, result)
+    
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    except AWSExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     
     except Exception as e:
         AWS_API_CALLS.labels(service='ssm', operation='describe_parameters', status='error').inc()
-        logger.error(f"Error listing parameters: {str(e)}")
+        logger.error("Error listing parameters: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/aws/parameters/value", tags=["AWS"])
 async def get_parameter_value(
+    request: Request,
     name: str = Query(..., description="Name of the parameter to retrieve"),
     decrypt: bool = Query(True, description="Decrypt secure string parameters")
 ):
@@ -209,24 +429,264 @@ async def get_parameter_value(
     """
     try:
         AWS_API_CALLS.labels(service='ssm', operation='get_parameter', status='attempt').inc()
-        result = aws_service.get_parameter_value(name, decrypt)
+        result = await aws_executor.run('ssm', aws_service.get_parameter_value, name, decrypt)
         AWS_API_CALLS.labels(service='ssm', operation='get_parameter', status='success').inc()
         
+        etag = parameter_value_etag(result, decrypt, settings.app_version)
+        return _conditional_response(request, etag, result)
+    
+    except AWSExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    
+    except Exception as e:
+        AWS_API_CALLS.labels(service='ssm', operation='get_parameter', status='error').inc()
+        logger.error("Error getting parameter value: %s", e)
+        
+        # Return 404 if parameter not found
+        if "not found" in str(e).lower():
+            raise HTTPException(status_code=404, detail=str(e))
+        
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/aws/parameters/tree", tags=["AWS"])
+async def get_parameter_tree(
+    path: str = Query("/", description="Hierarchy path to expand"),
+    depth: int = Query(1, ge=1, le=10, description="Levels of children to include")
+):
+    """
+    Browse the parameter hierarchy from the in-memory parameter index.
+    
+    Returns the child path segments of path with per-subtree parameter
+    counts, without calling AWS.
+    
+    Args:
+        path: Hierarchy path ("/" for the root)
+        depth: Levels of children to include
+        
+    Returns:
+        JSON response with children and counts
+        
+    Raises:
+        HTTPException: 404 if nothing exists under path, 503 while the index is being built,
+            500 on any other error
+    """
+    try:
+        result = aws_service.get_parameter_tree(path, depth)
+    except ParameterPathNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ParameterIndexUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except Exception as e:
+        logger.error("Error browsing the parameter tree: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    # Add version information
+    return {
+        **result,
+        "auxiliary_service_version": settings.app_version
+    }
+
+
+class ParameterValuesRequest(BaseModel):
+    """Request body for batch parameter retrieval."""
+
+    names: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.parameter_values_max_names,
+        description="Names of the parameters to retrieve"
+    )
+    decrypt: bool = Field(True, description="Decrypt secure string parameters")
+
+
+@app.post("/aws/parameters/values", tags=["AWS"])
+async def get_parameter_values(body: ParameterValuesRequest):
+    """
+    Get the values of several parameters in one request.
+    
+    Args:
+        body: Parameter names and decryption flag
+        
+    Returns:
+        JSON response with found parameters and the names that don't exist
+        
+    Raises:
+        HTTPException: If AWS API call fails
+    """
+    try:
+        AWS_API_CALLS.labels(service='ssm', operation='get_parameters', status='attempt').inc()
+        result = await aws_service.get_parameter_values(body.names, body.decrypt)
+        AWS_API_CALLS.labels(service='ssm', operation='get_parameters', status='success').inc()
+        
         # Add version information
         return {
             **result,
             "auxiliary_service_version": settings.app_version
         }
     
+    except AWSExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    
     except Exception as e:
-        AWS_API_CALLS.labels(service='ssm', operation='get_parameter', status='error').inc()
-        logger.error(f"Error getting parameter value: {str(e)}")
+        AWS_API_CALLS.labels(service='ssm', operation='get_parameters', status='error').inc()
+        logger.error("Error getting parameter values: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/aws/parameters/by-path", tags=["AWS"])
+async def get_parameters_by_path(
+    path: str = Query(..., description="Hierarchy path, e.g. /app/prod/"),
+    recursive: bool = Query(True, description="Include parameters in nested paths"),
+    decrypt: bool = Query(True, description="Decrypt secure string parameters")
+):
+    """
+    Stream every parameter (with its value) under a path as NDJSON.
+    
+    One JSON object is written per line as GetParametersByPath pages arrive.
+    If AWS fails after streaming has started, a final {"error": ...} line is
+    written.
+    
+    Args:
+        path: Hierarchy path
+        recursive: Whether to include nested paths
+        decrypt: Whether to decrypt SecureString parameters
         
-        # Return 404 if parameter not found
-        if "not found" in str(e).lower():
-            raise HTTPException(status_code=404, detail=str(e))
+    Returns:
+        Streaming NDJSON response
         
+    Raises:
+        HTTPException: If the first AWS call fails
+    """
+    AWS_API_CALLS.labels(service='ssm', operation='get_parameters_by_path', status='attempt').inc()
+    pages = aws_executor.iterate(
+        'ssm',
+        aws_service.iter_parameters_by_path(path, recursive, decrypt),
+        prefetch=True
+    )
+    
+    try:
+        # Fetch the first page before committing to a 200 response
+        first_page = await anext(pages, [])
+    except AWSExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except Exception as e:
+        AWS_API_CALLS.labels(service='ssm', operation='get_parameters_by_path', status='error').inc()
+        logger.error("Error getting parameters by path: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(
+        _ndjson_pages(first_page, pages, 'ssm', 'get_parameters_by_path'),
+        media_type="application/x-ndjson"
+    )
+
+
+@app.get("/aws/s3/buckets/{bucket}/objects", tags=["AWS"])
+async def list_objects(
+    bucket: str,
+    prefix: Optional[str] = Query(None, description="Only list keys starting with this prefix"),
+    delimiter: Optional[str] = Query(None, description="Group keys up to this delimiter into prefixes"),
+    start_after: Optional[str] = Query(None, description="Start listing after this key"),
+    continuation_token: Optional[str] = Query(None, description="Resume a listing from a continuation_token line"),
+    page_size: int = Query(1000, ge=1, le=1000, description="Keys per AWS page")
+):
+    """
+    Stream the objects of a bucket as NDJSON.
+    
+    One line is written per object (and per common prefix) as
+    list_objects_v2 pages arrive; the next page is fetched while the
+    current one is being written. After every page except the last a
+    {"continuation_token": ...} line is written, which can be passed back
+    to resume the listing. If AWS fails mid-stream, a final {"error": ...}
+    line is written.
+    
+    Args:
+        bucket: Bucket name
+        prefix: Key prefix filter
+        delimiter: Delimiter for grouping keys into prefixes
+        start_after: Key to start after
+        continuation_token: Token to resume from
+        page_size: Keys per AWS page
+        
+    Returns:
+        Streaming NDJSON response
+        
+    Raises:
+        HTTPException: If the bucket doesn't exist or the first AWS call fails
+    """
+    AWS_API_CALLS.labels(service='s3', operation='list_objects_v2', status='attempt').inc()
+    pages = aws_executor.iterate(
+        's3',
+        aws_service.iter_objects(bucket, prefix, delimiter, start_after, continuation_token, page_size),
+        prefetch=True
+    )
+    
+    try:
+        # Fetch the first page before committing to a 200 response
+        first_page = await anext(pages, [])
+    except AWSExecutorSaturatedError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except ClientError as e:
+        AWS_API_CALLS.labels(service='s3', operation='list_objects_v2', status='error').inc()
+        status_code = client_error_status(e)
+        if status_code == 404:
+            raise HTTPException(status_code=404, detail=f"Bucket '{bucket}' not found")
+        if status_code == 503:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        AWS_API_CALLS.labels(service='s3', operation='list_objects_v2', status='error').inc()
+        logger.error("Error listing objects: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(
+        _ndjson_pages(first_page, pages, 's3', 'list_objects_v2'),
+        media_type="application/x-ndjson"
+    )
+
+
+def client_error_status(error: ClientError) -> int:
+    """
+    HTTP status for an AWS error, from its error code.
+    
+    Returns:
+        404 for missing resources, 503 for throttling, 500 otherwise
+    """
+    code = error.response.get('Error', {}).get('Code')
+    if code in NOT_FOUND_ERROR_CODES:
+        return 404
+    if code in THROTTLING_ERROR_CODES:
+        return 503
+    return 500
+
+
+async def _ndjson_pages(
+    first_page: List[Dict],
+    pages: AsyncIterator[List[Dict]],
+    service: str,
+    operation: str
+) -> AsyncIterator[bytes]:
+    """
+    Serialize pages of items as NDJSON, one chunk per page.
+    
+    Pages are fetched on the AWS executor pool, so the event loop never
+    blocks on AWS.
+    """
+    def encode(items: List[Dict]) -> bytes:
+        return b"".join(orjson.dumps(item) + b"\n" for item in items)
+    
+    yield encode(first_page)
+    
+    try:
+        async for page in pages:
+            yield encode(page)
+    except Exception as e:
+        AWS_API_CALLS.labels(service=service, operation=operation, status='error').inc()
+        logger.error("Error while streaming %s: %s", operation, e)
+        yield encode([{"error": str(e)}])
+        return
+    
+    AWS_API_CALLS.labels(service=service, operation=operation, status='success').inc()
 
 
 @app.get("/", tags=["Info"])
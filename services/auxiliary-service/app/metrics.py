@@ -0,0 +1,174 @@
+"""Request and AWS call metrics - Prometheus metrics with bounded label cardinality, aggregated across workers."""
+
+import glob
+import os
+import time
+from typing import Any, Dict, List, MutableMapping, Optional
+
+from botocore import xform_name
+from prometheus_client import CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+
+from app import server_timing
+
+# Label for requests that matched no route (404 scans, typos)
+UNMATCHED_ROUTE = "unmatched"
+
+# Response sizes in bytes, 256 B to 16 MiB
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# AWS call latency in seconds; includes botocore's own retries
+AWS_DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Prometheus metrics
+REQUEST_COUNT = Counter(
+    'auxiliary_service_requests_total',
+    'Total request count',
+    ['method', 'endpoint', 'status']
+)
+REQUEST_DURATION = Histogram(
+    'auxiliary_service_request_duration_seconds',
+    'Request duration in seconds',
+    ['method', 'endpoint']
+)
+RESPONSE_SIZE = Histogram(
+    'auxiliary_service_response_size_bytes',
+    'Response body size in bytes as sent on the wire',
+    ['method', 'endpoint'],
+    buckets=SIZE_BUCKETS
+)
+AWS_CALL_DURATION = Histogram(
+    'auxiliary_service_aws_call_duration_seconds',
+    'Duration of individual AWS SDK calls',
+    ['service', 'operation', 'status'],
+    buckets=AWS_DURATION_BUCKETS
+)
+
+# Keys stored in the botocore request context between events
+_START = "metrics_start"
+_MODEL = "metrics_model"
+
+
+def multiprocess_dir() -> Optional[str]:
+    """
+    Shared metrics directory, set when several worker processes serve the app.
+
+    prometheus_client reads PROMETHEUS_MULTIPROC_DIR at import time and then
+    keeps every metric value in per-process files there instead of memory.
+    """
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or None
+
+
+def render_metrics() -> bytes:
+    """
+    Render metrics in the Prometheus text format.
+
+    In multiprocess mode the values of every worker are read from the shared
+    directory and aggregated: counters and histograms are summed (including
+    those of exited workers, so totals stay monotonic), gauges are combined
+    according to their multiprocess_mode.
+
+    Returns:
+        Exposition text for the /metrics endpoint
+    """
+    path = multiprocess_dir()
+    if path is None:
+        return generate_latest()
+
+    mark_dead_workers(path)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=path)
+    return generate_latest(registry)
+
+
+def mark_dead_workers(path: str) -> List[int]:
+    """
+    Remove the live-gauge files of worker processes that no longer exist.
+
+    Args:
+        path: Shared metrics directory
+
+    Returns:
+        PIDs of the workers found dead
+    """
+    dead = set()
+    for file in glob.glob(os.path.join(path, "gauge_live*_*.db")):
+        pid = int(os.path.basename(file)[:-len(".db")].rsplit("_", 1)[1])
+        if not _is_alive(pid):
+            dead.add(pid)
+
+    for pid in sorted(dead):
+        multiprocess.mark_process_dead(pid, path)
+    return sorted(dead)
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def route_template(scope: MutableMapping) -> str:
+    """
+    Path template of the route that handled a request, e.g. "/aws/s3/buckets/{bucket}/objects".
+
+    Using the template instead of the raw path keeps label cardinality
+    bounded by the number of routes, whatever clients send.
+
+    Args:
+        scope: ASGI scope after routing
+
+    Returns:
+        Route template, or UNMATCHED_ROUTE if no route matched
+    """
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or UNMATCHED_ROUTE
+
+
+def instrument_client(client: Any) -> None:
+    """
+    Time every API call a boto3 client makes, using botocore's event hooks.
+
+    Each call is recorded once, including botocore's internal retries, with
+    status "success", "error" (AWS returned an error response) or
+    "exception" (the call failed before a response, e.g. a connection error),
+    and as the "aws" Server-Timing phase of the request that made it.
+    Paginators and waiters go through the same hooks.
+
+    Args:
+        client: boto3 client
+    """
+    events = client.meta.events
+    events.register("before-call", _before_call)
+    events.register("after-call", _after_call)
+    events.register("after-call-error", _after_call_error)
+
+
+def _before_call(model: Any, context: Dict, **kwargs: Any) -> None:
+    context[_START] = time.perf_counter()
+    context[_MODEL] = model
+
+
+def _after_call(http_response: Any, context: Dict, **kwargs: Any) -> None:
+    _observe(context, "success" if http_response.status_code < 300 else "error")
+
+
+def _after_call_error(context: Dict, **kwargs: Any) -> None:
+    _observe(context, "exception")
+
+
+def _observe(context: Dict, status: str) -> None:
+    start = context.pop(_START, None)
+    model = context.pop(_MODEL, None)
+    if start is None or model is None:
+        return
+    duration = time.perf_counter() - start
+    AWS_CALL_DURATION.labels(
+        service=model.service_model.service_name,
+        operation=xform_name(model.name),
+        status=status
+    ).observe(duration)
+    server_timing.record("aws", duration)
@@ -0,0 +1,196 @@
+"""Profiler - On-demand statistical sampling of all threads and asyncio task dumps."""
+
+import asyncio
+import inspect
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+# (function, file, first line) of one frame; stacks are root first
+Frame = Tuple[str, str, int]
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class ProfileInProgress(Exception):
+    """Raised when a profile is requested while another one is running."""
+
+
+class Profile:
+    """Stack samples of every thread, counted per distinct (thread, stack)."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.duration = 0.0
+
+    def to_collapsed(self) -> str:
+        """Collapsed stacks ("thread;root;...;leaf count" per line), as read by flamegraph.pl and speedscope."""
+        lines = []
+        for (thread, frames), count in self.samples.most_common():
+            names = [thread] + [_frame_label(frame) for frame in frames]
+            lines.append(f"{';'.join(names)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self, name: str) -> Dict:
+        """Speedscope JSON document with one sampled profile per thread."""
+        frame_index: Dict[Frame, int] = {}
+        profiles: Dict[str, Dict] = {}
+
+        for (thread, frames), count in self.samples.items():
+            profile = profiles.setdefault(thread, {
+                "type": "sampled",
+                "name": thread,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": 0,
+                "samples": [],
+                "weights": [],
+            })
+            profile["samples"].append([frame_index.setdefault(frame, len(frame_index)) for frame in frames])
+            profile["weights"].append(count * self.interval)
+            profile["endValue"] += count * self.interval
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "aws-challenge profiler",
+            "shared": {
+                "frames": [{"name": func, "file": file, "line": line} for func, file, line in frame_index]
+            },
+            "profiles": list(profiles.values()),
+        }
+
+
+class Sampler:
+    """
+    Statistical profiler over all threads of the process.
+
+    A background thread snapshots every thread's stack (sys._current_frames)
+    at a fixed interval, so the event loop and AWS/worker threads are all
+    covered without tracing hooks. Only one profile runs at a time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def sample(self, seconds: float, interval: float) -> Profile:
+        """
+        Sample stacks for `seconds`, blocking the calling thread.
+
+        Args:
+            seconds: Profile duration
+            interval: Seconds between snapshots
+
+        Returns:
+            Collected profile
+
+        Raises:
+            ProfileInProgress: If another profile is running
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ProfileInProgress("A profile is already running")
+        try:
+            profile = Profile(interval)
+            own_thread = threading.get_ident()
+            start = time.perf_counter()
+            deadline = start + seconds
+
+            while time.perf_counter() < deadline:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for ident, frame in sys._current_frames().items():
+                    if ident != own_thread:
+                        profile.samples[(names.get(ident, f"thread-{ident}"), _walk(frame))] += 1
+                time.sleep(interval)
+
+            profile.duration = time.perf_counter() - start
+            return profile
+        finally:
+            self._lock.release()
+
+    async def profile(self, seconds: float, interval: float) -> Profile:
+        """Sample stacks on a dedicated thread without blocking the event loop."""
+        return await asyncio.to_thread(self.sample, seconds, interval)
+
+
+def dump_tasks(limit: Optional[int] = None) -> List[Dict]:
+    """
+    Describe the pending asyncio tasks of the running loop.
+
+    Args:
+        limit: Maximum number of frames per task stack (innermost kept)
+
+    Returns:
+        Name, coroutine, state and await chain (outermost first) of each task
+    """
+    current = asyncio.current_task()
+    # The current task is running, so its stack ends at our caller
+    caller = inspect.currentframe().f_back
+    tasks = []
+    for task in asyncio.all_tasks():
+        coro = task.get_coro()
+        frames = _running_chain(coro, caller) if task is current else _await_chain(coro)
+        if limit:
+            frames = frames[-limit:]
+        tasks.append({
+            "name": task.get_name(),
+            "coroutine": getattr(coro, "__qualname__", repr(coro)),
+            "current": task is current,
+            "cancelling": task.cancelling() > 0,
+            "stack": [
+                f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+                for frame in frames
+            ],
+        })
+    return sorted(tasks, key=lambda task: task["name"])
+
+
+def _walk(frame) -> Tuple[Frame, ...]:
+    """Frames from the outermost call down to `frame`."""
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append((code.co_name, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    frames.reverse()
+    return tuple(frames)
+
+
+def _await_chain(coro) -> List:
+    """
+    Frames of a coroutine and everything it is awaiting, outermost first.
+
+    Task.get_stack only returns the outermost frame of a suspended coroutine;
+    following cr_await shows where the task is actually waiting.
+    """
+    frames = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None) or getattr(coro, "ag_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None) or getattr(coro, "ag_await", None)
+    return frames
+
+
+def _running_chain(coro, frame) -> List:
+    """Frames from a running coroutine down to `frame` (called within it), outermost first."""
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        if frame is coro.cr_frame:
+            break
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
+def _frame_label(frame: Frame) -> str:
+    func, file, line = frame
+    return f"{func} ({file}:{line})"
+
+
+# Global sampler instance
+sampler = Sampler()
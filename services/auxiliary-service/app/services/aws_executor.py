@@ -0,0 +1,197 @@
+"""AWS executor - Bounded worker pools that keep blocking boto3 calls off the event loop."""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app import server_timing
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+# Prometheus metrics
+EXECUTOR_QUEUE_DEPTH = Gauge(
+    'auxiliary_service_aws_executor_queue_depth',
+    'AWS calls waiting for a worker thread',
+    ['service'],
+    multiprocess_mode='livesum'
+)
+EXECUTOR_ACTIVE_CALLS = Gauge(
+    'auxiliary_service_aws_executor_active_calls',
+    'AWS calls currently running on a worker thread',
+    ['service'],
+    multiprocess_mode='livesum'
+)
+EXECUTOR_WAIT_SECONDS = Histogram(
+    'auxiliary_service_aws_executor_wait_seconds',
+    'Time AWS calls spent queued before a worker thread picked them up',
+    ['service'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+EXECUTOR_REJECTED = Counter(
+    'auxiliary_service_aws_executor_rejected_total',
+    'AWS calls rejected because the queue for their service was full',
+    ['service']
+)
+
+
+class AWSExecutorSaturatedError(Exception):
+    """Raised when too many calls are already queued for an AWS service."""
+
+    def __init__(self, service: str):
+        super().__init__(f"Too many pending {service} calls, try again later")
+        self.service = service
+
+
+class AWSExecutor:
+    """
+    One bounded thread pool per AWS service.
+
+    Separate pools keep a slow service (e.g. S3) from starving calls to
+    another (e.g. SSM). Each pool runs at most max_workers calls at once and
+    accepts at most max_queue waiting calls; beyond that calls are rejected
+    instead of piling up. Calls run in a copy of the caller's context, so
+    context variables (request IDs, trace spans) follow them into the thread.
+    """
+
+    def __init__(self, max_workers: Dict[str, int], max_queue: int = 200):
+        """
+        Create the pools.
+
+        Args:
+            max_workers: Worker threads per service name
+            max_queue: Calls allowed to wait per service before rejecting
+        """
+        self.max_workers = dict(max_workers)
+        self.max_queue = max_queue
+        self._pools = {
+            service: ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"aws-{service}")
+            for service, workers in self.max_workers.items()
+        }
+        self._queued = {service: 0 for service in self.max_workers}
+        self._lock = threading.Lock()
+
+    def queued(self, service: str) -> int:
+        """Number of calls waiting for a worker of this service."""
+        return self._queued[service]
+
+    def submit(self, service: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """
+        Queue a call on the pool of an AWS service.
+
+        Args:
+            service: AWS service name ("s3", "ssm")
+            fn: Blocking callable
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future of the call result
+
+        Raises:
+            AWSExecutorSaturatedError: If the queue for the service is full
+        """
+        pool = self._pools[service]
+
+        with self._lock:
+            if self._queued[service] >= self.max_queue:
+                EXECUTOR_REJECTED.labels(service=service).inc()
+                raise AWSExecutorSaturatedError(service)
+            self._queued[service] += 1
+        EXECUTOR_QUEUE_DEPTH.labels(service=service).inc()
+
+        queued_at = time.perf_counter()
+        context = contextvars.copy_context()
+        dequeued = [False]
+
+        def dequeue() -> bool:
+            with self._lock:
+                if dequeued[0]:
+                    return False
+                dequeued[0] = True
+                self._queued[service] -= 1
+            EXECUTOR_QUEUE_DEPTH.labels(service=service).dec()
+            return True
+
+        def call() -> T:
+            dequeue()
+            waited = time.perf_counter() - queued_at
+            EXECUTOR_WAIT_SECONDS.labels(service=service).observe(waited)
+            context.run(server_timing.record, "queue", waited)
+            EXECUTOR_ACTIVE_CALLS.labels(service=service).inc()
+            try:
+                return context.run(fn, *args, **kwargs)
+            finally:
+                EXECUTOR_ACTIVE_CALLS.labels(service=service).dec()
+
+        future = pool.submit(call)
+        # Calls cancelled before they started never run dequeue() themselves
+        future.add_done_callback(lambda _: dequeue())
+        return future
+
+    async def run(self, service: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking call on the pool of an AWS service and await its result.
+
+        Raises:
+            AWSExecutorSaturatedError: If the queue for the service is full
+            Exception: Whatever fn raised
+        """
+        return await asyncio.wrap_future(self.submit(service, fn, *args, **kwargs))
+
+    async def iterate(self, service: str, iterator: Iterator[T], prefetch: bool = False) -> AsyncIterator[T]:
+        """
+        Consume a blocking iterator (e.g. a boto3 paginator) item by item on the pool.
+
+        Args:
+            service: AWS service name
+            iterator: Iterator whose next() performs AWS calls
+            prefetch: Start fetching the next item before yielding the current one,
+                so AWS latency overlaps with the consumer's work
+
+        Yields:
+            Items of the iterator
+        """
+        sentinel = object()
+        pending = self.submit(service, next, iterator, sentinel)
+        try:
+            while True:
+                item = await asyncio.wrap_future(pending)
+                if item is sentinel:
+                    return
+                if prefetch:
+                    pending = self.submit(service, next, iterator, sentinel)
+                    yield item
+                else:
+                    yield item
+                    pending = self.submit(service, next, iterator, sentinel)
+        finally:
+            # A next() already running on a worker cannot be interrupted; wait for
+            # it, then close the iterator (e.g. a paginator generator) on the pool
+            # too, so it is never closed while executing on another thread
+            if not pending.cancel():
+                await asyncio.gather(asyncio.wrap_future(pending), return_exceptions=True)
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await asyncio.get_running_loop().run_in_executor(self._pools[service], close)
+
+    def shutdown(self) -> None:
+        """Stop all pools, dropping calls that have not started yet."""
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Singleton instance
+aws_executor = AWSExecutor(
+    {"s3": settings.aws_s3_max_workers, "ssm": settings.aws_ssm_max_workers},
+    max_queue=settings.aws_executor_max_queue
+)
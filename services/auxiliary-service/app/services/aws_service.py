@@ -1,31 +1,180 @@
 """AWS Service - Handles all interactions with AWS SDK (boto3)."""
 
+import asyncio
+import base64
+import json
 import logging
+import threading
+import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError
 
 from app.config import get_settings
+from app import tracing
+from app.metrics import instrument_client
+from app.services.aws_executor import AWSExecutorSaturatedError, aws_executor
+from app.services.parameter_cache import ParameterCache
+from app.services.parameter_index import ParameterIndex, ParameterIndexUnavailableError, ParameterPathNotFoundError
+from app.services.ttl_cache import TTLCache
+from app.startup import startup_timer
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Largest page describe_parameters accepts
+SSM_MAX_RESULTS = 50
+
+# Most names a single GetParameters call accepts
+SSM_GET_PARAMETERS_BATCH_SIZE = 10
+
+# Most keys a single list_objects_v2 call returns
+S3_MAX_KEYS = 1000
+
+# Most values a describe_parameters Name filter accepts
+SSM_DESCRIBE_FILTER_VALUES = 50
+
+# Error codes that mean "not configured" rather than a failed lookup
+S3_NO_TAGS = 'NoSuchTagSet'
+S3_NO_ENCRYPTION = 'ServerSideEncryptionConfigurationNotFoundError'
+
+# Fields added to each bucket by add_bucket_details
+BUCKET_DETAIL_FIELDS = ('region', 'tags', 'versioning', 'encryption')
+
+
+def encode_cursor(next_token: str, path_prefix: Optional[str]) -> str:
+    """
+    Wrap an SSM NextToken into an opaque, URL-safe cursor.
+    
+    The path prefix is embedded so a cursor can't be replayed against a
+    different listing.
+    """
+    payload = json.dumps({"token": next_token, "prefix": path_prefix or ""})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, path_prefix: Optional[str]) -> str:
+    """
+    Extract the SSM NextToken from a cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another path_prefix
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        next_token = payload["token"]
+        cursor_prefix = payload["prefix"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+    
+    if cursor_prefix != (path_prefix or ""):
+        raise ValueError("Cursor does not match path_prefix")
+    
+    return next_token
+
 
 class AWSService:
-    """Service class for AWS interactions."""
+    """
+    Service class for AWS interactions.
+    
+    boto3 clients are built on first use (or by prewarm), not at import:
+    building one loads botocore's service models and resolves credentials,
+    which may call IMDS/STS. Both clients come from one session, so they
+    share its model loader cache and credential provider.
+    """
     
     def __init__(self):
-        """Initialize AWS clients."""
+        """Initialize caches; AWS clients are created lazily."""
         self.region = settings.aws_region
         
-        # Initialize boto3 clients
-        # When running with IRSA, boto3 automatically uses the service account credentials
-        self.s3_client = boto3.client('s3', region_name=self.region)
-        self.ssm_client = boto3.client('ssm', region_name=self.region)
+        self._session: Optional[boto3.session.Session] = None
+        self._clients: Dict[str, object] = {}
+        self._clients_lock = threading.Lock()
         
-        logger.info(f"AWS Service initialized for region: {self.region}")
+        # Per-bucket region/tags/versioning/encryption
+        self.bucket_details_cache: TTLCache[Dict] = TTLCache(
+            'bucket_details',
+            max_entries=settings.s3_details_cache_max_entries,
+            ttl=settings.s3_details_cache_ttl
+        )
+        
+        # Parameter values, revalidated against describe_parameters metadata
+        self.parameter_cache: Optional[ParameterCache] = None
+        if settings.parameter_cache_enabled:
+            self.parameter_cache = ParameterCache(
+                max_entries=settings.parameter_cache_max_entries,
+                ttl=settings.parameter_cache_ttl,
+                secure_ttl=settings.parameter_cache_secure_ttl,
+                negative_ttl=settings.parameter_cache_negative_ttl
+            )
+        
+        # Path trie over parameter metadata, refreshed by full sweeps
+        self.parameter_index: Optional[ParameterIndex] = None
+        if settings.parameter_index_enabled:
+            self.parameter_index = ParameterIndex(max_age=settings.parameter_index_max_age)
+        
+        logger.info("AWS Service initialized for region: %s", self.region)
+    
+    @property
+    def s3_client(self):
+        """S3 client, created on first use."""
+        return self._client('s3', settings.aws_s3_max_workers)
+    
+    @property
+    def ssm_client(self):
+        """SSM client, created on first use."""
+        return self._client('ssm', settings.aws_ssm_max_workers)
+    
+    def _client(self, service: str, max_workers: int):
+        """
+        Get or create the client for a service.
+        
+        Creation is serialized, since boto3 sessions are not thread-safe and
+        first use may come from several executor threads at once.
+        
+        Args:
+            service: AWS service name
+            max_workers: Executor workers of the service (one HTTP connection each)
+        """
+        client = self._clients.get(service)
+        if client is not None:
+            return client
+        
+        with self._clients_lock:
+            client = self._clients.get(service)
+            if client is None:
+                start = time.perf_counter()
+                if self._session is None:
+                    # When running with IRSA, boto3 automatically uses the service account credentials
+                    self._session = boto3.session.Session(region_name=self.region)
+                client = self._session.client(
+                    service,
+                    region_name=self.region,
+                    config=Config(max_pool_connections=max_workers)
+                )
+                instrument_client(client)
+                tracing.instrument_client(client)
+                self._clients[service] = client
+                startup_timer.record(f"{service}_client", time.perf_counter() - start)
+        return client
+    
+    def prewarm(self) -> None:
+        """
+        Create the clients and resolve credentials ahead of the first request.
+        
+        Raises:
+            Exception: If credentials cannot be resolved
+        """
+        self.s3_client
+        self.ssm_client
+        with startup_timer.phase("aws_credentials"):
+            credentials = self._session.get_credentials()
+            if credentials is not None:
+                credentials.get_frozen_credentials()
     
     def list_s3_buckets(self) -> Dict:
         """
@@ -38,7 +187,7 @@ class AWSService:
             Exception: If AWS API call fails
         """
         try:
-            logger.info("Fetching S3 buckets from AWS")
+            logger.debug("Fetching S3 buckets from AWS")
             response = self.s3_client.list_buckets()
             
             buckets = [
@@ -49,7 +198,7 @@ class AWSService:
                 for bucket in response.get('Buckets', [])
             ]
             
-            logger.info(f"Successfully retrieved {len(buckets)} S3 buckets")
+            logger.info("Successfully retrieved %s S3 buckets", len(buckets))
             
             return {
                 "buckets": buckets,
@@ -59,35 +208,226 @@ class AWSService:
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
-            logger.error(f"AWS ClientError listing S3 buckets: {error_code} - {error_message}")
+            logger.error("AWS ClientError listing S3 buckets: %s - %s", error_code, error_message)
             raise Exception(f"AWS Error: {error_code} - {error_message}")
         
         except BotoCoreError as e:
-            logger.error(f"BotoCoreError listing S3 buckets: {str(e)}")
+            logger.error("BotoCoreError listing S3 buckets: %s", e)
             raise Exception(f"AWS connection error: {str(e)}")
         
         except Exception as e:
-            logger.error(f"Unexpected error listing S3 buckets: {str(e)}")
+            logger.error("Unexpected error listing S3 buckets: %s", e)
             raise Exception(f"Unexpected error: {str(e)}")
     
-    def list_parameters(self, path_prefix: Optional[str] = None) -> Dict:
+    async def add_bucket_details(self, buckets: List[Dict]) -> List[Dict]:
+        """
+        Add region, tags, versioning and encryption status to buckets.
+        
+        The four lookups of every uncached bucket are fanned out on the S3
+        executor pool, at most s3_details_concurrency at a time. A failing
+        lookup only affects its own field: it is reported under the bucket's
+        "errors" and the rest of the listing is returned. Buckets whose
+        lookups all succeeded are cached for s3_details_cache_ttl seconds.
+        
+        Args:
+            buckets: Buckets as returned by list_s3_buckets
+            
+        Returns:
+            Buckets with a "details" object each
+            
+        Raises:
+            AWSExecutorSaturatedError: If the S3 executor queue is full
+        """
+        semaphore = asyncio.Semaphore(settings.s3_details_concurrency)
+        
+        async def lookup(bucket: str, field: str) -> Tuple[str, object, Optional[str]]:
+            async with semaphore:
+                try:
+                    return field, await aws_executor.run('s3', self._get_bucket_field, bucket, field), None
+                except AWSExecutorSaturatedError:
+                    raise
+                except ClientError as e:
+                    return field, None, f"{e.response['Error']['Code']}: {e.response['Error']['Message']}"
+                except Exception as e:
+                    return field, None, str(e)
+        
+        async def details(bucket: str) -> Dict:
+            cached = self.bucket_details_cache.get(bucket)
+            if cached is not None:
+                return cached
+            
+            results = await asyncio.gather(*(lookup(bucket, field) for field in BUCKET_DETAIL_FIELDS))
+            result = {field: value for field, value, _ in results}
+            errors = {field: error for field, _, error in results if error}
+            result["errors"] = errors
+            if not errors:
+                self.bucket_details_cache.set(bucket, result)
+            return result
+        
+        logger.debug("Fetching details for %s S3 buckets", len(buckets))
+        all_details = await asyncio.gather(*(details(bucket["name"]) for bucket in buckets))
+        
+        return [{**bucket, "details": bucket_details} for bucket, bucket_details in zip(buckets, all_details)]
+    
+    def _get_bucket_field(self, bucket: str, field: str) -> object:
+        """Fetch one detail field of a bucket with a single S3 call."""
+        if field == 'region':
+            # Buckets in us-east-1 report no LocationConstraint
+            response = self.s3_client.get_bucket_location(Bucket=bucket)
+            return response.get('LocationConstraint') or 'us-east-1'
+        
+        if field == 'tags':
+            try:
+                response = self.s3_client.get_bucket_tagging(Bucket=bucket)
+            except ClientError as e:
+                if e.response['Error']['Code'] == S3_NO_TAGS:
+                    return {}
+                raise
+            return {tag['Key']: tag['Value'] for tag in response.get('TagSet', [])}
+        
+        if field == 'versioning':
+            response = self.s3_client.get_bucket_versioning(Bucket=bucket)
+            return response.get('Status', 'Disabled')
+        
+        if field == 'encryption':
+            try:
+                response = self.s3_client.get_bucket_encryption(Bucket=bucket)
+            except ClientError as e:
+                if e.response['Error']['Code'] == S3_NO_ENCRYPTION:
+                    return None
+                raise
+            rules = response.get('ServerSideEncryptionConfiguration', {}).get('Rules', [])
+            default = rules[0].get('ApplyServerSideEncryptionByDefault', {}) if rules else {}
+            return {
+                "algorithm": default.get('SSEAlgorithm'),
+                "kms_key_id": default.get('KMSMasterKeyID')
+            }
+        
+        raise ValueError(f"Unknown bucket detail field: {field}")
+    
+    def iter_objects(
+        self,
+        bucket: str,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        start_after: Optional[str] = None,
+        continuation_token: Optional[str] = None,
+        page_size: int = S3_MAX_KEYS
+    ) -> Iterator[List[Dict]]:
         """
-        List all parameters from AWS Systems Manager Parameter Store.
+        Iterate over the objects of a bucket, one list_objects_v2 page at a time.
+        
+        Each page is a list of lines: one per object, one per common prefix
+        ({"prefix": ...}, when a delimiter is given) and, if more pages
+        follow, a final {"continuation_token": ...} that resumes the listing
+        right after this page.
+        
+        Args:
+            bucket: Bucket name
+            prefix: Only list keys starting with this prefix
+            delimiter: Group keys sharing a prefix up to this delimiter
+            start_after: Start listing after this key
+            continuation_token: Token from a previous listing to resume from
+            page_size: Keys per AWS page (at most 1000)
+            
+        Yields:
+            Lists of lines, one per AWS page
+            
+        Raises:
+            ClientError: If AWS rejects the call (e.g. NoSuchBucket)
+            Exception: If AWS cannot be reached
+        """
+        request_params = {'Bucket': bucket, 'MaxKeys': page_size}
+        if prefix:
+            request_params['Prefix'] = prefix
+        if delimiter:
+            request_params['Delimiter'] = delimiter
+        if start_after:
+            request_params['StartAfter'] = start_after
+        
+        try:
+            logger.debug("Listing objects in s3://%s/%s", bucket, prefix or '')
+            count = 0
+            
+            while True:
+                if continuation_token:
+                    request_params['ContinuationToken'] = continuation_token
+                
+                response = self.s3_client.list_objects_v2(**request_params)
+                continuation_token = response.get('NextContinuationToken') if response.get('IsTruncated') else None
+                
+                lines = [
+                    {
+                        "key": obj['Key'],
+                        "size": obj['Size'],
+                        "last_modified": obj['LastModified'].isoformat(),
+                        "etag": obj.get('ETag', '').strip('"'),
+                        "storage_class": obj.get('StorageClass', 'STANDARD')
+                    }
+                    for obj in response.get('Contents', [])
+                ]
+                lines.extend({"prefix": common['Prefix']} for common in response.get('CommonPrefixes', []))
+                count += len(lines)
+                
+                if continuation_token:
+                    lines.append({"continuation_token": continuation_token})
+                yield lines
+                
+                if not continuation_token:
+                    break
+            
+            logger.info("Successfully listed %s objects and prefixes in %s", count, bucket)
+        
+        except ClientError as e:
+            # Propagated as is, so callers can map the AWS error code to a status
+            logger.warning(
+                "AWS ClientError listing objects in %s: %s - %s",
+                bucket, e.response['Error']['Code'], e.response['Error']['Message']
+            )
+            raise
+        
+        except BotoCoreError as e:
+            logger.error("BotoCoreError listing objects: %s", e)
+            raise Exception(f"AWS connection error: {str(e)}")
+    
+    def list_parameters(
+        self,
+        path_prefix: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """
+        List parameters from AWS Systems Manager Parameter Store.
+        
+        Without limit or cursor every parameter is returned, from the
+        parameter index when it is fresh and otherwise by walking all pages.
+        With either of them a single bounded page is returned along with a
+        cursor for the next one.
         
         Args:
             path_prefix: Optional filter to list parameters under a specific path
+            limit: Maximum number of parameters to return
+            cursor: Opaque cursor returned by a previous call
             
         Returns:
-            Dictionary with parameters list and count
+            Dictionary with parameters list, count and next_cursor
             
         Raises:
+            ValueError: If the cursor is invalid or belongs to another path_prefix
             Exception: If AWS API call fails
         """
+        if limit is None and cursor is None and self.parameter_index is not None and self.parameter_index.is_fresh:
+            parameters = self.parameter_index.list_prefix(path_prefix)
+            logger.info("Served %s parameters from the parameter index (prefix: %s)", len(parameters), path_prefix)
+            return {
+                "parameters": parameters,
+                "count": len(parameters),
+                "path_prefix": path_prefix,
+                "next_cursor": None
+            }
+        
         try:
-            logger.info(f"Fetching parameters from AWS Parameter Store (prefix: {path_prefix})")
-            
-            parameters = []
-            paginator = self.ssm_client.get_paginator('describe_parameters')
+            logger.debug("Fetching parameters from AWS Parameter Store (prefix: %s)", path_prefix)
             
             # Build request parameters
             request_params = {}
@@ -100,42 +440,103 @@ class AWSService:
                     }
                 ]
             
-            # Paginate through all parameters
-            for page in paginator.paginate(**request_params):
-                for param in page.get('Parameters', []):
-                    parameters.append({
-                        "name": param['Name'],
-                        "type": param['Type'],
-                        "last_modified": param['LastModifiedDate'].isoformat(),
-                        "version": param.get('Version', 1)
-                    })
+            if limit is None and cursor is None:
+                parameters = []
+                paginator = self.ssm_client.get_paginator('describe_parameters')
+                
+                # Paginate through all parameters
+                for page in paginator.paginate(**request_params):
+                    parameters.extend(self._format_parameter(param) for param in page.get('Parameters', []))
+                
+                next_cursor = None
+            else:
+                parameters, next_cursor = self._list_parameters_page(
+                    request_params,
+                    path_prefix,
+                    limit or settings.parameters_page_size,
+                    cursor
+                )
             
-            logger.info(f"Successfully retrieved {len(parameters)} parameters")
+            logger.info("Successfully retrieved %s parameters", len(parameters))
             
             return {
                 "parameters": parameters,
                 "count": len(parameters),
-                "path_prefix": path_prefix
+                "path_prefix": path_prefix,
+                "next_cursor": next_cursor
             }
         
+        except ValueError:
+            raise
+        
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
-            logger.error(f"AWS ClientError listing parameters: {error_code} - {error_message}")
+            logger.error("AWS ClientError listing parameters: %s - %s", error_code, error_message)
             raise Exception(f"AWS Error: {error_code} - {error_message}")
         
         except BotoCoreError as e:
-            logger.error(f"BotoCoreError listing parameters: {str(e)}")
+            logger.error("BotoCoreError listing parameters: %s", e)
             raise Exception(f"AWS connection error: {str(e)}")
         
         except Exception as e:
-            logger.error(f"Unexpected error listing parameters: {str(e)}")
+            logger.error("Unexpected error listing parameters: %s", e)
             raise Exception(f"Unexpected error: {str(e)}")
     
+    def _list_parameters_page(
+        self,
+        request_params: Dict,
+        path_prefix: Optional[str],
+        limit: int,
+        cursor: Optional[str]
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Fetch up to limit parameters starting at cursor.
+        
+        Maps onto describe_parameters MaxResults/NextToken, issuing at most
+        parameters_max_pages_per_request AWS calls.
+        
+        Returns:
+            Tuple of (parameters, next_cursor)
+        """
+        next_token = decode_cursor(cursor, path_prefix) if cursor else None
+        parameters = []
+        
+        for _ in range(settings.parameters_max_pages_per_request):
+            page_params = {
+                **request_params,
+                'MaxResults': min(SSM_MAX_RESULTS, limit - len(parameters))
+            }
+            if next_token:
+                page_params['NextToken'] = next_token
+            
+            response = self.ssm_client.describe_parameters(**page_params)
+            parameters.extend(self._format_parameter(param) for param in response.get('Parameters', []))
+            next_token = response.get('NextToken')
+            
+            if not next_token or len(parameters) >= limit:
+                break
+        
+        next_cursor = encode_cursor(next_token, path_prefix) if next_token else None
+        return parameters, next_cursor
+    
+    @staticmethod
+    def _format_parameter(param: Dict) -> Dict:
+        """Convert describe_parameters metadata to the API representation."""
+        return {
+            "name": param['Name'],
+            "type": param['Type'],
+            "last_modified": param['LastModifiedDate'].isoformat(),
+            "version": param.get('Version', 1)
+        }
+    
     def get_parameter_value(self, name: str, decrypt: bool = True) -> Dict:
         """
         Get the value of a specific parameter from AWS Systems Manager Parameter Store.
         
+        Served from the parameter cache when possible, including cached
+        "not found" results.
+        
         Args:
             name: Name of the parameter
             decrypt: Whether to decrypt SecureString parameters
@@ -146,26 +547,28 @@ class AWSService:
         Raises:
             Exception: If parameter not found or AWS API call fails
         """
+        if self.parameter_cache is not None:
+            cached = self.parameter_cache.get(name, decrypt)
+            if cached is not None:
+                if cached.value is None:
+                    raise Exception(f"Parameter '{name}' not found")
+                return dict(cached.value)
+        
         try:
-            logger.info(f"Fetching parameter value: {name} (decrypt: {decrypt})")
+            logger.debug("Fetching parameter value: %s (decrypt: %s)", name, decrypt)
             
             response = self.ssm_client.get_parameter(
                 Name=name,
                 WithDecryption=decrypt
             )
             
-            param = response['Parameter']
-            
-            result = {
-                "name": param['Name'],
-                "value": param['Value'],
-                "type": param['Type'],
-                "version": param.get('Version', 1),
-                "last_modified": param['LastModifiedDate'].isoformat(),
-                "arn": param.get('ARN', '')
-            }
+            result = self._format_parameter_value(response['Parameter'])
+            if self.parameter_cache is not None:
+                self.parameter_cache.put(name, decrypt, result)
+            if self.parameter_index is not None:
+                self.parameter_index.upsert(result)
             
-            logger.info(f"Successfully retrieved parameter: {name}")
+            logger.info("Successfully retrieved parameter: %s", name)
             
             return result
         
@@ -174,20 +577,244 @@ class AWSService:
             error_message = e.response['Error']['Message']
             
             if error_code == 'ParameterNotFound':
-                logger.warning(f"Parameter not found: {name}")
+                logger.warning("Parameter not found: %s", name)
+                if self.parameter_cache is not None:
+                    self.parameter_cache.put_missing(name, decrypt)
+                if self.parameter_index is not None:
+                    self.parameter_index.remove(name)
                 raise Exception(f"Parameter '{name}' not found")
             
-            logger.error(f"AWS ClientError getting parameter: {error_code} - {error_message}")
+            logger.error("AWS ClientError getting parameter: %s - %s", error_code, error_message)
             raise Exception(f"AWS Error: {error_code} - {error_message}")
         
         except BotoCoreError as e:
-            logger.error(f"BotoCoreError getting parameter: {str(e)}")
+            logger.error("BotoCoreError getting parameter: %s", e)
             raise Exception(f"AWS connection error: {str(e)}")
         
         except Exception as e:
-            logger.error(f"Unexpected error getting parameter: {str(e)}")
+            logger.error("Unexpected error getting parameter: %s", e)
             raise Exception(f"Unexpected error: {str(e)}")
 
+    
+    async def get_parameter_values(self, names: List[str], decrypt: bool = True) -> Dict:
+        """
+        Get the values of several parameters using batched GetParameters calls.
+        
+        Names are de-duplicated and split into chunks of 10 (the GetParameters
+        limit); up to ssm_batch_concurrency chunks are fetched at once on the
+        SSM executor pool.
+        
+        Args:
+            names: Names of the parameters
+            decrypt: Whether to decrypt SecureString parameters
+            
+        Returns:
+            Dictionary with found parameters, count and invalid_parameters
+            
+        Raises:
+            AWSExecutorSaturatedError: If the SSM executor queue is full
+            Exception: If AWS API call fails
+        """
+        try:
+            unique_names = list(dict.fromkeys(names))
+            chunks = [
+                unique_names[i:i + SSM_GET_PARAMETERS_BATCH_SIZE]
+                for i in range(0, len(unique_names), SSM_GET_PARAMETERS_BATCH_SIZE)
+            ]
+            logger.debug("Fetching %s parameter values in %s batches", len(unique_names), len(chunks))
+            
+            parameters = []
+            invalid_parameters = []
+            semaphore = asyncio.Semaphore(settings.ssm_batch_concurrency)
+            
+            async def fetch(chunk: List[str]) -> Tuple[List[Dict], List[str]]:
+                async with semaphore:
+                    return await aws_executor.run('ssm', self._get_parameters_chunk, chunk, decrypt)
+            
+            for found, invalid in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+                parameters.extend(found)
+                invalid_parameters.extend(invalid)
+            
+            logger.info(
+                "Successfully retrieved %s parameters (%s invalid)",
+                len(parameters),
+                len(invalid_parameters)
+            )
+            
+            return {
+                "parameters": parameters,
+                "count": len(parameters),
+                "invalid_parameters": invalid_parameters
+            }
+        
+        except AWSExecutorSaturatedError:
+            raise
+        
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            logger.error("AWS ClientError getting parameters: %s - %s", error_code, error_message)
+            raise Exception(f"AWS Error: {error_code} - {error_message}")
+        
+        except BotoCoreError as e:
+            logger.error("BotoCoreError getting parameters: %s", e)
+            raise Exception(f"AWS connection error: {str(e)}")
+        
+        except Exception as e:
+            logger.error("Unexpected error getting parameters: %s", e)
+            raise Exception(f"Unexpected error: {str(e)}")
+    
+    def iter_parameters_by_path(
+        self,
+        path: str,
+        recursive: bool = True,
+        decrypt: bool = True
+    ) -> Iterator[List[Dict]]:
+        """
+        Iterate over the parameters (with values) under a path, one page at a time.
+        
+        Pages are fetched lazily with GetParametersByPath, so only one page is
+        held in memory at a time.
+        
+        Args:
+            path: Hierarchy path, e.g. /app/prod/
+            recursive: Whether to include parameters in nested paths
+            decrypt: Whether to decrypt SecureString parameters
+            
+        Yields:
+            Lists of parameters, one per AWS page
+            
+        Raises:
+            Exception: If AWS API call fails
+        """
+        try:
+            logger.debug("Fetching parameters by path: %s (recursive: %s)", path, recursive)
+            
+            paginator = self.ssm_client.get_paginator('get_parameters_by_path')
+            count = 0
+            
+            for page in paginator.paginate(Path=path, Recursive=recursive, WithDecryption=decrypt):
+                parameters = [self._format_parameter_value(param) for param in page.get('Parameters', [])]
+                count += len(parameters)
+                yield parameters
+            
+            logger.info("Successfully retrieved %s parameters under %s", count, path)
+        
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            error_message = e.response['Error']['Message']
+            logger.error("AWS ClientError getting parameters by path: %s - %s", error_code, error_message)
+            raise Exception(f"AWS Error: {error_code} - {error_message}")
+        
+        except BotoCoreError as e:
+            logger.error("BotoCoreError getting parameters by path: %s", e)
+            raise Exception(f"AWS connection error: {str(e)}")
+    
+    def refresh_parameter_index(self) -> int:
+        """
+        Rebuild the parameter index from a full describe_parameters sweep.
+        
+        Only parameters that changed, appeared or disappeared since the last
+        sweep touch the index.
+        
+        Returns:
+            Number of parameters indexed
+        """
+        if self.parameter_index is None:
+            return 0
+        
+        paginator = self.ssm_client.get_paginator('describe_parameters')
+        self.parameter_index.sync(
+            self._format_parameter(param)
+            for page in paginator.paginate(MaxResults=SSM_MAX_RESULTS)
+            for param in page.get('Parameters', [])
+        )
+        return len(self.parameter_index)
+    
+    def get_parameter_tree(self, path: str, depth: int = 1) -> Dict:
+        """
+        Describe the hierarchy below a path from the parameter index.
+        
+        Args:
+            path: Hierarchy path ("/" for the root)
+            depth: Levels of children to include
+            
+        Returns:
+            Dictionary with the path, its subtree count and children
+            
+        Raises:
+            ParameterPathNotFoundError: If nothing exists under path
+            ParameterIndexUnavailableError: If the index is disabled or not built yet
+        """
+        if self.parameter_index is None or not self.parameter_index.is_built:
+            raise ParameterIndexUnavailableError("Parameter index is not available yet")
+        
+        tree = self.parameter_index.tree(path, depth)
+        if tree is None:
+            raise ParameterPathNotFoundError(f"Path '{path}' not found")
+        
+        return {
+            **tree,
+            "index_age_seconds": round(self.parameter_index.age, 1),
+            "stale": not self.parameter_index.is_fresh
+        }
+    
+    def revalidate_parameter_cache(self) -> int:
+        """
+        Check cached parameter values against current metadata.
+        
+        Reads Version/LastModifiedDate for the cached names with batched
+        describe_parameters calls (50 names each), which never returns or
+        decrypts values.
+        
+        Returns:
+            Number of names checked
+        """
+        if self.parameter_cache is None:
+            return 0
+        
+        names = self.parameter_cache.names()
+        for i in range(0, len(names), SSM_DESCRIBE_FILTER_VALUES):
+            batch = names[i:i + SSM_DESCRIBE_FILTER_VALUES]
+            metadata = {}
+            paginator = self.ssm_client.get_paginator('describe_parameters')
+            
+            for page in paginator.paginate(
+                ParameterFilters=[{'Key': 'Name', 'Option': 'Equals', 'Values': batch}]
+            ):
+                for param in page.get('Parameters', []):
+                    formatted = self._format_parameter(param)
+                    metadata[formatted['name']] = (formatted['version'], formatted['last_modified'])
+            
+            self.parameter_cache.revalidate(metadata, batch)
+        
+        logger.debug("Revalidated %s cached parameters", len(names))
+        return len(names)
+    
+    def _get_parameters_chunk(self, names: List[str], decrypt: bool) -> Tuple[List[Dict], List[str]]:
+        """
+        Fetch up to 10 parameters with a single GetParameters call.
+        
+        Returns:
+            Tuple of (found parameters, names that don't exist)
+        """
+        response = self.ssm_client.get_parameters(Names=names, WithDecryption=decrypt)
+        
+        found = [self._format_parameter_value(param) for param in response.get('Parameters', [])]
+        return found, response.get('InvalidParameters', [])
+    
+    @staticmethod
+    def _format_parameter_value(param: Dict) -> Dict:
+        """Convert a GetParameter(s) result to the API representation."""
+        return {
+            "name": param['Name'],
+            "value": param['Value'],
+            "type": param['Type'],
+            "version": param.get('Version', 1),
+            "last_modified": param['LastModifiedDate'].isoformat(),
+            "arn": param.get('ARN', '')
+        }
+
 
 # Singleton instance
 aws_service = AWSService()
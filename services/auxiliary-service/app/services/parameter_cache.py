@@ -0,0 +1,240 @@
+"""Parameter cache - Version-aware read-through cache for Parameter Store values."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from prometheus_client import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+# Prometheus metrics
+PARAMETER_CACHE_REQUESTS = Counter(
+    'auxiliary_service_parameter_cache_requests_total',
+    'Parameter value cache lookups by result',
+    ['result']
+)
+PARAMETER_CACHE_ENTRIES = Gauge(
+    'auxiliary_service_parameter_cache_entries',
+    'Entries in the parameter value cache',
+    multiprocess_mode='livesum'
+)
+PARAMETER_CACHE_EVICTIONS = Counter(
+    'auxiliary_service_parameter_cache_evictions_total',
+    'Entries evicted from the parameter value cache to stay within its size bound'
+)
+PARAMETER_CACHE_REVALIDATIONS = Counter(
+    'auxiliary_service_parameter_cache_revalidations_total',
+    'Cached entries checked against describe_parameters metadata, by outcome',
+    ['result']
+)
+
+# Lookup results
+HIT = "hit"
+MISS = "miss"
+NEGATIVE_HIT = "negative_hit"
+
+CacheKey = Tuple[str, bool]
+
+
+@dataclass
+class ParameterCacheEntry:
+    """A cached parameter value, or a cached "not found" when value is None."""
+
+    value: Optional[Dict]
+    expires_at: float
+    sensitive: bool = False
+
+    @property
+    def version_key(self) -> Optional[Tuple[int, str]]:
+        """Version and last-modified date identifying the cached value."""
+        if self.value is None:
+            return None
+        return self.value["version"], self.value["last_modified"]
+
+
+class ParameterCache:
+    """
+    Bounded LRU cache of parameter values keyed by (name, decrypt).
+
+    - Values live for ttl seconds; "not found" results for negative_ttl.
+    - Decrypted SecureString values live for secure_ttl seconds and are never
+      extended by revalidation (secure_ttl=0 disables caching them).
+    - revalidate() takes Version/LastModifiedDate metadata from a
+      describe_parameters sweep: unchanged entries get a new TTL without
+      re-reading (or decrypting) the value, changed or deleted ones are dropped.
+
+    All methods are thread-safe, since lookups happen on executor threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl: float = 300.0,
+        secure_ttl: float = 30.0,
+        negative_ttl: float = 30.0
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached keys
+            ttl: Lifetime of regular values in seconds
+            secure_ttl: Lifetime of decrypted SecureString values in seconds
+            negative_ttl: Lifetime of "not found" results in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.secure_ttl = secure_ttl
+        self.negative_ttl = negative_ttl
+
+        self._entries: "OrderedDict[CacheKey, ParameterCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, name: str, decrypt: bool) -> Optional[ParameterCacheEntry]:
+        """
+        Look up a parameter.
+
+        Args:
+            name: Parameter name
+            decrypt: Whether the decrypted value was requested
+
+        Returns:
+            Fresh entry (value None means the parameter doesn't exist), or None on a miss
+        """
+        key = (name, decrypt)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            PARAMETER_CACHE_REQUESTS.labels(result=MISS).inc()
+        else:
+            PARAMETER_CACHE_REQUESTS.labels(result=HIT if entry.value is not None else NEGATIVE_HIT).inc()
+        return entry
+
+    def put(self, name: str, decrypt: bool, value: Dict) -> None:
+        """
+        Cache a parameter value.
+
+        Args:
+            name: Parameter name
+            decrypt: Whether the value was decrypted
+            value: Parameter as returned by GetParameter (API representation)
+        """
+        sensitive = decrypt and value.get("type") == "SecureString"
+        ttl = self.secure_ttl if sensitive else self.ttl
+        if ttl <= 0:
+            return
+        self._store((name, decrypt), ParameterCacheEntry(value, time.monotonic() + ttl, sensitive))
+
+    def put_missing(self, name: str, decrypt: bool) -> None:
+        """Cache the fact that a parameter doesn't exist."""
+        if self.negative_ttl <= 0:
+            return
+        self._store((name, decrypt), ParameterCacheEntry(None, time.monotonic() + self.negative_ttl))
+
+    def names(self) -> List[str]:
+        """Names with a cached entry that revalidation can extend."""
+        with self._lock:
+            return sorted({name for (name, _), entry in self._entries.items() if not entry.sensitive})
+
+    def revalidate(self, metadata: Dict[str, Tuple[int, str]], checked: List[str]) -> None:
+        """
+        Reconcile cached entries with current parameter metadata.
+
+        Args:
+            metadata: (version, last_modified) per existing parameter
+            checked: Names that were looked up (those absent from metadata no longer exist)
+        """
+        now = time.monotonic()
+        checked_names = set(checked)
+
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                name = key[0]
+                if name not in checked_names or entry.sensitive:
+                    continue
+
+                current = metadata.get(name)
+                if entry.value is None:
+                    # Cached "not found": drop it once the parameter exists
+                    outcome = "created" if current is not None else "unchanged"
+                elif current is None:
+                    outcome = "deleted"
+                else:
+                    outcome = "unchanged" if current == entry.version_key else "changed"
+
+                if outcome == "unchanged":
+                    ttl = self.negative_ttl if entry.value is None else self.ttl
+                    entry.expires_at = now + ttl
+                else:
+                    del self._entries[key]
+                PARAMETER_CACHE_REVALIDATIONS.labels(result=outcome).inc()
+
+            PARAMETER_CACHE_ENTRIES.set(len(self._entries))
+
+    def invalidate(self, name: str) -> None:
+        """Drop all entries for a parameter."""
+        with self._lock:
+            for decrypt in (True, False):
+                self._entries.pop((name, decrypt), None)
+            PARAMETER_CACHE_ENTRIES.set(len(self._entries))
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+        PARAMETER_CACHE_ENTRIES.set(0)
+
+    def start(self, sweep: Callable[[], Awaitable[None]], interval: float) -> None:
+        """
+        Run a revalidation sweep periodically in the background.
+
+        Args:
+            sweep: Coroutine factory that fetches metadata and calls revalidate()
+            interval: Seconds between sweeps
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(sweep, interval), name="parameter-cache-revalidator")
+
+    async def stop(self) -> None:
+        """Stop the background revalidation sweep."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self, sweep: Callable[[], Awaitable[None]], interval: float) -> None:
+        """Sweep until cancelled; a failed sweep just lets entries expire."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await sweep()
+            except Exception as e:
+                logger.warning("Parameter cache revalidation failed: %s", e)
+
+    def _store(self, key: CacheKey, entry: ParameterCacheEntry) -> None:
+        """Insert an entry and evict least recently used ones beyond max_entries."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                PARAMETER_CACHE_EVICTIONS.inc()
+            PARAMETER_CACHE_ENTRIES.set(len(self._entries))
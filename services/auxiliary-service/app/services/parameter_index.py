@@ -0,0 +1,321 @@
+"""Parameter index - In-memory path trie over Parameter Store metadata."""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional
+
+from prometheus_client import Gauge
+
+logger = logging.getLogger(__name__)
+
+# Prometheus metrics
+INDEX_PARAMETERS = Gauge(
+    'auxiliary_service_parameter_index_parameters',
+    'Parameters held in the parameter name index',
+    multiprocess_mode='livemax'
+)
+INDEX_NODES = Gauge(
+    'auxiliary_service_parameter_index_nodes',
+    'Path nodes in the parameter name index',
+    multiprocess_mode='livemax'
+)
+INDEX_REFRESH_DURATION = Gauge(
+    'auxiliary_service_parameter_index_last_refresh_duration_seconds',
+    'Duration of the last full parameter index refresh (AWS scan plus update)',
+    multiprocess_mode='livemax'
+)
+INDEX_REFRESH_TIMESTAMP = Gauge(
+    'auxiliary_service_parameter_index_last_refresh_timestamp_seconds',
+    'Unix time of the last successful parameter index refresh',
+    multiprocess_mode='livemin'
+)
+
+
+class ParameterIndexUnavailableError(Exception):
+    """Raised when the parameter index is disabled or not built yet."""
+
+
+class ParameterPathNotFoundError(LookupError):
+    """Raised when no parameter exists under a path."""
+
+
+class _Node:
+    """One path segment. param is set when a parameter has exactly this name."""
+
+    __slots__ = ("children", "param", "count")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.param: Optional[Dict] = None
+        self.count = 0
+
+
+def split_path(name: str) -> List[str]:
+    """
+    Split a parameter name or path into its segments.
+
+    Hierarchical names start with an empty segment, so "/db" and "db" stay
+    distinct; empty segments elsewhere (e.g. a trailing slash) are dropped.
+    """
+    head, *rest = name.split("/")
+    return [head] + [segment for segment in rest if segment]
+
+
+def join_path(segments: List[str]) -> str:
+    """Build a name or path from segments."""
+    return "/".join(segments) or "/"
+
+
+class ParameterIndex:
+    """
+    Trie of parameter metadata keyed by path segments.
+
+    Each node stores the number of parameters in its subtree, so tree
+    browsing and subtree counts never scan. The index is filled by a full
+    describe_parameters sweep (sync) and kept current between sweeps by
+    upsert()/remove() calls for parameters the service sees change.
+    """
+
+    def __init__(self, max_age: float = 180.0):
+        """
+        Initialize an empty index.
+
+        Args:
+            max_age: Seconds after the last full sweep during which the index counts as fresh
+        """
+        self.max_age = max_age
+
+        self._root = _Node()
+        self._names: Dict[str, Dict] = {}
+        self._nodes = 1
+        self._synced_at: Optional[float] = None
+        self._lock = threading.RLock()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def is_built(self) -> bool:
+        """Whether at least one full sweep has completed."""
+        return self._synced_at is not None
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the last full sweep, or None if never built."""
+        if self._synced_at is None:
+            return None
+        return time.monotonic() - self._synced_at
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the last full sweep is recent enough to answer listings."""
+        age = self.age
+        return age is not None and age <= self.max_age
+
+    def sync(self, params: Iterable[Dict]) -> None:
+        """
+        Apply a full metadata sweep, changing only what differs.
+
+        Args:
+            params: Every parameter, in the describe_parameters API representation
+        """
+        # Each change takes the lock on its own so readers are never blocked for a whole sweep
+        seen = set()
+        for param in params:
+            seen.add(param["name"])
+            if self._names.get(param["name"]) != param:
+                self.upsert(param)
+
+        with self._lock:
+            removed = [name for name in self._names if name not in seen]
+        for name in removed:
+            self.remove(name)
+
+        self._synced_at = time.monotonic()
+
+        INDEX_REFRESH_TIMESTAMP.set(time.time())
+
+    def upsert(self, param: Dict) -> None:
+        """
+        Add or update one parameter.
+
+        Args:
+            param: Parameter metadata (name, type, last_modified, version)
+        """
+        metadata = {key: param[key] for key in ("name", "type", "last_modified", "version")}
+        with self._lock:
+            is_new = metadata["name"] not in self._names
+            self._names[metadata["name"]] = metadata
+
+            node = self._root
+            path = [node]
+            for segment in split_path(metadata["name"]):
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _Node()
+                    self._nodes += 1
+                node = child
+                path.append(node)
+            node.param = metadata
+
+            if is_new:
+                for visited in path:
+                    visited.count += 1
+            self._update_gauges()
+
+    def remove(self, name: str) -> None:
+        """Remove one parameter, pruning nodes left empty."""
+        with self._lock:
+            if self._names.pop(name, None) is None:
+                return
+
+            segments = split_path(name)
+            path = [self._root]
+            for segment in segments:
+                path.append(path[-1].children[segment])
+            path[-1].param = None
+
+            for visited in path:
+                visited.count -= 1
+            for depth in range(len(segments), 0, -1):
+                if path[depth].count == 0:
+                    del path[depth - 1].children[segments[depth - 1]]
+                    self._nodes -= 1
+            self._update_gauges()
+
+    def tree(self, path: str, depth: int = 1) -> Optional[Dict]:
+        """
+        Describe the children of a path.
+
+        Args:
+            path: Hierarchy path ("/" for the root)
+            depth: Levels of children to include
+
+        Returns:
+            Path, subtree count and children, or None if nothing exists under path
+        """
+        segments = split_path(path)
+        with self._lock:
+            node = self._find(segments)
+            if node is None:
+                return None
+            return {
+                "path": join_path(segments),
+                "count": node.count,
+                "is_parameter": node.param is not None,
+                "children": self._children(node, segments, depth)
+            }
+
+    def list_prefix(self, prefix: Optional[str]) -> List[Dict]:
+        """
+        List parameters whose name begins with prefix (describe_parameters BeginsWith semantics).
+
+        Args:
+            prefix: Name prefix, or None for every parameter
+
+        Returns:
+            Parameter metadata sorted by name
+        """
+        with self._lock:
+            if not prefix:
+                return [dict(self._names[name]) for name in sorted(self._names)]
+
+            # Walk the complete segments, then match the partial last one
+            if "/" in prefix:
+                complete, _, partial = prefix.rpartition("/")
+                node = self._find(split_path(complete))
+            else:
+                node, partial = self._root, prefix
+            if node is None:
+                return []
+
+            starts = [child for segment, child in node.children.items() if segment.startswith(partial)]
+            found = [param for start in starts for param in self._walk(start)]
+
+        found = [param for param in found if param["name"].startswith(prefix)]
+        return sorted((dict(param) for param in found), key=lambda param: param["name"])
+
+    def clear(self) -> None:
+        """Drop the whole index."""
+        with self._lock:
+            self._root = _Node()
+            self._names.clear()
+            self._nodes = 1
+            self._synced_at = None
+            self._update_gauges()
+
+    def start(self, refresh: Callable[[], Awaitable[None]], interval: float) -> None:
+        """
+        Build the index now and refresh it periodically in the background.
+
+        Args:
+            refresh: Coroutine factory that scans AWS and calls sync()
+            interval: Seconds between refreshes
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(refresh, interval), name="parameter-index-refresher")
+
+    async def stop(self) -> None:
+        """Stop the background refresher."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self, refresh: Callable[[], Awaitable[None]], interval: float) -> None:
+        """Refresh until cancelled; on failure the index just ages."""
+        while True:
+            start = time.monotonic()
+            try:
+                await refresh()
+                INDEX_REFRESH_DURATION.set(time.monotonic() - start)
+                logger.info("Parameter index refreshed: %s parameters, %s nodes", len(self), self._nodes)
+            except Exception as e:
+                logger.warning("Parameter index refresh failed: %s", e)
+            await asyncio.sleep(interval)
+
+    def _find(self, segments: List[str]) -> Optional[_Node]:
+        """Node for a path, or None if it doesn't exist."""
+        node = self._root
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def _children(self, node: _Node, segments: List[str], depth: int) -> List[Dict]:
+        """Child summaries down to depth levels."""
+        children = []
+        for segment in sorted(node.children):
+            child = node.children[segment]
+            child_segments = segments + [segment]
+            summary = {
+                "name": segment,
+                "path": join_path(child_segments),
+                "count": child.count,
+                "is_parameter": child.param is not None,
+                "has_children": bool(child.children)
+            }
+            if depth > 1 and child.children:
+                summary["children"] = self._children(child, child_segments, depth - 1)
+            children.append(summary)
+        return children
+
+    def _walk(self, node: _Node) -> Iterator[Dict]:
+        """All parameters in a subtree."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.param is not None:
+                yield current.param
+            stack.extend(current.children.values())
+
+    def _update_gauges(self) -> None:
+        INDEX_PARAMETERS.set(len(self._names))
+        INDEX_NODES.set(self._nodes)
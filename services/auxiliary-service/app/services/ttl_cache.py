@@ -0,0 +1,68 @@
+"""TTL cache - Small thread-safe LRU cache with per-entry expiry."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+from prometheus_client import Counter
+
+# Prometheus metrics
+TTL_CACHE_REQUESTS = Counter(
+    'auxiliary_service_ttl_cache_requests_total',
+    'TTL cache lookups by cache and result',
+    ['cache', 'result']
+)
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Bounded LRU mapping whose entries expire ttl seconds after they were stored."""
+
+    def __init__(self, name: str, max_entries: int, ttl: float):
+        """
+        Initialize an empty cache.
+
+        Args:
+            name: Cache name used as metric label
+            max_entries: Maximum number of entries
+            ttl: Entry lifetime in seconds (0 disables caching)
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Get a fresh value, or None."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and item[0] <= time.monotonic():
+                del self._entries[key]
+                item = None
+            if item is not None:
+                self._entries.move_to_end(key)
+
+        TTL_CACHE_REQUESTS.labels(cache=self.name, result="miss" if item is None else "hit").inc()
+        return None if item is None else item[1]
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entries beyond max_entries."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
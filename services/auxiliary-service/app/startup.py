@@ -0,0 +1,76 @@
+"""Startup timing - Durations of the phases between process start and serving traffic."""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from prometheus_client import Gauge
+
+logger = logging.getLogger(__name__)
+
+# Prometheus metrics
+STARTUP_PHASE_SECONDS = Gauge(
+    'auxiliary_service_startup_phase_seconds',
+    'Duration of each startup phase',
+    ['phase'],
+    multiprocess_mode='livemax'
+)
+
+
+class StartupTimer:
+    """
+    Durations of named startup phases, measured from module import.
+
+    Phases may be recorded from any thread (e.g. AWS clients built on
+    executor workers). The report is logged once, when startup completes.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.reported = False
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record the duration of one phase (repeated phases are summed)."""
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+        STARTUP_PHASE_SECONDS.labels(phase=name).set(self.phases[name])
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def elapsed(self) -> float:
+        """Seconds since the timer was created."""
+        return time.perf_counter() - self.started
+
+    def report(self) -> Dict:
+        """
+        Log the startup phases and the total time to ready (first call only).
+
+        Returns:
+            Phase durations and total, in milliseconds
+        """
+        total = self.elapsed()
+        with self._lock:
+            phases = {name: round(seconds * 1000, 1) for name, seconds in self.phases.items()}
+            first = not self.reported
+            self.reported = True
+        STARTUP_PHASE_SECONDS.labels(phase="total").set(total)
+
+        report = {"phases_ms": phases, "total_ms": round(total * 1000, 1)}
+        if first:
+            logger.info("Startup complete in %s ms", report['total_ms'], extra={"startup": report})
+        return report
+
+
+# Global timer, started when app.main imports it (before anything else)
+startup_timer = StartupTimer()
@@ -0,0 +1,235 @@
+"""Tracing - OpenTelemetry spans for requests and boto3 calls (optional dependency)."""
+
+import json
+import logging
+import threading
+from contextlib import nullcontext
+from typing import Any, Dict, Optional, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import route_template
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import propagate, trace
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+    OTEL_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    OTEL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Exporters selectable in settings
+OTLP_EXPORTER = "otlp"
+FILE_EXPORTER = "file"
+
+# Key of the AWS call span in the botocore request context
+_AWS_SPAN = "tracing_span"
+
+_enabled = False
+
+
+class _NoopSpan:
+    """Stand-in span used when OpenTelemetry is not installed."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_status(self, status: Any) -> None:
+        pass
+
+    def update_name(self, name: str) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+if OTEL_AVAILABLE:
+    class FileSpanExporter(SpanExporter):
+        """Append finished spans to a file, one JSON object per line."""
+
+        def __init__(self, path: str):
+            self.path = path
+            self._lock = threading.Lock()
+
+        def export(self, spans: Sequence[ReadableSpan]) -> "SpanExportResult":
+            lines = "".join(json.dumps(json.loads(span.to_json())) + "\n" for span in spans)
+            try:
+                with self._lock, open(self.path, "a", encoding="utf-8") as file:
+                    file.write(lines)
+            except OSError as e:
+                logger.warning("Could not write spans to %s: %s", self.path, e)
+                return SpanExportResult.FAILURE
+            return SpanExportResult.SUCCESS
+
+        def shutdown(self) -> None:
+            pass
+
+
+def configure_tracing(
+    service_name: str,
+    service_version: str,
+    exporter: str = OTLP_EXPORTER,
+    otlp_endpoint: str = "http://localhost:4318/v1/traces",
+    file_path: str = "traces.jsonl",
+    sample_ratio: float = 1.0
+) -> bool:
+    """
+    Install a tracer provider that batches spans to an OTLP collector or a file.
+
+    Args:
+        service_name: service.name resource attribute
+        service_version: service.version resource attribute
+        exporter: "otlp" (OTLP over HTTP) or "file" (JSON lines)
+        otlp_endpoint: OTLP/HTTP traces URL
+        file_path: Output file of the file exporter
+        sample_ratio: Fraction of new traces to record (incoming sampled traces are always followed)
+
+    Returns:
+        Whether tracing is enabled (False if OpenTelemetry is not installed)
+    """
+    global _enabled
+    if not OTEL_AVAILABLE:
+        logger.warning("Tracing requested but OpenTelemetry is not installed")
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name, "service.version": service_version}),
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio))
+    )
+    if exporter == FILE_EXPORTER:
+        span_exporter = FileSpanExporter(file_path)
+    else:
+        span_exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
+    provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    trace.set_tracer_provider(provider)
+
+    _enabled = True
+    logger.info("Tracing enabled: %s exporter, sample ratio %s", exporter, sample_ratio)
+    return True
+
+
+def is_enabled() -> bool:
+    """Whether configure_tracing installed a tracer provider."""
+    return _enabled
+
+
+def start_span(name: str, kind: str = "internal", attributes: Optional[Dict[str, Any]] = None):
+    """
+    Context manager for a span that becomes the current span.
+
+    Without OpenTelemetry this yields a no-op span; without a configured
+    provider the span is a cheap non-recording one.
+
+    Args:
+        name: Span name
+        kind: "internal", "server" or "client"
+        attributes: Initial span attributes
+    """
+    if not OTEL_AVAILABLE:
+        return nullcontext(_NOOP_SPAN)
+    return trace.get_tracer(__name__).start_as_current_span(
+        name,
+        kind=getattr(SpanKind, kind.upper()),
+        attributes=attributes
+    )
+
+
+def instrument_client(client: Any) -> None:
+    """
+    Wrap every API call of a boto3 client in a client span, using botocore's event hooks.
+
+    Calls run on executor threads in a copy of the request's context, so
+    their spans are children of the request span. Hooks are registered even
+    before tracing is configured and do nothing until it is.
+
+    Args:
+        client: boto3 client
+    """
+    events = client.meta.events
+    events.register("before-call", _start_aws_span)
+    events.register("after-call", _end_aws_span)
+    events.register("after-call-error", _fail_aws_span)
+
+
+def _start_aws_span(model: Any, context: Dict, **kwargs: Any) -> None:
+    if not _enabled:
+        return
+    service = model.service_model.service_id
+    context[_AWS_SPAN] = trace.get_tracer(__name__).start_span(
+        f"{service}.{model.name}",
+        kind=SpanKind.CLIENT,
+        attributes={"rpc.system": "aws-api", "rpc.service": str(service), "rpc.method": model.name}
+    )
+
+
+def _end_aws_span(http_response: Any, parsed: Dict, context: Dict, **kwargs: Any) -> None:
+    span = context.pop(_AWS_SPAN, None)
+    if span is None:
+        return
+    span.set_attribute("http.status_code", http_response.status_code)
+    span.set_attribute("aws.request_id", parsed.get("ResponseMetadata", {}).get("RequestId", ""))
+    if http_response.status_code >= 300:
+        span.set_attribute("aws.error_code", parsed.get("Error", {}).get("Code", ""))
+        span.set_status(Status(StatusCode.ERROR))
+    span.end()
+
+
+def _fail_aws_span(exception: BaseException, context: Dict, **kwargs: Any) -> None:
+    span = context.pop(_AWS_SPAN, None)
+    if span is None:
+        return
+    span.record_exception(exception)
+    span.set_status(Status(StatusCode.ERROR, str(exception)))
+    span.end()
+
+
+class TracingMiddleware:
+    """
+    Start a server span per HTTP request, continuing any incoming W3C trace context.
+
+    The span is named after the route template once routing has run, and
+    records the response status.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _enabled:
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+        token = otel_context.attach(propagate.extract(carrier))
+        try:
+            with start_span(f"{scope['method']} request", kind="server") as span:
+                span.set_attribute("http.method", scope["method"])
+                span.set_attribute("http.target", scope["path"])
+
+                async def send_with_status(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        span.set_attribute("http.status_code", message["status"])
+                        if message["status"] >= 500:
+                            span.set_status(Status(StatusCode.ERROR))
+                    await send(message)
+
+                try:
+                    await self.app(scope, receive, send_with_status)
+                finally:
+                    endpoint = route_template(scope)
+                    span.update_name(f"{scope['method']} {endpoint}")
+                    span.set_attribute("http.route", endpoint)
+        finally:
+            otel_context.detach(token)
+
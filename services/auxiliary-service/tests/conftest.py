@@ -20,6 +20,18 @@ os.environ['AWS_SESSION_TOKEN'] = 'testing'
 os.environ['AWS_DEFAULT_REGION'] = 'eu-west-1'
 
 from app.main import app
+from app.services.aws_service import aws_service
+
+
+@pytest.fixture(autouse=True)
+def clear_parameter_cache():
+    """Keep cached AWS data from leaking between moto-backed tests."""
+    aws_service.parameter_cache.clear()
+    aws_service.parameter_index.clear()
+    aws_service.bucket_details_cache.clear()
+    yield
+    aws_service.parameter_cache.clear()
+    aws_service.parameter_index.clear()
 
 
 @pytest.fixture
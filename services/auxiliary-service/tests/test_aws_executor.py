@@ -0,0 +1,86 @@
+"""
+Tests for the AWS executor layer.
+"""
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from app.services.aws_executor import AWSExecutor, AWSExecutorSaturatedError
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.fixture
+def executor():
+    """Small executor with one S3 worker and a short queue."""
+    executor = AWSExecutor({"s3": 1, "ssm": 4}, max_queue=1)
+    yield executor
+    executor.shutdown()
+
+
+async def test_run_returns_result_and_context(executor):
+    """Test that calls run off the loop thread with the caller's context."""
+    request_id.set("req-1")
+
+    thread, value = await executor.run("ssm", lambda: (threading.current_thread().name, request_id.get()))
+
+    assert thread.startswith("aws-ssm")
+    assert value == "req-1"
+
+
+async def test_calls_run_concurrently(executor):
+    """Test that blocking calls overlap instead of serializing on the loop."""
+    start = time.perf_counter()
+    await asyncio.gather(*(executor.run("ssm", time.sleep, 0.2) for _ in range(4)))
+
+    assert time.perf_counter() - start < 0.6
+
+
+async def test_full_queue_rejects_calls(executor):
+    """Test that calls beyond the queue bound are rejected, per service."""
+    release = threading.Event()
+    running = executor.run("s3", release.wait)
+    queued = executor.run("s3", lambda: None)
+    tasks = [asyncio.ensure_future(running), asyncio.ensure_future(queued)]
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(AWSExecutorSaturatedError):
+        await executor.run("s3", lambda: None)
+    assert await executor.run("ssm", lambda: "ok") == "ok"
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert executor.queued("s3") == 0
+
+
+async def test_iterate_consumes_blocking_iterator(executor):
+    """Test that blocking iterators are consumed item by item on the pool."""
+    pages = [page async for page in executor.iterate("ssm", iter([[1, 2], [3]]))]
+
+    assert pages == [[1, 2], [3]]
+
+
+async def test_iterate_closes_iterator_after_in_flight_fetch(executor):
+    """Test that an abandoned iterator is closed on the pool once its prefetch finishes."""
+    events = []
+
+    def pages():
+        try:
+            yield 1
+            time.sleep(0.1)
+            events.append("fetched")
+            yield 2
+        finally:
+            events.append(("closed", threading.current_thread().name))
+
+    iterator = executor.iterate("ssm", pages(), prefetch=True)
+    assert await iterator.__anext__() == 1
+    await asyncio.sleep(0.05)
+    await iterator.aclose()
+
+    assert events[0] == "fetched"
+    assert events[1][0] == "closed"
+    assert events[1][1].startswith("aws-ssm")
@@ -4,6 +4,7 @@ Tests for AWS SDK operations (S3, SSM).
 import pytest
 from moto import mock_s3, mock_ssm
 import boto3
+from unittest.mock import patch
 
 
 @mock_s3
@@ -153,3 +154,338 @@ def test_get_ssm_parameter_missing_name(client):
     
     # Should return 422 for missing required query parameter
     assert response.status_code == 422
+
+
+@mock_ssm
+def test_list_ssm_parameters_paginated(client, aws_credentials):
+    """Test walking parameters page by page with limit and cursor."""
+    from app.services.aws_service import aws_service
+    ssm = boto3.client('ssm', region_name=aws_service.region)
+    for i in range(12):
+        ssm.put_parameter(Name=f'/app/paged/param{i:02d}', Value=f'value{i}', Type='String')
+    
+    names = []
+    pages = 0
+    cursor = None
+    while pages < 20:
+        params = {"path_prefix": "/app/paged", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        
+        response = client.get("/aws/parameters", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        
+        pages += 1
+        names.extend(p["name"] for p in data["parameters"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+    
+    # moto ignores MaxResults (fixed pages of 10), so only check the walk is complete
+    assert pages > 1
+    assert sorted(names) == [f'/app/paged/param{i:02d}' for i in range(12)]
+
+
+@mock_ssm
+def test_list_ssm_parameters_invalid_cursor(client, aws_credentials):
+    """Test that malformed or mismatched cursors are rejected."""
+    response = client.get("/aws/parameters?cursor=not-a-cursor")
+    assert response.status_code == 400
+    
+    from app.services.aws_service import encode_cursor
+    cursor = encode_cursor("token", "/app/other")
+    response = client.get("/aws/parameters", params={"path_prefix": "/app/test", "cursor": cursor})
+    assert response.status_code == 400
+
+
+@mock_ssm
+def test_get_ssm_parameter_values_batch(client, aws_credentials):
+    """Test fetching many parameters in one request, across several GetParameters chunks."""
+    from app.services.aws_service import aws_service
+    ssm = boto3.client('ssm', region_name=aws_service.region)
+    names = [f'/app/batch/param{i:02d}' for i in range(23)]
+    for name in names:
+        ssm.put_parameter(Name=name, Value=f'value-{name}', Type='String')
+    
+    response = client.post(
+        "/aws/parameters/values",
+        json={"names": names + ['/app/batch/missing', names[0]], "decrypt": True}
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert data["count"] == 23
+    assert sorted(p["name"] for p in data["parameters"]) == names
+    assert data["invalid_parameters"] == ['/app/batch/missing']
+    assert all(p["value"] == f'value-{p["name"]}' for p in data["parameters"])
+
+
+def test_get_ssm_parameter_values_requires_names(client):
+    """Test that an empty batch is rejected."""
+    response = client.post("/aws/parameters/values", json={"names": []})
+    
+    assert response.status_code == 422
+
+
+@mock_ssm
+def test_get_ssm_parameters_by_path_streams_ndjson(client, aws_credentials):
+    """Test streaming a whole subtree with values as NDJSON."""
+    import json
+    from app.services.aws_service import aws_service
+    ssm = boto3.client('ssm', region_name=aws_service.region)
+    for i in range(15):
+        ssm.put_parameter(Name=f'/app/prod/service{i % 3}/key{i}', Value=f'v{i}', Type='String')
+    ssm.put_parameter(Name='/app/dev/key', Value='dev', Type='String')
+    
+    response = client.get("/aws/parameters/by-path?path=/app/prod&recursive=true")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    assert len(lines) == 15
+    assert all(line["name"].startswith("/app/prod/") for line in lines)
+    assert all("value" in line for line in lines)
+
+
+@mock_ssm
+def test_get_ssm_parameters_by_path_non_recursive(client, aws_credentials):
+    """Test that nested paths are skipped unless recursive is set."""
+    import json
+    from app.services.aws_service import aws_service
+    ssm = boto3.client('ssm', region_name=aws_service.region)
+    ssm.put_parameter(Name='/app/flat/top', Value='1', Type='String')
+    ssm.put_parameter(Name='/app/flat/nested/deep', Value='2', Type='String')
+    
+    response = client.get("/aws/parameters/by-path?path=/app/flat&recursive=false")
+    
+    assert response.status_code == 200
+    names = [json.loads(line)["name"] for line in response.text.splitlines() if line]
+    assert names == ['/app/flat/top']
+
+
+@mock_s3
+def test_list_s3_buckets_conditional_get(client, aws_credentials):
+    """Test that unchanged bucket listings return 304 for a matching ETag."""
+    s3 = boto3.client('s3', region_name='eu-west-1')
+    s3.create_bucket(Bucket='etag-bucket-1', CreateBucketConfiguration={'LocationConstraint': 'eu-west-1'})
+    
+    first = client.get("/aws/s3/buckets")
+    etag = first.headers["ETag"]
+    
+    unchanged = client.get("/aws/s3/buckets", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert unchanged.headers["ETag"] == etag
+    
+    s3.create_bucket(Bucket='etag-bucket-2', CreateBucketConfiguration={'LocationConstraint': 'eu-west-1'})
+    changed = client.get("/aws/s3/buckets", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+@mock_ssm
+def test_get_ssm_parameter_value_conditional_get(client, aws_credentials):
+    """Test that parameter values get a new ETag when the parameter changes."""
+    from app.services.aws_service import aws_service
+    ssm = boto3.client('ssm', region_name=aws_service.region)
+    ssm.put_parameter(Name='/app/etag/param', Value='v1', Type='String')
+    
+    first = client.get("/aws/parameters/value?name=/app/etag/param")
+    etag = first.headers["ETag"]
+    
+    assert client.get(
+        "/aws/parameters/value?name=/app/etag/param",
+        headers={"If-None-Match": f'W/{etag}, "other"'}
+    ).status_code == 304
+    
+    ssm.put_parameter(Name='/app/etag/param', Value='v2', Type='String', Overwrite=True)
+    # Cached values pick up the new version on the next revalidation sweep
+    aws_service.revalidate_parameter_cache()
+    changed = client.get("/aws/parameters/value?name=/app/etag/param", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["value"] == "v2"
+
+
+@mock_ssm
+def test_get_ssm_parameter_value_cached(client, aws_credentials):
+    """Test that values and misses are cached and kept until metadata changes."""
+    from app.services.aws_service import aws_service
+    ssm = boto3.client('ssm', region_name=aws_service.region)
+    ssm.put_parameter(Name='/app/cache/param', Value='v1', Type='String')
+    
+    assert client.get("/aws/parameters/value?name=/app/cache/param").json()["value"] == "v1"
+    assert client.get("/aws/parameters/value?name=/app/cache/missing").status_code == 404
+    
+    ssm.put_parameter(Name='/app/cache/missing', Value='now-here', Type='String')
+    with patch.object(aws_service.ssm_client, 'get_parameter', side_effect=AssertionError("not cached")):
+        assert client.get("/aws/parameters/value?name=/app/cache/param").json()["value"] == "v1"
+        assert client.get("/aws/parameters/value?name=/app/cache/missing").status_code == 404
+    
+    # Unchanged value survives the sweep, the negative entry is dropped
+    aws_service.revalidate_parameter_cache()
+    assert aws_service.parameter_cache.get('/app/cache/param', True) is not None
+    assert client.get("/aws/parameters/value?name=/app/cache/missing").json()["value"] == "now-here"
+
+
+@mock_ssm
+def test_get_ssm_parameter_tree(client, aws_credentials):
+    """Test browsing the hierarchy from the parameter index."""
+    from app.services.aws_service import aws_service
+    ssm = boto3.client('ssm', region_name=aws_service.region)
+    for name in ['/app/db/host', '/app/db/port', '/app/api/key', '/other/x']:
+        ssm.put_parameter(Name=name, Value='v', Type='String')
+    
+    assert client.get("/aws/parameters/tree?path=/app").status_code == 503
+    aws_service.refresh_parameter_index()
+    
+    response = client.get("/aws/parameters/tree?path=/app")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 3
+    assert [(child["name"], child["count"]) for child in data["children"]] == [("api", 1), ("db", 2)]
+    assert client.get("/aws/parameters/tree?path=/missing").status_code == 404
+    
+    # Only an unavailable index asks clients to retry; bugs are plain 500s
+    with patch.object(aws_service.parameter_index, 'tree', side_effect=KeyError("broken trie")):
+        response = client.get("/aws/parameters/tree?path=/app")
+    assert response.status_code == 500
+    assert "retry-after" not in response.headers
+    
+    # Prefix listings are answered from the fresh index
+    with patch.object(aws_service.ssm_client, 'get_paginator', side_effect=AssertionError("not indexed")):
+        listed = client.get("/aws/parameters?path_prefix=/app/db").json()
+    assert [param["name"] for param in listed["parameters"]] == ['/app/db/host', '/app/db/port']
+
+
+@mock_s3
+def test_list_s3_buckets_with_details(client, aws_credentials):
+    """Test that details are added per bucket and failures stay per field."""
+    from app.services.aws_service import aws_service
+    s3 = boto3.client('s3', region_name=aws_service.region)
+    s3.create_bucket(Bucket='details-a')
+    s3.create_bucket(Bucket='details-b')
+    s3.put_bucket_tagging(Bucket='details-a', Tagging={'TagSet': [{'Key': 'team', 'Value': 'core'}]})
+    s3.put_bucket_versioning(Bucket='details-a', VersioningConfiguration={'Status': 'Enabled'})
+    
+    real_call = aws_service._get_bucket_field
+    
+    def flaky(bucket, field):
+        if bucket == 'details-b' and field == 'tags':
+            raise Exception("AccessDenied")
+        return real_call(bucket, field)
+    
+    with patch.object(aws_service, '_get_bucket_field', side_effect=flaky):
+        response = client.get("/aws/s3/buckets?details=true")
+    
+    assert response.status_code == 200
+    buckets = {bucket["name"]: bucket["details"] for bucket in response.json()["buckets"]}
+    assert buckets["details-a"]["tags"] == {"team": "core"}
+    assert buckets["details-a"]["versioning"] == "Enabled"
+    assert buckets["details-a"]["region"] == "us-east-1"
+    assert buckets["details-a"]["errors"] == {}
+    assert buckets["details-b"]["versioning"] == "Disabled"
+    assert buckets["details-b"]["errors"] == {"tags": "AccessDenied"}
+    
+    # Only fully successful lookups are cached
+    assert aws_service.bucket_details_cache.get('details-a') is not None
+    assert aws_service.bucket_details_cache.get('details-b') is None
+
+
+@mock_s3
+def test_list_s3_buckets_details_failure_has_own_metric_label(client, aws_credentials):
+    """Test that a failed details stage is not counted as a failed list_buckets call."""
+    from prometheus_client import REGISTRY
+    from app.services.aws_service import aws_service
+    boto3.client('s3', region_name=aws_service.region).create_bucket(Bucket='details-c')
+    
+    def errors(operation):
+        labels = {"service": "s3", "operation": operation, "status": "error"}
+        return REGISTRY.get_sample_value("auxiliary_service_aws_api_calls_total", labels) or 0
+    
+    before = {operation: errors(operation) for operation in ('list_buckets', 'bucket_details')}
+    with patch.object(aws_service, 'add_bucket_details', side_effect=RuntimeError("boom")):
+        assert client.get("/aws/s3/buckets?details=true").status_code == 500
+    
+    assert errors('list_buckets') == before['list_buckets']
+    assert errors('bucket_details') == before['bucket_details'] + 1
+
+
+@mock_s3
+def test_list_objects_streams_ndjson_with_resume_tokens(client, aws_credentials):
+    """Test that objects stream page by page and listings can be resumed."""
+    import json
+    from app.services.aws_service import aws_service
+    s3 = boto3.client('s3', region_name=aws_service.region)
+    s3.create_bucket(Bucket='objects-bucket')
+    for i in range(5):
+        s3.put_object(Bucket='objects-bucket', Key=f'logs/{i}.txt', Body=b'x' * i)
+    s3.put_object(Bucket='objects-bucket', Key='other/a.txt', Body=b'')
+    
+    response = client.get("/aws/s3/buckets/objects-bucket/objects?prefix=logs/&page_size=2")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["key"] for line in lines if "key" in line] == [f'logs/{i}.txt' for i in range(5)]
+    tokens = [line["continuation_token"] for line in lines if "continuation_token" in line]
+    assert len(tokens) == 2
+    
+    resumed = client.get(
+        "/aws/s3/buckets/objects-bucket/objects",
+        params={"prefix": "logs/", "page_size": 2, "continuation_token": tokens[-1]}
+    )
+    assert [json.loads(line)["key"] for line in resumed.text.splitlines()] == ['logs/4.txt']
+    
+    grouped = client.get("/aws/s3/buckets/objects-bucket/objects?delimiter=/")
+    assert [json.loads(line) for line in grouped.text.splitlines()] == [{"prefix": "logs/"}, {"prefix": "other/"}]
+
+
+@mock_s3
+def test_list_objects_missing_bucket(client, aws_credentials):
+    """Test that listing a missing bucket fails before streaming starts."""
+    response = client.get("/aws/s3/buckets/no-such-bucket/objects")
+    
+    assert response.status_code == 404
+
+
+@mock_ssm
+def test_metrics_use_route_templates_and_time_aws_calls(client, aws_credentials):
+    """Test that raw paths never become labels and AWS calls are timed per operation."""
+    from prometheus_client import REGISTRY
+    
+    labels = {"service": "ssm", "operation": "get_parameter", "status": "error"}
+    before = REGISTRY.get_sample_value("auxiliary_service_aws_call_duration_seconds_count", labels) or 0
+    
+    client.get("/aws/parameters/value?name=/missing/one")
+    client.get("/random/scan/path")
+    
+    assert REGISTRY.get_sample_value("auxiliary_service_aws_call_duration_seconds_count", labels) == before + 1
+    assert REGISTRY.get_sample_value(
+        "auxiliary_service_requests_total", {"method": "GET", "endpoint": "/aws/parameters/value", "status": "404"}
+    ) >= 1
+    assert REGISTRY.get_sample_value(
+        "auxiliary_service_requests_total", {"method": "GET", "endpoint": "unmatched", "status": "404"}
+    ) >= 1
+    assert "/random/scan/path" not in client.get("/metrics").text
+
+
+@mock_s3
+def test_list_objects_maps_aws_error_codes(client, aws_credentials):
+    """Test that AWS error codes, not messages, decide the status of a failed listing."""
+    from botocore.exceptions import ClientError
+    from app.services.aws_service import aws_service
+    
+    def fail(code, message):
+        error = ClientError({'Error': {'Code': code, 'Message': message}}, 'ListObjectsV2')
+        return patch.object(aws_service.s3_client, 'list_objects_v2', side_effect=error)
+    
+    with fail('SlowDown', 'Please reduce your request rate'):
+        response = client.get("/aws/s3/buckets/busy-bucket/objects")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    
+    with fail('AccessDenied', 'Key not found in policy'):
+        assert client.get("/aws/s3/buckets/private-bucket/objects").status_code == 500
@@ -0,0 +1,97 @@
+"""
+Tests for negotiated response compression.
+"""
+import gzip
+import zlib
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.compression import CompressionMiddleware, compressor, negotiate_encoding
+
+
+def build_app():
+    """Small app with a large, a small and two streamed responses."""
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    async def large():
+        return {"parameters": [{"name": f"/app/param-{i}", "type": "String"} for i in range(100)]}
+
+    @app.get("/small")
+    async def small():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream():
+        lines = (b'{"name": "/app/x"}\n' for _ in range(50))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    @app.get("/stream/small")
+    async def small_stream():
+        lines = (b'{"name": "/app/x"}\n' for _ in range(2))
+        return StreamingResponse(lines, media_type="application/x-ndjson", headers={"Content-Length": "38"})
+
+    return app
+
+
+def test_negotiate_encoding():
+    """Test that q-values and server preference pick the encoding."""
+    assert negotiate_encoding("gzip, br", ["zstd", "br", "gzip"]) == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", ["br", "gzip"]) == "gzip"
+    assert negotiate_encoding("br;q=0", ["br", "gzip"]) is None
+    assert negotiate_encoding("*", ["gzip"]) == "gzip"
+    assert negotiate_encoding(None, ["gzip"]) is None
+
+
+def test_large_response_compressed():
+    """Test that bodies above the threshold are compressed."""
+    client = TestClient(build_app())
+
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert len(response.json()["parameters"]) == 100
+
+
+def test_small_or_unrequested_response_not_compressed():
+    """Test that small bodies and clients without Accept-Encoding get identity."""
+    client = TestClient(build_app())
+
+    assert "Content-Encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    assert "Content-Encoding" not in client.get("/large", headers={"Accept-Encoding": "identity"}).headers
+
+
+def test_streamed_response_compressed_incrementally():
+    """Test that streamed NDJSON is compressed without a Content-Length."""
+    client = TestClient(build_app())
+
+    response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert response.text.count("\n") == 50
+
+
+def test_small_streamed_response_with_length_not_compressed():
+    """Test that a streamed body whose Content-Length is below the threshold is sent as-is."""
+    client = TestClient(build_app())
+
+    response = client.get("/stream/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Content-Length"] == "38"
+    assert response.text.count("\n") == 2
+
+
+def test_gzip_stream_chunks_decodable():
+    """Test that every flushed chunk can be decoded as soon as it arrives."""
+    stream = compressor("gzip", 6)
+    first = stream.write(b'{"a": 1}\n')
+    rest = stream.write(b'{"b": 2}\n') + stream.close()
+
+    assert zlib.decompressobj(31).decompress(first) == b'{"a": 1}\n'
+    assert gzip.decompress(first + rest) == b'{"a": 1}\n{"b": 2}\n'
@@ -0,0 +1,77 @@
+"""
+Tests for the queued, rate-limited JSON logging pipeline.
+"""
+import json
+import logging
+import queue
+import sys
+
+from prometheus_client import REGISTRY
+
+from app.logging_config import DroppingQueueHandler, RateLimitFilter, build_formatter
+
+
+def make_record(name="app.test", level=logging.INFO, msg="hello %s", args=("world",)):
+    """Build a log record without going through a logger."""
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def dropped(reason):
+    """Current value of the dropped-records counter."""
+    return REGISTRY.get_sample_value("auxiliary_service_log_records_dropped_total", {"reason": reason}) or 0
+
+
+def test_rate_limit_is_per_logger_and_spares_warnings():
+    """Test that info records beyond the burst are dropped per logger, warnings never."""
+    rate_limit = RateLimitFilter(rate=0.001, burst=3)
+    before = dropped("rate_limited")
+    
+    passed = [rate_limit.filter(make_record()) for _ in range(5)]
+    
+    assert passed == [True, True, True, False, False]
+    assert rate_limit.filter(make_record(name="app.other"))
+    assert rate_limit.filter(make_record(level=logging.WARNING))
+    assert dropped("rate_limited") == before + 2
+
+
+def test_access_log_is_not_rate_limited():
+    """Test that uvicorn's access log, one record per request, is never dropped."""
+    rate_limit = RateLimitFilter(rate=0.001, burst=1)
+    
+    assert all(rate_limit.filter(make_record(name="uvicorn.access")) for _ in range(5))
+    assert rate_limit.filter(make_record(name="uvicorn.error"))
+    assert not rate_limit.filter(make_record(name="uvicorn.error"))
+
+
+def test_queue_handler_drops_when_full():
+    """Test that a full queue drops records instead of blocking."""
+    records = queue.Queue(maxsize=1)
+    handler = DroppingQueueHandler(records)
+    before = dropped("queue_full")
+    
+    handler.handle(make_record())
+    handler.handle(make_record())
+    
+    assert records.qsize() == 1
+    assert dropped("queue_full") == before + 1
+
+
+def test_records_render_as_json_after_crossing_the_queue():
+    """Test that the message is rendered before queueing and serialized as one JSON line."""
+    records = queue.Queue()
+    handler = DroppingQueueHandler(records)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = make_record(level=logging.ERROR)
+        record.exc_info = sys.exc_info()
+    
+    handler.handle(record)
+    queued = records.get_nowait()
+    line = json.loads(build_formatter(json_logs=True).format(queued))
+    
+    assert queued.args is None and queued.exc_info is None
+    assert line["message"] == "hello world"
+    assert line["level"] == "ERROR"
+    assert line["name"] == "app.test"
+    assert "ValueError: boom" in line["exc_info"]
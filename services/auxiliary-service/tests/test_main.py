@@ -1,7 +1,14 @@
 """
 Tests for auxiliary service main endpoints (health, version, metrics).
 """
+import time
+
 import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from app.main import app, settings
+from app.services.health import health_prober
 
 
 def test_health_endpoint(client):
@@ -60,3 +67,63 @@ def test_openapi_endpoint(client):
     assert "openapi" in data
     assert "info" in data
     assert data["info"]["title"] == "Auxiliary Service"
+
+
+def test_version_header(client):
+    """Test that responses carry the service version header."""
+    response = client.get("/version")
+    
+    assert response.status_code == 200
+    assert response.headers["X-Auxiliary-Service-Version"] == response.json()["version"]
+
+
+def test_liveness_endpoint(client):
+    """Test that liveness answers without touching AWS."""
+    with patch.object(health_prober, "run_checks") as run_checks:
+        response = client.get("/health/live")
+    
+    assert response.status_code == 200
+    assert response.json()["status"] == "alive"
+    run_checks.assert_not_called()
+
+
+def test_readiness_endpoint(client):
+    """Test that readiness reports the cached AWS check."""
+    response = client.get("/health/ready")
+    
+    assert response.status_code in [200, 503]
+    assert "aws" in response.json()["checks"]
+
+
+def test_debug_endpoints_disabled_by_default(client):
+    """Test that debug endpoints are hidden unless enabled."""
+    assert client.get("/debug/profile?seconds=0.1").status_code == 404
+    assert client.get("/debug/tasks").status_code == 404
+
+
+def test_debug_profile_covers_executor_threads(client):
+    """Test that AWS executor threads show up in a profile."""
+    from app.main import settings
+    from app.services.aws_executor import aws_executor
+    
+    with patch.object(settings, 'debug_endpoints_enabled', True):
+        # Keep one worker busy while sampling
+        call = aws_executor.submit("s3", time.sleep, 0.3)
+        response = client.get("/debug/profile?seconds=0.1")
+        call.result()
+    
+    assert response.status_code == 200
+    assert any(line.startswith("aws-s3") for line in response.text.splitlines())
+
+
+def test_lifespan_starts_and_stops_background_work(aws_credentials):
+    """Test that the lifespan starts the health prober and stops it and the executor on shutdown."""
+    with patch.object(settings, 'aws_prewarm_clients', False), \
+            patch("app.main.aws_executor.shutdown") as shutdown:
+        with TestClient(app) as client:
+            assert client.get("/health/live").status_code == 200
+            assert health_prober._task is not None
+            shutdown.assert_not_called()
+
+    assert health_prober._task is None
+    shutdown.assert_called_once()
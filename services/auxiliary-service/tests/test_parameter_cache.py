@@ -0,0 +1,61 @@
+"""
+Tests for the parameter value cache.
+"""
+from unittest.mock import patch
+
+from app.services.parameter_cache import ParameterCache
+
+
+def make_value(name, type_="String", version=1):
+    """Parameter in the GetParameter API representation."""
+    return {
+        "name": name,
+        "value": "x",
+        "type": type_,
+        "version": version,
+        "last_modified": "2025-10-24T08:00:00+00:00",
+        "arn": ""
+    }
+
+
+def test_decrypted_secure_strings_use_secure_policy():
+    """Test that decrypted SecureStrings expire sooner and are never extended."""
+    cache = ParameterCache(ttl=300, secure_ttl=30)
+    cache.put("/app/secret", True, make_value("/app/secret", "SecureString"))
+    cache.put("/app/secret", False, make_value("/app/secret", "SecureString"))
+    
+    assert cache.names() == ["/app/secret"]  # only the encrypted copy is revalidated
+    with patch("app.services.parameter_cache.time.monotonic", return_value=10 ** 9):
+        assert cache.get("/app/secret", True) is None
+    
+    uncached = ParameterCache(secure_ttl=0)
+    uncached.put("/app/secret", True, make_value("/app/secret", "SecureString"))
+    assert len(uncached) == 0
+
+
+def test_revalidation_extends_or_drops():
+    """Test that unchanged entries are kept and changed or deleted ones dropped."""
+    cache = ParameterCache()
+    for name in ("/a", "/b", "/c"):
+        cache.put(name, True, make_value(name))
+    
+    cache.revalidate(
+        {"/a": (1, "2025-10-24T08:00:00+00:00"), "/b": (2, "2025-10-25T08:00:00+00:00")},
+        ["/a", "/b", "/c"]
+    )
+    
+    assert cache.get("/a", True) is not None
+    assert cache.get("/b", True) is None
+    assert cache.get("/c", True) is None
+
+
+def test_size_bound_evicts_least_recently_used():
+    """Test that the cache never holds more than max_entries keys."""
+    cache = ParameterCache(max_entries=2)
+    cache.put("/a", True, make_value("/a"))
+    cache.put("/b", True, make_value("/b"))
+    cache.get("/a", True)
+    cache.put("/c", True, make_value("/c"))
+    
+    assert len(cache) == 2
+    assert cache.get("/b", True) is None
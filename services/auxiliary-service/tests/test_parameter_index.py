@@ -0,0 +1,39 @@
+"""
+Tests for the parameter name index.
+"""
+from app.services.parameter_index import ParameterIndex
+
+
+def make_param(name, version=1):
+    """Parameter in the describe_parameters API representation."""
+    return {"name": name, "type": "String", "last_modified": "2025-10-24T08:00:00+00:00", "version": version}
+
+
+def build(*names):
+    index = ParameterIndex()
+    index.sync(make_param(name) for name in names)
+    return index
+
+
+def test_list_prefix_matches_begins_with():
+    """Test that prefix listings match describe_parameters BeginsWith semantics."""
+    index = build("/app", "/app/db/host", "/apple/x", "/other/y", "plain")
+    
+    names = lambda prefix: [param["name"] for param in index.list_prefix(prefix)]
+    assert names("/app") == ["/app", "/app/db/host", "/apple/x"]
+    assert names("/app/") == ["/app/db/host"]
+    assert names("/app/d") == ["/app/db/host"]
+    assert names("pl") == ["plain"]
+    assert len(names(None)) == 5
+
+
+def test_sync_applies_removals_and_prunes_nodes():
+    """Test that a sweep drops missing parameters and their empty branches."""
+    index = build("/app/db/host", "/app/db/port", "/app/api/key")
+    index.sync([make_param("/app/db/host", version=2)])
+    
+    tree = index.tree("/app", depth=2)
+    assert tree["count"] == 1
+    assert [child["name"] for child in tree["children"]] == ["db"]
+    assert index.list_prefix("/app")[0]["version"] == 2
+    assert index.tree("/app/api") is None
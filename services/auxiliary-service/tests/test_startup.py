@@ -0,0 +1,68 @@
+"""
+Tests for lazy AWS client creation and startup timing.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app, settings
+from app.services.aws_service import AWSService
+from app.startup import StartupTimer
+
+
+def test_clients_created_lazily_from_one_session(aws_credentials):
+    """Test that no client exists until first use, and both share one session."""
+    service = AWSService()
+    assert service._clients == {}
+    assert service._session is None
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: service.ssm_client, range(8)))
+
+    assert all(client is clients[0] for client in clients)
+    assert service.s3_client is service.s3_client
+    assert set(service._clients) == {"s3", "ssm"}
+
+
+def test_prewarm_builds_clients_and_records_phases(aws_credentials):
+    """Test that prewarm creates both clients and reports their build time."""
+    service = AWSService()
+    timer = StartupTimer()
+
+    with patch("app.services.aws_service.startup_timer", timer):
+        service.prewarm()
+
+    assert set(service._clients) == {"s3", "ssm"}
+    assert {"s3_client", "ssm_client", "aws_credentials"} <= set(timer.phases)
+
+
+def test_startup_report():
+    """Test that the report lists phases in milliseconds and is logged once."""
+    timer = StartupTimer()
+    timer.record("import", 0.25)
+    timer.record("import", 0.05)
+    with timer.phase("aws_prewarm"):
+        pass
+
+    with patch("app.startup.logger") as logger:
+        report = timer.report()
+        timer.report()
+
+    assert report["phases_ms"]["import"] == 300.0
+    assert "aws_prewarm" in report["phases_ms"]
+    assert report["total_ms"] >= 0
+    logger.info.assert_called_once()
+
+
+def test_lifespan_times_startup_and_shutdown(aws_credentials):
+    """Test that the lifespan records its startup work and shutdown as phases."""
+    timer = StartupTimer()
+
+    with patch("app.main.startup_timer", timer), \
+            patch.object(settings, 'aws_prewarm_clients', False), \
+            patch("app.main.aws_executor.shutdown"):
+        with TestClient(app):
+            assert {"import", "lifespan"} <= set(timer.phases)
+            assert timer.reported
+        assert "shutdown" in timer.phases
@@ -0,0 +1,52 @@
+"""
+Tests for request tracing and Server-Timing phases.
+"""
+import pytest
+from moto import mock_s3
+from unittest.mock import patch
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from app import tracing
+
+INCOMING_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+@pytest.fixture
+def spans():
+    """Record spans with a local tracer provider instead of the global one."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with patch.object(tracing, '_enabled', True), \
+            patch.object(tracing.trace, 'get_tracer', provider.get_tracer):
+        yield exporter
+
+
+@mock_s3
+def test_server_timing_reports_aws_phases(client, aws_credentials):
+    """Test that responses report executor queueing and AWS call time."""
+    response = client.get("/aws/s3/buckets")
+
+    assert response.status_code == 200
+    phases = [entry.split(";")[0] for entry in response.headers["Server-Timing"].split(", ")]
+    assert phases == ["queue", "aws", "app"]
+
+
+@mock_s3
+def test_boto3_calls_traced_under_request_span(client, aws_credentials, spans):
+    """Test that each boto3 call gets a client span inside the continued request trace."""
+    traceparent = f"00-{INCOMING_TRACE_ID}-00f067aa0ba902b7-01"
+    response = client.get("/aws/s3/buckets", headers={"traceparent": traceparent})
+
+    assert response.status_code == 200
+    finished = {span.name: span for span in spans.get_finished_spans()}
+    server = finished["GET /aws/s3/buckets"]
+    aws_call = finished["S3.ListBuckets"]
+
+    assert format(server.context.trace_id, "032x") == INCOMING_TRACE_ID
+    assert aws_call.parent.span_id == server.context.span_id
+    assert aws_call.attributes["rpc.service"] == "S3"
+    assert aws_call.attributes["http.status_code"] == 200
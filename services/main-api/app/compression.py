@@ -0,0 +1,230 @@
+"""Response compression - Accept-Encoding negotiated gzip, brotli and zstd."""
+
+import gzip
+import zlib
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Content types worth compressing (JSON bodies dominate both services)
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+class _ZlibStream:
+    """Incremental gzip encoder that flushes after every chunk."""
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def write(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def close(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliStream:
+    """Incremental brotli encoder that flushes after every chunk."""
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def write(self, chunk: bytes) -> bytes:
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def close(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    """Incremental zstd encoder that flushes after every chunk."""
+
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def write(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def close(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encodings() -> List[str]:
+    """Encodings this process can produce, in server preference order."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """
+    Compress a complete body.
+
+    Args:
+        data: Body to compress
+        encoding: Content coding ("gzip", "br" or "zstd")
+        level: Compression level (brotli quality for "br")
+
+    Returns:
+        Compressed body
+    """
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def compressor(encoding: str, level: int):
+    """Create an incremental encoder with write(chunk) and close() methods."""
+    if encoding == "zstd":
+        return _ZstdStream(level)
+    if encoding == "br":
+        return _BrotliStream(level)
+    return _ZlibStream(level)
+
+
+def negotiate_encoding(accept_encoding: Optional[str], encodings: List[str]) -> Optional[str]:
+    """
+    Pick the content coding to use for a request.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+        encodings: Supported encodings in server preference order
+
+    Returns:
+        Chosen encoding, or None to send the body uncompressed
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies according to the client's Accept-Encoding.
+
+    Bodies below minimum_size are sent as-is: single-message bodies by their
+    length, streamed ones by their Content-Length if known. Other streamed
+    bodies are compressed incrementally and flushed per chunk, so NDJSON
+    lines still reach the client as they are produced. Responses that already carry a
+    Content-Encoding, are not JSON/text, or have no body are left alone.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, levels: Optional[Dict[str, int]] = None):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            minimum_size: Smallest body (in bytes) worth compressing
+            levels: Compression level per encoding
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": 6, "br": 4, "zstd": 3, **(levels or {})}
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        level = self.levels[encoding]
+        start_message: Optional[Message] = None
+        stream = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, stream, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                content_length = headers.get("content-length", "")
+                passthrough = (
+                    "content-encoding" in headers
+                    or message["status"] in (204, 304)
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or (content_length.isdigit() and int(content_length) < self.minimum_size)
+                )
+                if passthrough:
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if stream is None:
+                headers = MutableHeaders(raw=start_message["headers"])
+
+                if not more_body:
+                    # Whole body in one message
+                    if len(body) < self.minimum_size:
+                        await send(start_message)
+                        await send(message)
+                        return
+                    body = compress(body, encoding, level)
+                    headers["Content-Encoding"] = encoding
+                    headers["Content-Length"] = str(len(body))
+                    headers.add_vary_header("Accept-Encoding")
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+                stream = compressor(encoding, level)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+                await send(start_message)
+
+            chunk = stream.write(body) if body else b""
+            if not more_body:
+                chunk += stream.close()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -19,6 +19,61 @@ class Settings(BaseSettings):
         "http://auxiliary-service.auxiliary-service.svc.cluster.local:8001"
     )
     auxiliary_service_timeout: int = 30
+    auxiliary_service_connect_timeout: float = 2.0
+    auxiliary_service_read_timeout: float = 30.0
+    auxiliary_service_pool_timeout: float = 5.0
+    auxiliary_service_max_connections: int = 100
+    auxiliary_service_max_keepalive_connections: int = 20
+    auxiliary_service_keepalive_expiry: float = 30.0
+    auxiliary_service_http2: bool = False
+    auxiliary_service_prewarm_connections: int = 2
+    auxiliary_version_ttl: int = 300
+    auxiliary_version_refresh_interval: int = 60
+    
+    # Circuit breaker for auxiliary service calls
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_slow_call_duration: float = 5.0
+    circuit_breaker_slow_call_rate: float = 0.8
+    circuit_breaker_window_size: int = 20
+    circuit_breaker_minimum_calls: int = 10
+    circuit_breaker_open_seconds: float = 30.0
+    circuit_breaker_half_open_calls: int = 3
+    
+    # Retries for idempotent auxiliary service calls
+    auxiliary_service_max_retries: int = 2
+    retry_base_backoff: float = 0.05
+    retry_max_backoff: float = 1.0
+    retry_budget_ratio: float = 0.1
+    retry_budget_min_per_second: float = 1.0
+    retry_budget_max_tokens: float = 10.0
+    
+    # Stream list responses from the auxiliary service instead of decoding
+    # and re-encoding them (bypasses the response cache and request coalescing)
+    proxy_streaming_enabled: bool = False
+    
+    # Largest batch accepted by POST /parameters/values (keep in line with
+    # the auxiliary service's PARAMETER_VALUES_MAX_NAMES)
+    parameter_values_max_names: int = 500
+    
+    # Response cache (per-route TTLs, in seconds)
+    response_cache_enabled: bool = True
+    response_cache_max_bytes: int = 16 * 1024 * 1024
+    cache_s3_buckets_ttl: int = 60
+    cache_parameters_ttl: int = 30
+    cache_parameter_value_ttl: int = 15
+    cache_stale_while_revalidate: int = 60
+    cache_stale_if_error: int = 300
+    
+    # Response compression (negotiated via Accept-Encoding)
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    compression_zstd_level: int = 3
+    
+    # Background health checks
+    health_check_interval: float = 10.0
+    health_check_timeout: float = 3.0
     
     # API Configuration
     api_prefix: str = "/api/v1"
@@ -27,8 +82,26 @@ class Settings(BaseSettings):
     # CORS
     cors_origins: list = ["*"]
     
+    # Debug endpoints (/debug/profile, /debug/tasks): 404 unless enabled;
+    # when a token is set, requests must send it in X-Debug-Token
+    debug_endpoints_enabled: bool = False
+    debug_token: str = ""
+    debug_profile_max_seconds: float = 60.0
+    debug_profile_interval: float = 0.01
+    
+    # Tracing (OpenTelemetry; exporter is "otlp" or "file")
+    tracing_enabled: bool = False
+    tracing_exporter: str = "otlp"
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    tracing_file_path: str = "traces.jsonl"
+    tracing_sample_ratio: float = 1.0
+    
     # Logging
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    log_json: bool = True
+    log_queue_size: int = 10000
+    log_rate_limit_per_second: float = 50.0
+    log_rate_limit_burst: int = 200
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,157 @@
+"""Logging setup - JSON logs written by a background thread, fed through a bounded queue."""
+
+import atexit
+import copy
+import logging
+import queue
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
+from prometheus_client import Counter
+from pythonjsonlogger import jsonlogger
+
+# Prometheus metrics
+LOG_RECORDS_DROPPED = Counter(
+    'main_api_log_records_dropped_total',
+    'Log records dropped before being written, by reason',
+    ['reason']
+)
+
+# Fields of JSON log lines, and the plain text alternative
+JSON_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Loggers configured by uvicorn with their own synchronous handlers
+SERVER_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+# One record per request: rate limiting them would silently lose requests
+RATE_LIMIT_EXEMPT_LOGGERS = ("uvicorn.access",)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Token bucket per logger for records below WARNING.
+
+    Each logger may emit `rate` records per second on average, with bursts
+    of up to `burst`; beyond that, records are dropped (and counted) until
+    tokens refill. Warnings and errors, and records of exempt loggers (the
+    access log by default), always pass.
+    """
+
+    def __init__(self, rate: float, burst: int, exempt: Tuple[str, ...] = RATE_LIMIT_EXEMPT_LOGGERS):
+        """
+        Initialize the filter.
+
+        Args:
+            rate: Records per second per logger (0 disables rate limiting)
+            burst: Bucket size per logger
+            exempt: Names of loggers that are never rate limited
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.exempt = frozenset(exempt)
+
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate <= 0 or record.levelno >= logging.WARNING or record.name in self.exempt:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(record.name, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            allowed = tokens >= 1
+            self._buckets[record.name] = (tokens - 1 if allowed else tokens, now)
+
+        if not allowed:
+            LOG_RECORDS_DROPPED.labels(reason="rate_limited").inc()
+        return allowed
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the caller.
+
+    Only the message is rendered on the calling thread (and only for records
+    that pass the level and filters); serialization and the stdout write
+    happen on the listener thread. When the queue is full the record is
+    dropped and counted instead of stalling the event loop.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Tracebacks can't cross threads safely; render them here
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.labels(reason="queue_full").inc()
+
+
+def build_formatter(json_logs: bool) -> logging.Formatter:
+    """JSON formatter (one object per line) or the plain text format."""
+    if json_logs:
+        return jsonlogger.JsonFormatter(JSON_FORMAT, rename_fields={"asctime": "timestamp", "levelname": "level"})
+    return logging.Formatter(TEXT_FORMAT)
+
+
+def configure_logging(
+    level: str = "INFO",
+    json_logs: bool = True,
+    queue_size: int = 10000,
+    rate: float = 50.0,
+    burst: int = 200
+) -> QueueListener:
+    """
+    Route all logging through a bounded queue to a stdout writer thread.
+
+    Replaces any handlers on the root logger and on uvicorn's loggers. The
+    listener is stopped (and the queue flushed) at interpreter exit.
+
+    Args:
+        level: Root log level
+        json_logs: Write JSON lines instead of plain text
+        queue_size: Records buffered before new ones are dropped
+        rate: Records per second per logger below WARNING (0 disables rate limiting)
+        burst: Burst size per logger
+
+    Returns:
+        Running queue listener
+    """
+    records: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue(maxsize=queue_size)
+
+    queue_handler = DroppingQueueHandler(records)
+    queue_handler.addFilter(RateLimitFilter(rate, burst))
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(build_formatter(json_logs))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level.upper())
+
+    # Send uvicorn's server and access logs through the same queue
+    for name in SERVER_LOGGERS:
+        server_logger = logging.getLogger(name)
+        server_logger.handlers.clear()
+        server_logger.propagate = True
+
+    listener = QueueListener(records, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -1,62 +1,79 @@
 """Main API application - Entry point."""
 
+import hmac
 import logging
-import sys
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 
-import httpx
-from fastapi import FastAPI, HTTPException, Header, Request
+from fastapi import Depends, FastAPI, HTTPException, Header, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from prometheus_client import Counter, Histogram, generate_latest
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from starlette.responses import Response
 
 from app import __version__
+from app.compression import CompressionMiddleware
 from app.config import get_settings
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
+from app.logging_config import configure_logging
+from app.metrics import render_metrics
+from app.middleware import MetricsMiddleware, VersionHeadersMiddleware
+from app.profiler import ProfileInProgress, dump_tasks, sampler
+from app.services.http_client import (
+    create_http_client,
+    get_http_client,
+    prewarm_http_client,
+    update_pool_metrics,
 )
-logger = logging.getLogger(__name__)
+from app.services.health import health_prober
+from app.services.version_info import version_info
+from app.tracing import TracingMiddleware, configure_tracing
 
 settings = get_settings()
 
-# Prometheus metrics
-REQUEST_COUNT = Counter(
-    'main_api_requests_total',
-    'Total request count',
-    ['method', 'endpoint', 'status']
-)
-REQUEST_DURATION = Histogram(
-    'main_api_request_duration_seconds',
-    'Request duration in seconds',
-    ['method', 'endpoint']
+# Configure logging: records are queued and written as JSON by a background thread
+configure_logging(
+    level=settings.log_level,
+    json_logs=settings.log_json,
+    queue_size=settings.log_queue_size,
+    rate=settings.log_rate_limit_per_second,
+    burst=settings.log_rate_limit_burst
 )
+logger = logging.getLogger(__name__)
 
+if settings.tracing_enabled:
+    configure_tracing(
+        service_name="main-api",
+        service_version=settings.app_version,
+        exporter=settings.tracing_exporter,
+        otlp_endpoint=settings.tracing_otlp_endpoint,
+        file_path=settings.tracing_file_path,
+        sample_ratio=settings.tracing_sample_ratio
+    )
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan."""
-    logger.info(f"Starting {settings.app_name} v{settings.app_version}")
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"Auxiliary Service URL: {settings.auxiliary_service_url}")
+    logger.info("Starting %s v%s", settings.app_name, settings.app_version)
+    logger.info("Environment: %s", settings.environment)
+    logger.info("Auxiliary Service URL: %s", settings.auxiliary_service_url)
     
-    # Startup: Create HTTP client
-    app.state.http_client = httpx.AsyncClient(
-        timeout=settings.auxiliary_service_timeout,
-        follow_redirects=True
-    )
+    # Startup: Create shared HTTP client and open connections ahead of traffic
+    app.state.http_client = create_http_client()
+    await prewarm_http_client(app.state.http_client, settings.auxiliary_service_prewarm_connections)
+    
+    # Keep the auxiliary service version fresh in the background
+    version_info.start(app.state.http_client)
+    
+    # Check dependencies in the background; probes only read the results
+    health_prober.start()
     
     yield
     
-    # Shutdown: Close HTTP client
+    # Shutdown: Stop background tasks and close HTTP client
+    await health_prober.stop()
+    await version_info.stop()
     await app.state.http_client.aclose()
-    logger.info(f"Shutting down {settings.app_name}")
+    logger.info("Shutting down %s", settings.app_name)
 
 
 # Create FastAPI app
@@ -65,10 +82,23 @@ app = FastAPI(
     version=settings.app_version,
     description="Main API for AWS resources management via Auxiliary Service",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
+
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        levels={
+            "gzip": settings.compression_gzip_level,
+            "br": settings.compression_brotli_quality,
+            "zstd": settings.compression_zstd_level
+        }
+    )
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -79,62 +109,29 @@ app.add_middleware(
 )
 
 
-@app.middleware("http")
-async def add_version_headers(request: Request, call_next):
-    """Add version information to all responses."""
-    response = await call_next(request)
-    response.headers["X-Main-API-Version"] = settings.app_version
-    
-    # Try to get auxiliary service version
-    try:
-        aux_version = await get_auxiliary_version()
-        response.headers["X-Auxiliary-Service-Version"] = aux_version
-    except Exception as e:
-        logger.warning(f"Could not retrieve auxiliary service version: {e}")
-        response.headers["X-Auxiliary-Service-Version"] = "unknown"
-    
-    return response
-
-
-@app.middleware("http")
-async def metrics_middleware(request: Request, call_next):
-    """Record metrics for each request."""
-    method = request.method
-    path = request.url.path
-    
-    with REQUEST_DURATION.labels(method=method, endpoint=path).time():
-        response = await call_next(request)
-    
-    REQUEST_COUNT.labels(
-        method=method,
-        endpoint=path,
-        status=response.status_code
-    ).inc()
-    
-    return response
+def version_headers() -> Dict[str, str]:
+    """Version information added to all responses."""
+    return {
+        "X-Main-API-Version": settings.app_version,
+        # Cached value, never blocks on the auxiliary service
+        "X-Auxiliary-Service-Version": version_info.version
+    }
 
 
-async def get_auxiliary_version() -> str:
-    """Get version from auxiliary service."""
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{settings.auxiliary_service_url}/version")
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("version", "unknown")
-    except Exception as e:
-        logger.error(f"Error getting auxiliary service version: {e}")
-    return "unknown"
+# Pure ASGI middleware: headers are set on the response start message and
+# bodies stream through untouched. Added last, so metrics and the request
+# span wrap everything.
+app.add_middleware(VersionHeadersMiddleware, headers=version_headers)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
 
 
-async def add_version_info(data: Dict) -> Dict:
+def add_version_info(data: Dict) -> Dict:
     """Add version information to response data."""
-    aux_version = await get_auxiliary_version()
-    
     return {
         **data,
         "main_api_version": settings.app_version,
-        "auxiliary_service_version": aux_version
+        "auxiliary_service_version": version_info.version
     }
 
 
@@ -148,36 +145,76 @@ app.include_router(
 )
 
 
+async def check_auxiliary_service() -> None:
+    """
+    Dependency check: the auxiliary service answers its readiness probe.
+    
+    Raises:
+        Exception: If the auxiliary service is unreachable or not ready
+    """
+    client = get_http_client(app)
+    if client is None:
+        raise RuntimeError("HTTP client not initialized")
+    
+    response = await client.get(f"{settings.auxiliary_service_url}/health/ready")
+    if response.status_code != 200:
+        raise RuntimeError(f"Auxiliary service not ready (HTTP {response.status_code})")
+    version_info.observe(response.json().get("version"))
+
+
+health_prober.register("auxiliary_service", check_auxiliary_service)
+
+
+@app.get("/health/live", tags=["Health"])
+async def liveness():
+    """Liveness probe: the process is serving requests. Checks no dependencies."""
+    return {
+        "status": "alive",
+        "main_api_version": settings.app_version,
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    }
+
+
+@app.get("/health/ready", tags=["Health"])
+async def readiness():
+    """Readiness probe: cached results of the background dependency checks."""
+    await health_prober.ensure_checked()
+    ready = health_prober.is_ready
+    
+    return ORJSONResponse(
+        content={
+            "status": "ready" if ready else "not_ready",
+            "main_api_version": settings.app_version,
+            "checks": {name: result.to_dict() for name, result in health_prober.results.items()},
+            "timestamp": datetime.utcnow().isoformat() + "Z"
+        },
+        status_code=200 if ready else 503
+    )
+
+
 @app.get("/health", tags=["Health"])
 async def health_check():
-    """Health check endpoint."""
-    aux_version = await get_auxiliary_version()
-    
-    # Check connectivity to auxiliary service
-    auxiliary_healthy = False
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{settings.auxiliary_service_url}/health")
-            auxiliary_healthy = response.status_code == 200
-    except Exception as e:
-        logger.error(f"Auxiliary service health check failed: {e}")
+    """Health check endpoint, served from the background dependency checks."""
+    await health_prober.ensure_checked()
+    auxiliary_check = health_prober.results.get("auxiliary_service")
+    auxiliary_healthy = health_prober.is_ready and auxiliary_check is not None and auxiliary_check.healthy
     
     health_status = {
         "status": "healthy" if auxiliary_healthy else "degraded",
         "main_api_version": settings.app_version,
-        "auxiliary_service_version": aux_version,
+        "auxiliary_service_version": version_info.version,
         "auxiliary_service_healthy": auxiliary_healthy,
         "timestamp": datetime.utcnow().isoformat() + "Z"
     }
     
     status_code = 200 if auxiliary_healthy else 503
-    return JSONResponse(content=health_status, status_code=status_code)
+    return ORJSONResponse(content=health_status, status_code=status_code)
 
 
 @app.get("/version", tags=["Info"])
 async def get_version():
     """Get API version information."""
-    return await add_version_info({
+    return add_version_info({
         "service": settings.app_name,
         "version": settings.app_version,
         "environment": settings.environment
@@ -185,18 +222,67 @@ async def get_version():
 
 
 @app.get("/metrics", tags=["Monitoring"])
-async def metrics():
-    """Prometheus metrics endpoint."""
+async def metrics(request: Request):
+    """Prometheus metrics endpoint (aggregated across workers in multiprocess mode)."""
+    update_pool_metrics(get_http_client(request.app))
+    
     return Response(
-        content=generate_latest(),
+        content=render_metrics(),
         media_type="text/plain"
     )
 
 
+def require_debug_endpoints(x_debug_token: Optional[str] = Header(None)) -> None:
+    """
+    Guard for /debug/* endpoints.
+    
+    Raises:
+        HTTPException: 404 if debug endpoints are disabled, 403 if the debug token does not match
+    """
+    if not settings.debug_endpoints_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if settings.debug_token and not hmac.compare_digest(x_debug_token or "", settings.debug_token):
+        raise HTTPException(status_code=403, detail="Invalid debug token")
+
+
+@app.get("/debug/profile", tags=["Debug"], dependencies=[Depends(require_debug_endpoints)])
+async def debug_profile(
+    seconds: float = Query(10.0, gt=0, le=settings.debug_profile_max_seconds, description="Sampling duration"),
+    format: str = Query("collapsed", pattern="^(collapsed|speedscope)$", description="collapsed or speedscope")
+):
+    """
+    Sample the stacks of all threads (event loop and worker threads) for a while.
+    
+    Returns:
+        Collapsed stacks as text (for flamegraph.pl or speedscope), or a speedscope JSON document
+    
+    Raises:
+        HTTPException: 409 if another profile is already running
+    """
+    try:
+        profile = await sampler.profile(seconds, settings.debug_profile_interval)
+    except ProfileInProgress as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
+    if format == "speedscope":
+        return ORJSONResponse(
+            content=profile.to_speedscope(f"main-api ({seconds:g}s)"),
+            headers={"Content-Disposition": 'attachment; filename="main-api.speedscope.json"'}
+        )
+    return PlainTextResponse(profile.to_collapsed())
+
+
+@app.get("/debug/tasks", tags=["Debug"], dependencies=[Depends(require_debug_endpoints)])
+async def debug_tasks(limit: Optional[int] = Query(None, ge=1, description="Innermost frames per task")):
+    """List pending asyncio tasks with the chain of coroutines each one is waiting in."""
+    tasks = dump_tasks(limit)
+    return {"count": len(tasks), "tasks": tasks}
+
+
 @app.get("/", tags=["Info"])
 async def root():
     """Root endpoint with API information."""
-    return await add_version_info({
+    return add_version_info({
         "message": f"Welcome to {settings.app_name}",
         "version": settings.app_version,
         "docs": "/docs",
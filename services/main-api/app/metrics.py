@@ -0,0 +1,112 @@
+"""Request metrics - Prometheus metrics labelled by route template, aggregated across workers."""
+
+import glob
+import os
+from typing import List, MutableMapping, Optional
+
+from prometheus_client import CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+
+# Label for requests that matched no route (404 scans, typos)
+UNMATCHED_ROUTE = "unmatched"
+
+# Response sizes in bytes, 256 B to 16 MiB
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Prometheus metrics
+REQUEST_COUNT = Counter(
+    'main_api_requests_total',
+    'Total request count',
+    ['method', 'endpoint', 'status']
+)
+REQUEST_DURATION = Histogram(
+    'main_api_request_duration_seconds',
+    'Request duration in seconds',
+    ['method', 'endpoint']
+)
+RESPONSE_SIZE = Histogram(
+    'main_api_response_size_bytes',
+    'Response body size in bytes as sent on the wire',
+    ['method', 'endpoint'],
+    buckets=SIZE_BUCKETS
+)
+
+
+def multiprocess_dir() -> Optional[str]:
+    """
+    Shared metrics directory, set when several worker processes serve the app.
+
+    prometheus_client reads PROMETHEUS_MULTIPROC_DIR at import time and then
+    keeps every metric value in per-process files there instead of memory.
+    """
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or None
+
+
+def render_metrics() -> bytes:
+    """
+    Render metrics in the Prometheus text format.
+
+    In multiprocess mode the values of every worker are read from the shared
+    directory and aggregated: counters and histograms are summed (including
+    those of exited workers, so totals stay monotonic), gauges are combined
+    according to their multiprocess_mode.
+
+    Returns:
+        Exposition text for the /metrics endpoint
+    """
+    path = multiprocess_dir()
+    if path is None:
+        return generate_latest()
+
+    mark_dead_workers(path)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=path)
+    return generate_latest(registry)
+
+
+def mark_dead_workers(path: str) -> List[int]:
+    """
+    Remove the live-gauge files of worker processes that no longer exist.
+
+    Args:
+        path: Shared metrics directory
+
+    Returns:
+        PIDs of the workers found dead
+    """
+    dead = set()
+    for file in glob.glob(os.path.join(path, "gauge_live*_*.db")):
+        pid = int(os.path.basename(file)[:-len(".db")].rsplit("_", 1)[1])
+        if not _is_alive(pid):
+            dead.add(pid)
+
+    for pid in sorted(dead):
+        multiprocess.mark_process_dead(pid, path)
+    return sorted(dead)
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def route_template(scope: MutableMapping) -> str:
+    """
+    Path template of the route that handled a request, e.g. "/api/v1/s3/buckets/{bucket}/objects".
+
+    Using the template instead of the raw path keeps label cardinality
+    bounded by the number of routes, whatever clients send.
+
+    Args:
+        scope: ASGI scope after routing
+
+    Returns:
+        Route template, or UNMATCHED_ROUTE if no route matched
+    """
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or UNMATCHED_ROUTE
+
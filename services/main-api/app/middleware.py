@@ -0,0 +1,90 @@
+"""ASGI middleware - Request metrics, timing and version headers without BaseHTTPMiddleware."""
+
+import time
+from typing import Callable, Dict
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import server_timing
+from app.metrics import REQUEST_COUNT, REQUEST_DURATION, RESPONSE_SIZE, route_template
+
+
+class VersionHeadersMiddleware:
+    """
+    Add version headers to every HTTP response.
+
+    Headers are injected into the http.response.start message, so the body
+    (streamed or not) passes through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, headers: Callable[[], Dict[str, str]]):
+        """
+        Wrap an ASGI app.
+
+        Args:
+            app: Inner ASGI app
+            headers: Returns the headers to add; called once per response so values can change at runtime
+        """
+        self.app = app
+        self.headers = headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in self.headers().items():
+                    response_headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class MetricsMiddleware:
+    """
+    Record request count, duration and response size, labelled by route template.
+
+    Duration covers the whole response, including the body of streaming
+    responses; the size is what was actually sent. Phases recorded during
+    the request (see app.server_timing) and the time until the response
+    started ("app") are reported to the client in a Server-Timing header.
+    Requests that fail before a response starts are counted with status
+    500; requests cancelled mid-response keep the status that had been sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        timing = server_timing.start()
+        status = 500
+        size = 0
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timing.record("app", time.perf_counter() - start)
+                MutableHeaders(scope=message).append("Server-Timing", timing.header_value())
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            # Routing has filled in the matched route by now
+            method = scope["method"]
+            endpoint = route_template(scope)
+            REQUEST_DURATION.labels(method=method, endpoint=endpoint).observe(time.perf_counter() - start)
+            REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status).inc()
+            RESPONSE_SIZE.labels(method=method, endpoint=endpoint).observe(size)
@@ -1,30 +1,119 @@
 """AWS Resources router - Handles all AWS-related endpoints."""
 
 import logging
-from typing import Optional
+import math
+from typing import List, Optional
 
 import httpx
-from fastapi import APIRouter, HTTPException, Request, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Path, Request, Response, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 
 from app.config import get_settings
+from app import server_timing
+from app.metrics import route_template
+from app.services.circuit_breaker import CircuitOpenError
+from app.services.http_client import (
+    UpstreamResponse,
+    get_http_client,
+    send_through_breaker,
+    send_upstream,
+)
+from app.services.response_cache import CachePolicy, response_cache
+from app.services.single_flight import SingleFlight
+from app.services.version_info import version_info
+from app.tracing import inject_trace_headers, start_span
+from app.utils import build_request_key, derive_etag, etag_matches, splice_json_fields
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 router = APIRouter()
 
+# Shared in-flight upstream calls
+single_flight = SingleFlight()
 
-async def call_auxiliary_service(request: Request, endpoint: str, params: dict = None) -> dict:
+# Freshness policy per cached route
+CACHE_POLICIES = {
+    "s3_buckets": CachePolicy(
+        ttl=settings.cache_s3_buckets_ttl,
+        stale_while_revalidate=settings.cache_stale_while_revalidate,
+        stale_if_error=settings.cache_stale_if_error
+    ),
+    "parameters": CachePolicy(
+        ttl=settings.cache_parameters_ttl,
+        stale_while_revalidate=settings.cache_stale_while_revalidate,
+        stale_if_error=settings.cache_stale_if_error
+    ),
+    "parameter_value": CachePolicy(
+        ttl=settings.cache_parameter_value_ttl,
+        stale_while_revalidate=settings.cache_stale_while_revalidate,
+        stale_if_error=settings.cache_stale_if_error,
+        private=True
+    ),
+}
+
+
+async def call_auxiliary_service(
+    request: Request,
+    endpoint: str,
+    params: dict = None,
+    etag: Optional[str] = None
+) -> UpstreamResponse:
+    """
+    Call the auxiliary service, coalescing concurrent identical requests.
+    
+    Requests for the same endpoint, params and validator that arrive while
+    one is already in flight wait for that call instead of issuing their own.
+    
+    Args:
+        request: FastAPI request object (to access http_client)
+        endpoint: Endpoint path on auxiliary service
+        params: Query parameters
+        etag: ETag of a cached copy, sent as If-None-Match
+    
+    Returns:
+        Response data and ETag from auxiliary service
+    
+    Raises:
+        HTTPException: If auxiliary service call fails
+    """
+    key = build_request_key(endpoint, params)
+    if etag:
+        key = f"{key}#{etag}"
+    
+    return await single_flight.do(
+        key,
+        lambda: fetch_auxiliary_service(request, endpoint, params, etag=etag),
+        label=endpoint
+    )
+
+
+async def fetch_auxiliary_service(
+    request: Request,
+    endpoint: str,
+    params: dict = None,
+    method: str = "GET",
+    json: dict = None,
+    etag: Optional[str] = None
+) -> UpstreamResponse:
     """
     Call the auxiliary service and return the response.
     
+    The call runs in a client span whose W3C trace context is sent along,
+    and the auxiliary service's Server-Timing phases are relayed as "aux-*".
+    
     Args:
         request: FastAPI request object (to access http_client)
         endpoint: Endpoint path on auxiliary service
         params: Query parameters
+        method: HTTP method
+        json: JSON request body
+        etag: ETag of a cached copy, sent as If-None-Match
     
     Returns:
-        Response data from auxiliary service
+        Response data and ETag from auxiliary service (no data if not modified)
     
     Raises:
         HTTPException: If auxiliary service call fails
@@ -32,91 +121,351 @@ async def call_auxiliary_service(request: Request, endpoint: str, params: dict =
     url = f"{settings.auxiliary_service_url}{endpoint}"
     
     try:
-        logger.info(f"Calling auxiliary service: {url}")
-        client = request.app.state.http_client
+        logger.debug("Calling auxiliary service: %s", url)
+        client = get_http_client(request.app)
+        if client is None:
+            raise RuntimeError("HTTP client not initialized")
+        
+        with start_span(f"{method} auxiliary-service", kind="client", attributes={"http.url": url}) as span:
+            headers = inject_trace_headers({"If-None-Match": etag} if etag else None)
+            response = await send_upstream(
+                client,
+                method,
+                url,
+                params=params,
+                json=json,
+                headers=headers,
+                extensions={"endpoint": route_template(request.scope)}
+            )
+            span.set_attribute("http.status_code", response.status_code)
+        version_info.observe(response.headers.get("X-Auxiliary-Service-Version"))
+        server_timing.relay(response.headers.get("Server-Timing"), prefix="aux-")
+        
+        if response.status_code == 304:
+            return UpstreamResponse(data=None, etag=response.headers.get("ETag", etag), not_modified=True)
         
-        response = await client.get(url, params=params)
         response.raise_for_status()
         
-        return response.json()
+        return UpstreamResponse(data=orjson.loads(response.content), etag=response.headers.get("ETag"))
+    
+    except Exception as e:
+        raise upstream_error(e, url)
+
+
+async def stream_auxiliary_service(
+    request: Request,
+    endpoint: str,
+    params: dict = None,
+    splice_version: bool = True
+) -> StreamingResponse:
+    """
+    Stream an auxiliary service response to the client without decoding it.
+    
+    Upstream bytes are relayed as they arrive, so memory use does not grow
+    with the payload size. The body is requested uncompressed, so
+    main_api_version can always be spliced into a JSON envelope on the fly;
+    CompressionMiddleware then compresses the relayed stream for the client
+    according to its own Accept-Encoding.
     
-    except httpx.TimeoutException:
-        logger.error(f"Timeout calling auxiliary service: {url}")
-        raise HTTPException(
+    Args:
+        request: FastAPI request object (to access http_client)
+        endpoint: Endpoint path on auxiliary service
+        params: Query parameters
+        splice_version: Whether to add main_api_version to a JSON object body
+    
+    Returns:
+        Streaming response relaying the upstream body
+    
+    Raises:
+        HTTPException: If auxiliary service call fails before the body starts
+    """
+    url = f"{settings.auxiliary_service_url}{endpoint}"
+    
+    try:
+        logger.debug("Streaming from auxiliary service: %s", url)
+        client = get_http_client(request.app)
+        if client is None:
+            raise RuntimeError("HTTP client not initialized")
+        
+        with start_span("GET auxiliary-service", kind="client", attributes={"http.url": url}) as span:
+            upstream_request = client.build_request(
+                "GET",
+                url,
+                params=params,
+                headers=inject_trace_headers({"Accept-Encoding": "identity"}),
+                extensions={"endpoint": route_template(request.scope)}
+            )
+            upstream = await send_through_breaker(client, upstream_request, stream=True)
+            span.set_attribute("http.status_code", upstream.status_code)
+        version_info.observe(upstream.headers.get("X-Auxiliary-Service-Version"))
+        server_timing.relay(upstream.headers.get("Server-Timing"), prefix="aux-")
+        
+        if upstream.is_error:
+            await upstream.aread()
+            await upstream.aclose()
+            upstream.raise_for_status()
+    
+    except Exception as e:
+        raise upstream_error(e, url)
+    
+    headers = {}
+    # Decoded, in case the upstream compressed the body regardless
+    body = upstream.aiter_bytes()
+    
+    if splice_version:
+        body = splice_json_fields(body, {"main_api_version": settings.app_version})
+    elif "content-length" in upstream.headers and "content-encoding" not in upstream.headers:
+        headers["Content-Length"] = upstream.headers["content-length"]
+    
+    async def relay():
+        try:
+            async for chunk in body:
+                yield chunk
+        finally:
+            await upstream.aclose()
+    
+    return StreamingResponse(
+        relay(),
+        status_code=upstream.status_code,
+        media_type=upstream.headers.get("content-type"),
+        headers=headers
+    )
+
+
+def upstream_error(e: Exception, url: str) -> HTTPException:
+    """
+    Map a failed auxiliary service call to the error returned to the client.
+    
+    Args:
+        e: Exception raised while calling the auxiliary service
+        url: URL that was called
+    
+    Returns:
+        HTTPException to raise
+    """
+    if isinstance(e, HTTPException):
+        return e
+    
+    if isinstance(e, CircuitOpenError):
+        logger.warning("Auxiliary service circuit open, rejecting call: %s", url)
+        return HTTPException(
+            status_code=503,
+            detail="Auxiliary service unavailable (circuit open)",
+            headers={"Retry-After": str(math.ceil(e.retry_after))}
+        )
+    
+    if isinstance(e, httpx.TimeoutException):
+        logger.error("Timeout calling auxiliary service: %s", url)
+        return HTTPException(
             status_code=504,
             detail="Auxiliary service timeout"
         )
     
-    except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error from auxiliary service: {e.response.status_code} - {e.response.text}")
-        raise HTTPException(
+    if isinstance(e, httpx.HTTPStatusError):
+        logger.error("HTTP error from auxiliary service: %s - %s", e.response.status_code, e.response.text)
+        return HTTPException(
             status_code=e.response.status_code,
             detail=f"Auxiliary service error: {e.response.text}"
         )
     
-    except httpx.RequestError as e:
-        logger.error(f"Request error calling auxiliary service: {str(e)}")
-        raise HTTPException(
+    if isinstance(e, httpx.RequestError):
+        logger.error("Request error calling auxiliary service: %s", e)
+        return HTTPException(
             status_code=503,
             detail=f"Cannot reach auxiliary service: {str(e)}"
         )
     
-    except Exception as e:
-        logger.error(f"Unexpected error calling auxiliary service: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal error: {str(e)}"
-        )
+    logger.error("Unexpected error calling auxiliary service: %s", e)
+    return HTTPException(
+        status_code=500,
+        detail=f"Internal error: {str(e)}"
+    )
+
+
+def render_body(data: dict) -> bytes:
+    """Serialize an auxiliary service body as sent to clients, with the main API version."""
+    return orjson.dumps({**data, "main_api_version": settings.app_version}, option=orjson.OPT_NON_STR_KEYS)
+
+
+async def cached_call_auxiliary_service(
+    request: Request,
+    response: Response,
+    route: str,
+    endpoint: str,
+    params: dict = None,
+    cache: bool = True
+) -> Response:
+    """
+    Call the auxiliary service through the response cache.
+    
+    Sets Cache-Control, Age, X-Cache and ETag headers on the outgoing
+    response, and answers 304 when the client's If-None-Match matches.
+    Cache hits are sent as the stored bytes, without any JSON work.
+    
+    Args:
+        request: FastAPI request object (to access http_client)
+        response: FastAPI response object (to set cache headers)
+        route: Name of the cached route (key of CACHE_POLICIES)
+        endpoint: Endpoint path on auxiliary service
+        params: Query parameters
+        cache: Whether the response may be kept in the cache (if False it is
+            fetched every time and marked no-store)
+    
+    Returns:
+        JSON response with version information, or an empty 304 response
+    
+    Raises:
+        HTTPException: If auxiliary service call fails and no stale data can be served
+    """
+    if not cache:
+        upstream = await call_auxiliary_service(request, endpoint, params)
+        body, data, upstream_etag = None, upstream.data, upstream.etag
+        response.headers["Cache-Control"] = "no-store"
+    elif settings.response_cache_enabled:
+        policy = CACHE_POLICIES[route]
+        with start_span("response_cache", attributes={"cache.route": route}) as span:
+            result = await response_cache.get_or_fetch(
+                build_request_key(endpoint, params),
+                policy,
+                lambda etag: call_auxiliary_service(request, endpoint, params, etag=etag),
+                route,
+                render_body
+            )
+            span.set_attribute("cache.result", result.result)
+        body, data, upstream_etag = result.body, None, result.etag
+        
+        response.headers["Cache-Control"] = policy.cache_control()
+        response.headers["Age"] = str(result.age)
+        response.headers["X-Cache"] = result.result.upper()
+    else:
+        upstream = await call_auxiliary_service(request, endpoint, params)
+        body, data, upstream_etag = None, upstream.data, upstream.etag
+    
+    if upstream_etag:
+        etag = derive_etag(upstream_etag, settings.app_version)
+        response.headers["ETag"] = etag
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=dict(response.headers))
+    
+    # Uncached bodies are only serialized once the 304 case is ruled out
+    if body is None:
+        body = render_body(data)
+    return Response(content=body, media_type="application/json", headers=dict(response.headers))
 
 
 @router.get("/s3/buckets")
-async def list_s3_buckets(request: Request):
+async def list_s3_buckets(
+    request: Request,
+    response: Response,
+    details: bool = Query(False, description="Add region, tags, versioning and encryption per bucket")
+):
     """
     List all S3 buckets in the AWS account.
     
+    Args:
+        details: Whether to include per-bucket details (fields that could not
+            be looked up are reported under each bucket's details.errors)
+    
     Returns:
         JSON response with list of buckets and version information
     """
-    logger.info("Listing S3 buckets")
+    logger.info("Listing S3 buckets (details: %s)", details)
+    params = {"details": True} if details else None
     
-    data = await call_auxiliary_service(request, "/aws/s3/buckets")
+    if settings.proxy_streaming_enabled:
+        return await stream_auxiliary_service(request, "/aws/s3/buckets", params)
     
-    # Add main API version
-    return {
-        **data,
-        "main_api_version": settings.app_version
-    }
+    return await cached_call_auxiliary_service(request, response, "s3_buckets", "/aws/s3/buckets", params)
+
+
+@router.get("/s3/buckets/{bucket}/objects")
+async def list_s3_objects(
+    request: Request,
+    bucket: str = Path(..., min_length=3, max_length=63, pattern=r"^[a-z0-9][a-z0-9.-]*[a-z0-9]$"),
+    prefix: Optional[str] = Query(None, description="Only list keys starting with this prefix"),
+    delimiter: Optional[str] = Query(None, description="Group keys up to this delimiter into prefixes"),
+    start_after: Optional[str] = Query(None, description="Start listing after this key"),
+    continuation_token: Optional[str] = Query(None, description="Resume a listing from a continuation_token line"),
+    page_size: int = Query(1000, ge=1, le=1000, description="Keys per AWS page")
+):
+    """
+    Stream the objects of an S3 bucket as NDJSON.
+    
+    The auxiliary service writes one line per object as list_objects_v2
+    pages arrive, plus a continuation_token line after each page that can
+    be passed back to resume the listing. The stream is relayed without
+    being buffered, so memory stays flat regardless of the bucket size.
+    
+    Args:
+        bucket: Bucket name
+        prefix: Key prefix filter
+        delimiter: Delimiter for grouping keys into prefixes
+        start_after: Key to start after
+        continuation_token: Token to resume from
+        page_size: Keys per AWS page
+    
+    Returns:
+        Streaming NDJSON response
+    """
+    logger.info("Streaming objects of bucket: %s", bucket)
+    
+    params = {"page_size": page_size}
+    for name, value in (
+        ("prefix", prefix),
+        ("delimiter", delimiter),
+        ("start_after", start_after),
+        ("continuation_token", continuation_token)
+    ):
+        if value:
+            params[name] = value
+    
+    return await stream_auxiliary_service(
+        request, f"/aws/s3/buckets/{bucket}/objects", params, splice_version=False
+    )
 
 
 @router.get("/parameters")
-async def list_parameters(request: Request, path_prefix: Optional[str] = Query(None, description="Filter parameters by path prefix")):
+async def list_parameters(
+    request: Request,
+    response: Response,
+    path_prefix: Optional[str] = Query(None, description="Filter parameters by path prefix"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of parameters to return"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by a previous call")
+):
     """
-    List all parameters in AWS Systems Manager Parameter Store.
+    List parameters in AWS Systems Manager Parameter Store.
+    
+    Without limit or cursor all parameters are returned. Otherwise one page
+    is returned, with next_cursor set while more parameters remain.
     
     Args:
         path_prefix: Optional filter to list parameters under a specific path
+        limit: Optional page size
+        cursor: Optional cursor to continue a previous listing
     
     Returns:
         JSON response with list of parameters and version information
     """
-    logger.info(f"Listing parameters (prefix: {path_prefix})")
+    logger.info("Listing parameters (prefix: %s)", path_prefix)
     
     params = {}
     if path_prefix:
         params["path_prefix"] = path_prefix
+    if limit is not None:
+        params["limit"] = limit
+    if cursor:
+        params["cursor"] = cursor
     
-    data = await call_auxiliary_service(request, "/aws/parameters", params)
+    if settings.proxy_streaming_enabled:
+        return await stream_auxiliary_service(request, "/aws/parameters", params)
     
-    # Add main API version
-    return {
-        **data,
-        "main_api_version": settings.app_version
-    }
+    return await cached_call_auxiliary_service(request, response, "parameters", "/aws/parameters", params)
 
 
 @router.get("/parameters/value")
 async def get_parameter_value(
     request: Request,
+    response: Response,
     name: str = Query(..., description="Name of the parameter to retrieve"),
     decrypt: bool = Query(True, description="Decrypt secure string parameters")
 ):
@@ -130,17 +479,86 @@ async def get_parameter_value(
     Returns:
         JSON response with parameter details and version information
     """
-    logger.info(f"Getting parameter value: {name}")
+    logger.info("Getting parameter value: %s", name)
     
     params = {
         "name": name,
         "decrypt": str(decrypt).lower()
     }
     
-    data = await call_auxiliary_service(request, "/aws/parameters/value", params)
+    # Decrypted values are not kept here: the auxiliary service already
+    # caches them briefly (PARAMETER_CACHE_SECURE_TTL) and never serves them stale
+    return await cached_call_auxiliary_service(
+        request, response, "parameter_value", "/aws/parameters/value", params, cache=not decrypt
+    )
+
+
+@router.get("/parameters/by-path")
+async def get_parameters_by_path(
+    request: Request,
+    path: str = Query(..., description="Hierarchy path, e.g. /app/prod/"),
+    recursive: bool = Query(True, description="Include parameters in nested paths"),
+    decrypt: bool = Query(True, description="Decrypt secure string parameters")
+):
+    """
+    Stream every parameter (with its value) under a path as NDJSON.
+    
+    The auxiliary service response is relayed page by page without being
+    buffered, so memory stays bounded regardless of the subtree size.
+    
+    Args:
+        path: Hierarchy path
+        recursive: Whether to include nested paths
+        decrypt: Whether to decrypt SecureString parameters
+    
+    Returns:
+        Streaming NDJSON response
+    """
+    logger.info("Streaming parameters by path: %s", path)
+    
+    params = {
+        "path": path,
+        "recursive": str(recursive).lower(),
+        "decrypt": str(decrypt).lower()
+    }
+    
+    return await stream_auxiliary_service(request, "/aws/parameters/by-path", params, splice_version=False)
+
+
+class ParameterValuesRequest(BaseModel):
+    """Request body for batch parameter retrieval."""
+
+    names: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.parameter_values_max_names,
+        description="Names of the parameters to retrieve"
+    )
+    decrypt: bool = Field(True, description="Decrypt secure string parameters")
+
+
+@router.post("/parameters/values")
+async def get_parameter_values(request: Request, body: ParameterValuesRequest):
+    """
+    Get the values of several parameters in a single round trip.
+    
+    Args:
+        body: Parameter names and decryption flag
+    
+    Returns:
+        JSON response with found parameters, invalid_parameters and version information
+    """
+    logger.info("Getting %s parameter values", len(body.names))
+    
+    upstream = await fetch_auxiliary_service(
+        request,
+        "/aws/parameters/values",
+        method="POST",
+        json=body.model_dump()
+    )
     
     # Add main API version
     return {
-        **data,
+        **upstream.data,
         "main_api_version": settings.app_version
     }
@@ -0,0 +1,79 @@
+"""Server-Timing - Per-request phase durations reported to clients in the Server-Timing header."""
+
+import threading
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+_current: ContextVar[Optional["ServerTiming"]] = ContextVar("server_timing", default=None)
+
+
+class ServerTiming:
+    """
+    Durations of the phases of one request.
+
+    Repeated phases (e.g. several upstream calls) are summed and counted.
+    Recording is thread-safe, since phases are also recorded from executor
+    threads running in a copy of the request's context.
+    """
+
+    def __init__(self):
+        self._phases: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add the duration of one phase."""
+        with self._lock:
+            total = self._phases.setdefault(name, [0.0, 0])
+            total[0] += seconds * 1000
+            total[1] += 1
+
+    def relay(self, header: Optional[str], prefix: str) -> None:
+        """
+        Add the entries of a downstream Server-Timing header.
+
+        Args:
+            header: Server-Timing header value of a downstream response
+            prefix: Prefix for the relayed phase names, e.g. "aux-"
+        """
+        for entry in (header or "").split(","):
+            name, *params = [part.strip() for part in entry.split(";")]
+            for param in params:
+                key, _, value = param.partition("=")
+                if name and key == "dur":
+                    try:
+                        self.record(prefix + name, float(value) / 1000)
+                    except ValueError:
+                        pass
+
+    def header_value(self) -> str:
+        """Server-Timing header value, one entry per phase."""
+        with self._lock:
+            phases = list(self._phases.items())
+        entries = []
+        for name, (duration_ms, count) in phases:
+            entry = f"{name};dur={duration_ms:.1f}"
+            if count > 1:
+                entry += f';desc="{int(count)} calls"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+
+def start() -> ServerTiming:
+    """Begin collecting phases for the current request."""
+    timing = ServerTiming()
+    _current.set(timing)
+    return timing
+
+
+def record(name: str, seconds: float) -> None:
+    """Record a phase duration for the current request, if one is being timed."""
+    timing = _current.get()
+    if timing is not None:
+        timing.record(name, seconds)
+
+
+def relay(header: Optional[str], prefix: str) -> None:
+    """Relay a downstream Server-Timing header into the current request's timing."""
+    timing = _current.get()
+    if timing is not None:
+        timing.relay(header, prefix)
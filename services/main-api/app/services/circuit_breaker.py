@@ -0,0 +1,188 @@
+"""Circuit breaker - Fail fast while an upstream is unhealthy."""
+
+import logging
+import time
+from collections import deque
+from typing import Deque, Tuple
+
+from prometheus_client import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+STATE_VALUES = {CLOSED: 0, OPEN: 1, HALF_OPEN: 2}
+
+# Prometheus metrics
+BREAKER_STATE = Gauge(
+    'main_api_circuit_breaker_state',
+    'Circuit breaker state (0=closed, 1=open, 2=half-open)',
+    ['upstream'],
+    multiprocess_mode='livemax'
+)
+BREAKER_TRANSITIONS = Counter(
+    'main_api_circuit_breaker_transitions_total',
+    'Circuit breaker state transitions',
+    ['upstream', 'from_state', 'to_state']
+)
+BREAKER_REJECTED = Counter(
+    'main_api_circuit_breaker_rejected_total',
+    'Calls rejected without reaching the upstream because the breaker was open',
+    ['upstream']
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected by an open circuit breaker."""
+
+    def __init__(self, upstream: str, retry_after: float):
+        super().__init__(f"Circuit breaker for {upstream} is open")
+        self.upstream = upstream
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Sliding-window circuit breaker for one upstream.
+
+    The breaker opens when, over the last window_size calls (and at least
+    minimum_calls), either the failure rate or the slow-call rate reaches its
+    threshold. After open_duration it lets half_open_max_calls probe calls
+    through: if they all succeed it closes again, otherwise it re-opens.
+    """
+
+    def __init__(
+        self,
+        upstream: str,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: float = 5.0,
+        slow_call_rate_threshold: float = 0.8,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 3
+    ):
+        """
+        Initialize the breaker in the closed state.
+
+        Args:
+            upstream: Upstream name used in metrics and errors
+            failure_rate_threshold: Failure ratio (0-1) that opens the breaker
+            slow_call_duration: Seconds after which a call counts as slow
+            slow_call_rate_threshold: Slow-call ratio (0-1) that opens the breaker
+            window_size: Number of recent calls considered
+            minimum_calls: Calls required in the window before the breaker can open
+            open_duration: Seconds to stay open before probing
+            half_open_max_calls: Probe calls allowed while half-open
+        """
+        self.upstream = upstream
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+
+        BREAKER_STATE.labels(upstream=upstream).set(STATE_VALUES[CLOSED])
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the open period has elapsed."""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_duration:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the breaker is open or all half-open probes are taken
+        """
+        state = self.state
+
+        if state == OPEN:
+            BREAKER_REJECTED.labels(upstream=self.upstream).inc()
+            retry_after = self.open_duration - (time.monotonic() - self._opened_at)
+            raise CircuitOpenError(self.upstream, max(retry_after, 0.0))
+
+        if state == HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                BREAKER_REJECTED.labels(upstream=self.upstream).inc()
+                raise CircuitOpenError(self.upstream, 0.0)
+            self._half_open_calls += 1
+
+    def record(self, success: bool, duration: float) -> None:
+        """
+        Record the outcome of a call that was allowed through.
+
+        Args:
+            success: Whether the upstream answered without a server-side failure
+            duration: Call duration in seconds
+        """
+        slow = duration >= self.slow_call_duration
+
+        if self._state == HALF_OPEN:
+            if not success or slow:
+                self._transition(OPEN)
+                return
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.half_open_max_calls:
+                self._transition(CLOSED)
+            return
+
+        if self._state == OPEN:
+            # Late result of a call started before the breaker opened
+            return
+
+        self._window.append((success, slow))
+        if len(self._window) < self.minimum_calls:
+            return
+
+        failures = sum(1 for ok, _ in self._window if not ok)
+        slow_calls = sum(1 for _, is_slow in self._window if is_slow)
+
+        if (
+            failures / len(self._window) >= self.failure_rate_threshold
+            or slow_calls / len(self._window) >= self.slow_call_rate_threshold
+        ):
+            self._transition(OPEN)
+
+    def release(self) -> None:
+        """Give back a half-open probe slot for a call that never completed (e.g. cancelled)."""
+        if self._state == HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def _transition(self, new_state: str) -> None:
+        """Move to a new state and reset the counters that belong to it."""
+        old_state = self._state
+        if old_state == new_state:
+            return
+
+        self._state = new_state
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+
+        if new_state == OPEN:
+            self._opened_at = time.monotonic()
+        elif new_state == CLOSED:
+            self._window.clear()
+
+        log = logger.warning if new_state == OPEN else logger.info
+        log("Circuit breaker for %s: %s -> %s", self.upstream, old_state, new_state)
+
+        BREAKER_STATE.labels(upstream=self.upstream).set(STATE_VALUES[new_state])
+        BREAKER_TRANSITIONS.labels(
+            upstream=self.upstream,
+            from_state=old_state,
+            to_state=new_state
+        ).inc()
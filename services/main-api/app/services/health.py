@@ -0,0 +1,189 @@
+"""Health prober - Background dependency checks with cached results."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional
+
+from prometheus_client import Gauge, Histogram
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Prometheus metrics
+DEPENDENCY_UP = Gauge(
+    'main_api_dependency_up',
+    'Result of the last background health check (1=healthy, 0=unhealthy)',
+    ['dependency'],
+    multiprocess_mode='livemin'
+)
+HEALTH_CHECK_DURATION = Histogram(
+    'main_api_health_check_duration_seconds',
+    'Duration of background health checks',
+    ['dependency']
+)
+
+Check = Callable[[], Awaitable[None]]
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one dependency check."""
+
+    healthy: bool
+    checked_at: float
+    duration: float
+    timestamp: str
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        """Public representation for health responses."""
+        return {
+            "healthy": self.healthy,
+            "checked_at": self.timestamp,
+            "duration_ms": round(self.duration * 1000, 1),
+            "error": self.error
+        }
+
+
+class HealthProber:
+    """
+    Run dependency checks on an interval and keep the latest results.
+
+    Probe endpoints read the cached results and never wait on a dependency,
+    so a slow dependency can't make probes time out. Each check is bounded
+    by a timeout; a check that raises or times out marks its dependency
+    unhealthy. Results older than stale_after (e.g. because the prober
+    stopped) count as unhealthy.
+    """
+
+    def __init__(self, interval: float, timeout: float):
+        """
+        Initialize the prober.
+
+        Args:
+            interval: Seconds between check rounds
+            timeout: Seconds each check may take
+        """
+        self.interval = interval
+        self.timeout = timeout
+        self.stale_after = max(3 * interval, interval + timeout)
+
+        self._checks: Dict[str, Check] = {}
+        self._results: Dict[str, CheckResult] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def register(self, name: str, check: Check) -> None:
+        """
+        Add a dependency check.
+
+        Args:
+            name: Dependency name used in responses and metrics
+            check: Coroutine factory that raises if the dependency is unhealthy
+        """
+        self._checks[name] = check
+
+    @property
+    def results(self) -> Dict[str, CheckResult]:
+        """Latest result per dependency."""
+        return dict(self._results)
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether every dependency passed its latest check and no result is stale."""
+        if not self._checks or len(self._results) < len(self._checks):
+            return False
+        now = time.monotonic()
+        return all(
+            result.healthy and now - result.checked_at <= self.stale_after
+            for result in self._results.values()
+        )
+
+    async def run_checks(self) -> Dict[str, CheckResult]:
+        """
+        Run all checks concurrently and store their results.
+
+        Returns:
+            Latest result per dependency
+        """
+        names = list(self._checks)
+        outcomes = await asyncio.gather(*(self._run_check(name) for name in names))
+        self._results.update(zip(names, outcomes))
+        return self.results
+
+    async def ensure_checked(self) -> None:
+        """Run one round of checks if none has completed yet (e.g. before the prober started)."""
+        if len(self._results) >= len(self._checks):
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if len(self._results) < len(self._checks):
+                await self.run_checks()
+
+    def reset(self) -> None:
+        """Forget all results."""
+        self._results.clear()
+
+    def start(self) -> None:
+        """Start the background check loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="health-prober")
+
+    async def stop(self) -> None:
+        """Stop the background check loop."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self) -> None:
+        """Run check rounds until cancelled."""
+        while True:
+            await self.run_checks()
+            await asyncio.sleep(self.interval)
+
+    async def _run_check(self, name: str) -> CheckResult:
+        """Run one check with the timeout and record its metrics."""
+        start = time.monotonic()
+        error = None
+        try:
+            await asyncio.wait_for(self._checks[name](), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            error = f"Timed out after {self.timeout}s"
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+
+        finished = time.monotonic()
+        duration = finished - start
+        healthy = error is None
+        previous = self._results.get(name)
+        if previous is not None and previous.healthy != healthy:
+            log = logger.info if healthy else logger.warning
+            log("Dependency %s is now %s: %s", name, "healthy" if healthy else "unhealthy", error or "ok")
+
+        DEPENDENCY_UP.labels(dependency=name).set(1 if healthy else 0)
+        HEALTH_CHECK_DURATION.labels(dependency=name).observe(duration)
+
+        return CheckResult(
+            healthy=healthy,
+            checked_at=finished,
+            duration=duration,
+            timestamp=datetime.utcnow().isoformat() + "Z",
+            error=error
+        )
+
+
+# Singleton instance
+health_prober = HealthProber(
+    interval=settings.health_check_interval,
+    timeout=settings.health_check_timeout
+)
@@ -0,0 +1,332 @@
+"""Upstream HTTP client - Shared, tuned connection pool for auxiliary service traffic."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+from fastapi import FastAPI
+from prometheus_client import Counter, Gauge, Histogram
+
+from app import server_timing
+from app.compression import available_encodings
+from app.config import get_settings
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.retry_budget import RetryBudget, backoff_delay
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Prometheus metrics
+POOL_CONNECTIONS = Gauge(
+    'main_api_upstream_pool_connections',
+    'Connections in the auxiliary service connection pool',
+    ['state'],
+    multiprocess_mode='livesum'
+)
+POOL_MAX_CONNECTIONS = Gauge(
+    'main_api_upstream_pool_max_connections',
+    'Configured maximum size of the auxiliary service connection pool',
+    multiprocess_mode='livesum'
+)
+POOL_PENDING_REQUESTS = Gauge(
+    'main_api_upstream_pool_pending_requests',
+    'Requests waiting for a connection from the auxiliary service pool',
+    multiprocess_mode='livesum'
+)
+UPSTREAM_DURATION = Histogram(
+    'main_api_upstream_request_duration_seconds',
+    'Duration of single auxiliary service requests until response headers, per calling endpoint',
+    ['endpoint', 'method', 'outcome'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+UPSTREAM_RETRIES = Counter(
+    'main_api_upstream_retries_total',
+    'Retries of failed auxiliary service requests',
+    ['outcome']
+)
+
+# Methods that are safe to retry
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Upstream statuses worth retrying (the request never reached a healthy worker)
+RETRYABLE_STATUS_CODES = {502, 503, 504}
+
+
+@dataclass
+class UpstreamResponse:
+    """Decoded auxiliary service response with its validator."""
+
+    data: Optional[Dict[str, Any]]
+    etag: Optional[str] = None
+    not_modified: bool = False
+
+
+auxiliary_breaker = CircuitBreaker(
+    upstream="auxiliary-service",
+    failure_rate_threshold=settings.circuit_breaker_failure_rate,
+    slow_call_duration=settings.circuit_breaker_slow_call_duration,
+    slow_call_rate_threshold=settings.circuit_breaker_slow_call_rate,
+    window_size=settings.circuit_breaker_window_size,
+    minimum_calls=settings.circuit_breaker_minimum_calls,
+    open_duration=settings.circuit_breaker_open_seconds,
+    half_open_max_calls=settings.circuit_breaker_half_open_calls
+)
+
+retry_budget = RetryBudget(
+    ratio=settings.retry_budget_ratio,
+    min_per_second=settings.retry_budget_min_per_second,
+    max_tokens=settings.retry_budget_max_tokens
+)
+
+
+def http2_available() -> bool:
+    """Check whether the optional HTTP/2 dependency (h2) is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Content encodings httpx decodes (brotli and zstd need their optional packages)
+DECODABLE_ENCODINGS = ("gzip", "deflate", "br")
+
+
+def upstream_accept_encoding() -> str:
+    """
+    Accept-Encoding sent to the auxiliary service.
+
+    Lists the encodings the auxiliary service can produce that httpx can
+    also decode, so large listings cross the hop compressed.
+    """
+    decodable = [encoding for encoding in available_encodings() if encoding in DECODABLE_ENCODINGS]
+    return ", ".join(decodable)
+
+
+def build_limits() -> httpx.Limits:
+    """Build connection pool limits from settings."""
+    return httpx.Limits(
+        max_connections=settings.auxiliary_service_max_connections,
+        max_keepalive_connections=settings.auxiliary_service_max_keepalive_connections,
+        keepalive_expiry=settings.auxiliary_service_keepalive_expiry
+    )
+
+
+def build_timeout() -> httpx.Timeout:
+    """
+    Build per-phase timeouts from settings.
+
+    The legacy auxiliary_service_timeout is used for the write phase so that
+    no phase is left unbounded.
+    """
+    return httpx.Timeout(
+        connect=settings.auxiliary_service_connect_timeout,
+        read=settings.auxiliary_service_read_timeout,
+        write=settings.auxiliary_service_timeout,
+        pool=settings.auxiliary_service_pool_timeout
+    )
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create the shared client used for all auxiliary service traffic.
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    http2 = settings.auxiliary_service_http2
+    if http2 and not http2_available():
+        logger.warning("HTTP/2 requested but the 'h2' package is not installed, using HTTP/1.1")
+        http2 = False
+
+    limits = build_limits()
+    POOL_MAX_CONNECTIONS.set(limits.max_connections or 0)
+
+    return httpx.AsyncClient(
+        base_url=settings.auxiliary_service_url,
+        headers={"Accept-Encoding": upstream_accept_encoding()},
+        timeout=build_timeout(),
+        limits=limits,
+        http2=http2,
+        follow_redirects=True
+    )
+
+
+async def prewarm_http_client(client: httpx.AsyncClient, connections: int) -> int:
+    """
+    Open connections to the auxiliary service ahead of the first request.
+
+    Concurrent requests to the cheap /version endpoint force the pool to
+    resolve DNS and establish keep-alive connections.
+
+    Args:
+        client: Shared HTTP client
+        connections: Number of connections to open
+
+    Returns:
+        Number of pre-warm requests that succeeded
+    """
+    if connections <= 0:
+        return 0
+
+    async def warm() -> bool:
+        response = await client.get("/version")
+        return response.status_code == 200
+
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(warm() for _ in range(connections)), return_exceptions=True),
+            timeout=settings.auxiliary_service_connect_timeout + settings.auxiliary_service_pool_timeout
+        )
+    except asyncio.TimeoutError:
+        logger.warning("Timed out pre-warming auxiliary service connections")
+        return 0
+
+    warmed = sum(1 for result in results if result is True)
+    logger.info("Pre-warmed %s/%s auxiliary service connections", warmed, connections)
+    return warmed
+
+
+async def send_through_breaker(
+    client: httpx.AsyncClient,
+    request: httpx.Request,
+    stream: bool = False
+) -> httpx.Response:
+    """
+    Send one request to the auxiliary service, guarded by the circuit breaker.
+
+    Transport errors and 5xx responses count as failures; slow calls count
+    towards the breaker's latency threshold. The duration is recorded per
+    calling endpoint, taken from the request's "endpoint" extension, and
+    as the "upstream" Server-Timing phase.
+
+    Args:
+        client: Shared HTTP client
+        request: Request to send
+        stream: Whether to leave the response body unread
+
+    Returns:
+        Upstream response
+
+    Raises:
+        CircuitOpenError: If the breaker rejects the call
+        httpx.RequestError: If the request fails at the transport level
+    """
+    endpoint = request.extensions.get("endpoint", "other")
+    auxiliary_breaker.before_call()
+    start = time.monotonic()
+    try:
+        response = await client.send(request, stream=stream)
+    except httpx.RequestError:
+        elapsed = time.monotonic() - start
+        auxiliary_breaker.record(success=False, duration=elapsed)
+        server_timing.record("upstream", elapsed)
+        UPSTREAM_DURATION.labels(endpoint=endpoint, method=request.method, outcome="error").observe(elapsed)
+        raise
+    except BaseException:
+        # Cancelled or unexpected: outcome unknown, free the probe slot
+        auxiliary_breaker.release()
+        raise
+
+    elapsed = time.monotonic() - start
+    auxiliary_breaker.record(success=response.status_code < 500, duration=elapsed)
+    server_timing.record("upstream", elapsed)
+    UPSTREAM_DURATION.labels(
+        endpoint=endpoint,
+        method=request.method,
+        outcome=f"{response.status_code // 100}xx"
+    ).observe(elapsed)
+    return response
+
+
+async def send_upstream(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    **kwargs
+) -> httpx.Response:
+    """
+    Send a request to the auxiliary service with breaker protection and retries.
+
+    Idempotent requests that time out, can't connect or get a 502/503/504
+    are retried with jittered exponential backoff, as long as the shared
+    retry budget allows it.
+
+    Args:
+        client: Shared HTTP client
+        method: HTTP method
+        url: Request URL
+        **kwargs: Passed to httpx.AsyncClient.build_request (params, json, headers...)
+
+    Returns:
+        Upstream response (body already read)
+
+    Raises:
+        CircuitOpenError: If the breaker rejects the call
+        httpx.RequestError: If the request fails and can't be retried
+    """
+    retryable = method.upper() in IDEMPOTENT_METHODS
+    retry_budget.deposit()
+    attempt = 0
+
+    while True:
+        request = client.build_request(method, url, **kwargs)
+        try:
+            response = await send_through_breaker(client, request)
+        except httpx.TransportError:
+            if not _may_retry(retryable, attempt):
+                raise
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES or not _may_retry(retryable, attempt):
+                return response
+
+        attempt += 1
+        delay = backoff_delay(attempt, settings.retry_base_backoff, settings.retry_max_backoff)
+        logger.warning("Retrying %s %s (attempt %s) in %.3fs", method, url, attempt, delay)
+        await asyncio.sleep(delay)
+
+
+def _may_retry(retryable: bool, attempt: int) -> bool:
+    """Check the retry limit and spend from the retry budget."""
+    if not retryable or attempt >= settings.auxiliary_service_max_retries:
+        return False
+    if not retry_budget.try_withdraw():
+        UPSTREAM_RETRIES.labels(outcome="budget_exhausted").inc()
+        return False
+    UPSTREAM_RETRIES.labels(outcome="attempted").inc()
+    return True
+
+
+def get_http_client(app: FastAPI) -> Optional[httpx.AsyncClient]:
+    """Get the shared client created during lifespan startup, if any."""
+    return getattr(app.state, "http_client", None)
+
+
+def update_pool_metrics(client: Optional[httpx.AsyncClient]) -> None:
+    """
+    Export the current state of the connection pool to Prometheus.
+
+    httpx does not expose pool statistics publicly, so this reads the
+    underlying httpcore pool (client._transport._pool and its _requests).
+    Those internals are those of the httpcore version pinned in
+    requirements.txt, and test_pool_metrics_track_connections fails if an
+    upgrade changes them; at runtime anything missing is skipped.
+
+    Args:
+        client: Shared HTTP client
+    """
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    if pool is None:
+        return
+
+    connections = list(getattr(pool, "connections", []))
+    idle = sum(1 for connection in connections if getattr(connection, "is_idle", lambda: False)())
+
+    POOL_CONNECTIONS.labels(state="active").set(len(connections) - idle)
+    POOL_CONNECTIONS.labels(state="idle").set(idle)
+    POOL_PENDING_REQUESTS.set(
+        sum(1 for pool_request in getattr(pool, "_requests", []) if getattr(pool_request, "is_queued", lambda: False)())
+    )
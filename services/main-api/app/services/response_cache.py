@@ -0,0 +1,304 @@
+"""Response cache - Stale-while-revalidate cache of serialized auxiliary service responses."""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from fastapi import HTTPException
+from prometheus_client import Counter, Gauge
+
+from app.config import get_settings
+from app.services.http_client import UpstreamResponse
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Prometheus metrics
+CACHE_REQUESTS = Counter(
+    'main_api_response_cache_requests_total',
+    'Response cache lookups by result',
+    ['route', 'result']
+)
+CACHE_SIZE_BYTES = Gauge(
+    'main_api_response_cache_size_bytes',
+    'Approximate size of the response cache in bytes',
+    multiprocess_mode='livesum'
+)
+CACHE_EVICTIONS = Counter(
+    'main_api_response_cache_evictions_total',
+    'Entries evicted from the response cache to stay within its size bound'
+)
+
+# Lookup results
+HIT = "hit"
+MISS = "miss"
+STALE = "stale"
+STALE_IF_ERROR = "stale-if-error"
+REVALIDATED = "revalidated"
+
+Loader = Callable[[Optional[str]], Awaitable[UpstreamResponse]]
+
+# Serializes a decoded upstream body into the bytes sent to clients
+Renderer = Callable[[Dict[str, Any]], bytes]
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Freshness policy for one route."""
+
+    ttl: float
+    stale_while_revalidate: float = 0
+    stale_if_error: float = 0
+    private: bool = False
+
+    def cache_control(self) -> str:
+        """Build the Cache-Control header value for this policy."""
+        directives = [
+            "private" if self.private else "public",
+            f"max-age={int(self.ttl)}"
+        ]
+        if self.stale_while_revalidate:
+            directives.append(f"stale-while-revalidate={int(self.stale_while_revalidate)}")
+        if self.stale_if_error:
+            directives.append(f"stale-if-error={int(self.stale_if_error)}")
+        return ", ".join(directives)
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body, serialized as sent to clients."""
+
+    body: bytes
+    stored_at: float
+    etag: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        """Size of the body in bytes."""
+        return len(self.body)
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds since the entry was stored."""
+        return (now if now is not None else time.monotonic()) - self.stored_at
+
+
+@dataclass
+class CachedResult:
+    """Outcome of a cache lookup."""
+
+    body: bytes
+    age: int
+    result: str
+    etag: Optional[str] = None
+
+
+class CacheBackend(ABC):
+    """Storage interface for the response cache. Subclass to plug in another store."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry, or None if absent."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, replacing any previous one."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+
+class LRUCacheBackend(CacheBackend):
+    """In-memory LRU store bounded by the total size of its entries in bytes."""
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize the store.
+
+        Args:
+            max_bytes: Upper bound on the summed size of all entries
+        """
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self.delete(key)
+        if entry.size > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self.size_bytes += entry.size
+
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= evicted.size
+            CACHE_EVICTIONS.inc()
+
+        CACHE_SIZE_BYTES.set(self.size_bytes)
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= entry.size
+            CACHE_SIZE_BYTES.set(self.size_bytes)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size_bytes = 0
+        CACHE_SIZE_BYTES.set(0)
+
+
+class ResponseCache:
+    """
+    Read-through cache with stale-while-revalidate and stale-if-error semantics.
+
+    Bodies are stored serialized, so hits are served without any JSON work.
+
+    - Fresh entries (age <= ttl) are served directly.
+    - Entries within the stale-while-revalidate window are served immediately
+      while a single background task refreshes them.
+    - Expired entries that carry an ETag are revalidated with a conditional
+      request; a 304 refreshes the entry without transferring the body.
+    - If the upstream fails with a 5xx-class error, entries within the
+      stale-if-error window are served instead of the error.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend
+        """
+        self.backend = backend
+        self._revalidating: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        policy: CachePolicy,
+        loader: Loader,
+        route: str,
+        render: Renderer
+    ) -> CachedResult:
+        """
+        Get a response from the cache, calling the loader when needed.
+
+        Args:
+            key: Cache key (endpoint plus normalized query params)
+            policy: Freshness policy for the route
+            loader: Coroutine factory that fetches the response from upstream,
+                called with the ETag of the cached entry (if any)
+            route: Route name used as metric label
+            render: Serializes a freshly loaded body for storage and for the client
+
+        Returns:
+            Cached or freshly loaded response with its age and lookup result
+
+        Raises:
+            HTTPException: If the loader fails and no usable stale entry exists
+        """
+        entry = self.backend.get(key)
+        now = time.monotonic()
+
+        if entry is not None:
+            age = entry.age(now)
+            if age <= policy.ttl:
+                CACHE_REQUESTS.labels(route=route, result=HIT).inc()
+                return CachedResult(entry.body, int(age), HIT, entry.etag)
+
+            if age <= policy.ttl + policy.stale_while_revalidate:
+                CACHE_REQUESTS.labels(route=route, result=STALE).inc()
+                self._revalidate(key, entry, loader, render)
+                return CachedResult(entry.body, int(age), STALE, entry.etag)
+
+        try:
+            upstream = await loader(entry.etag if entry is not None else None)
+        except HTTPException as e:
+            if (
+                entry is not None
+                and e.status_code >= 500
+                and entry.age() <= policy.ttl + policy.stale_if_error
+            ):
+                logger.warning("Serving stale response for %s after upstream error: %s", key, e.detail)
+                CACHE_REQUESTS.labels(route=route, result=STALE_IF_ERROR).inc()
+                return CachedResult(entry.body, int(entry.age()), STALE_IF_ERROR, entry.etag)
+            raise
+
+        if upstream.not_modified and entry is not None:
+            CACHE_REQUESTS.labels(route=route, result=REVALIDATED).inc()
+            self._refresh(key, entry)
+            return CachedResult(entry.body, 0, REVALIDATED, entry.etag)
+
+        CACHE_REQUESTS.labels(route=route, result=MISS).inc()
+        entry = self.store(key, render(upstream.data), upstream.etag)
+        return CachedResult(entry.body, 0, MISS, entry.etag)
+
+    def store(self, key: str, body: bytes, etag: Optional[str] = None) -> CacheEntry:
+        """
+        Store a serialized response body.
+
+        Args:
+            key: Cache key
+            body: Body as sent to clients
+            etag: Upstream validator for the body
+
+        Returns:
+            Stored entry
+        """
+        entry = CacheEntry(body=body, stored_at=time.monotonic(), etag=etag)
+        self.backend.set(key, entry)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self.backend.clear()
+
+    def _refresh(self, key: str, entry: CacheEntry) -> None:
+        """Restart the freshness lifetime of an entry the upstream confirmed unchanged."""
+        self.backend.set(key, replace(entry, stored_at=time.monotonic()))
+
+    def _revalidate(self, key: str, entry: CacheEntry, loader: Loader, render: Renderer) -> None:
+        """Refresh an entry in the background, at most once per key at a time."""
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+
+        async def revalidate() -> None:
+            try:
+                upstream = await loader(entry.etag)
+                if upstream.not_modified:
+                    self._refresh(key, entry)
+                else:
+                    self.store(key, render(upstream.data), upstream.etag)
+            except Exception as e:
+                logger.warning("Background revalidation failed for %s: %s", key, e)
+            finally:
+                self._revalidating.discard(key)
+
+        task = asyncio.create_task(revalidate())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+# Singleton instance
+response_cache = ResponseCache(LRUCacheBackend(settings.response_cache_max_bytes))
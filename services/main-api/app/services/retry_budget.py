@@ -0,0 +1,78 @@
+"""Retry budget - Token bucket that bounds how much retries can add to upstream load."""
+
+import random
+import time
+
+
+class RetryBudget:
+    """
+    Token bucket shared by all retries to one upstream.
+
+    Every original request deposits `ratio` tokens and every retry spends a
+    whole token, so retries can add at most `ratio` extra load on top of
+    normal traffic. A small time-based refill (`min_per_second`) keeps
+    retries possible at low request rates. The bucket never holds more than
+    `max_tokens`, which caps retry bursts after quiet periods.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 1.0, max_tokens: float = 10.0):
+        """
+        Initialize a full bucket.
+
+        Args:
+            ratio: Tokens deposited per original request
+            min_per_second: Tokens refilled per second regardless of traffic
+            max_tokens: Bucket capacity
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+
+        self._tokens = max_tokens
+        self._last_refill = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Credit the bucket for an original (non-retry) request."""
+        self._refill()
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """
+        Spend one token for a retry.
+
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted
+        """
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _refill(self) -> None:
+        """Add the time-based refill since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.max_tokens, self._tokens + elapsed * self.min_per_second)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    Args:
+        attempt: Retry number, starting at 1
+        base: Delay for the first retry before jitter
+        cap: Maximum delay before jitter
+
+    Returns:
+        Seconds to wait before the retry
+    """
+    return random.uniform(0, min(cap, base * (2 ** (attempt - 1))))
@@ -0,0 +1,80 @@
+"""Single flight - Coalesce concurrent identical upstream requests."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+# Prometheus metrics
+DEDUPLICATED_REQUESTS = Counter(
+    'main_api_upstream_deduplicated_requests_total',
+    'Upstream requests served by joining an identical in-flight call',
+    ['endpoint']
+)
+
+
+class _Call:
+    """An in-flight call and the number of callers waiting on it."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time and share its result.
+
+    The call runs in its own task, so a caller that is cancelled (e.g. the
+    client disconnected) only stops waiting; the shared call keeps running
+    for the remaining callers. It is cancelled only once nobody is waiting.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[str, _Call] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]], label: str = "") -> Any:
+        """
+        Run fn for this key, or join the identical call already in flight.
+
+        Args:
+            key: Identity of the call (endpoint plus normalized params)
+            fn: Coroutine factory performing the call
+            label: Metric label for deduplicated calls
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.create_task(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+        else:
+            DEDUPLICATED_REQUESTS.labels(endpoint=label or key).inc()
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Last waiter left: nobody needs the result any more
+                logger.debug("Cancelling abandoned upstream call: %s", key)
+                self._forget(key, call)
+                call.task.cancel()
+
+    def _forget(self, key: str, call: _Call) -> None:
+        """Remove a call from the in-flight table if it is still the current one."""
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -0,0 +1,152 @@
+"""Auxiliary service version info - Cached, background-refreshed version value."""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import httpx
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+UNKNOWN_VERSION = "unknown"
+
+
+class AuxiliaryVersionInfo:
+    """
+    In-memory holder for the auxiliary service version.
+
+    Readers never touch the network: they get the last known value, which is
+    kept up to date by a background refresher and by version headers observed
+    on regular proxied responses.
+    """
+
+    def __init__(self, ttl: float, refresh_interval: float):
+        """
+        Initialize the version holder.
+
+        Args:
+            ttl: Seconds after which the cached value is considered stale
+            refresh_interval: Seconds between background refreshes
+        """
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+
+        self._version: Optional[str] = None
+        self._updated_at: Optional[float] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def version(self) -> str:
+        """
+        Get the last known auxiliary service version.
+
+        If the value is older than the TTL, a background refresh is scheduled
+        and the last known value is returned in the meantime.
+
+        Returns:
+            Version string, or "unknown" if it has never been retrieved
+        """
+        if self.is_stale:
+            self._schedule_refresh()
+        return self._version or UNKNOWN_VERSION
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the cached value is missing or older than the TTL."""
+        if self._updated_at is None:
+            return True
+        return time.monotonic() - self._updated_at > self.ttl
+
+    def observe(self, version: Optional[str]) -> None:
+        """
+        Record a version seen on an auxiliary service response.
+
+        Args:
+            version: Value of the X-Auxiliary-Service-Version header
+        """
+        if not version or version == UNKNOWN_VERSION:
+            return
+
+        if version != self._version:
+            logger.info("Auxiliary service version changed: %s -> %s", self._version, version)
+            self._version = version
+        self._updated_at = time.monotonic()
+
+    async def refresh(self) -> str:
+        """
+        Fetch the version from the auxiliary service /version endpoint.
+
+        On failure the last known value is kept.
+
+        Returns:
+            The (possibly unchanged) cached version
+        """
+        if self._client is None:
+            return self._version or UNKNOWN_VERSION
+
+        try:
+            response = await self._client.get(
+                f"{settings.auxiliary_service_url}/version",
+                timeout=5.0
+            )
+            if response.status_code == 200:
+                self.observe(response.json().get("version"))
+        except Exception as e:
+            logger.warning("Could not refresh auxiliary service version: %s", e)
+
+        return self._version or UNKNOWN_VERSION
+
+    def start(self, client: httpx.AsyncClient) -> None:
+        """
+        Start the background refresher.
+
+        Args:
+            client: Shared HTTP client used to reach the auxiliary service
+        """
+        self._client = client
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="aux-version-refresher")
+
+    async def stop(self) -> None:
+        """Stop the background refresher and any pending refresh."""
+        for task in (self._task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._refresh_task = None
+        self._client = None
+
+    async def _run(self) -> None:
+        """Refresh the version periodically until cancelled."""
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval)
+
+    def _schedule_refresh(self) -> None:
+        """Kick off a one-off refresh without waiting for it."""
+        if self._client is None:
+            return
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        try:
+            self._refresh_task = asyncio.get_running_loop().create_task(self.refresh())
+        except RuntimeError:
+            # No running loop (e.g. called from sync code); the periodic refresher will catch up
+            pass
+
+
+# Singleton instance
+version_info = AuxiliaryVersionInfo(
+    ttl=settings.auxiliary_version_ttl,
+    refresh_interval=settings.auxiliary_version_refresh_interval
+)
@@ -0,0 +1,196 @@
+"""Tracing - OpenTelemetry spans with W3C trace context propagation (optional dependency)."""
+
+import json
+import logging
+import threading
+from contextlib import nullcontext
+from typing import Any, Dict, Optional, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import route_template
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import propagate, trace
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+    OTEL_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    OTEL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Exporters selectable in settings
+OTLP_EXPORTER = "otlp"
+FILE_EXPORTER = "file"
+
+_enabled = False
+
+
+class _NoopSpan:
+    """Stand-in span used when OpenTelemetry is not installed."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_status(self, status: Any) -> None:
+        pass
+
+    def update_name(self, name: str) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+if OTEL_AVAILABLE:
+    class FileSpanExporter(SpanExporter):
+        """Append finished spans to a file, one JSON object per line."""
+
+        def __init__(self, path: str):
+            self.path = path
+            self._lock = threading.Lock()
+
+        def export(self, spans: Sequence[ReadableSpan]) -> "SpanExportResult":
+            lines = "".join(json.dumps(json.loads(span.to_json())) + "\n" for span in spans)
+            try:
+                with self._lock, open(self.path, "a", encoding="utf-8") as file:
+                    file.write(lines)
+            except OSError as e:
+                logger.warning("Could not write spans to %s: %s", self.path, e)
+                return SpanExportResult.FAILURE
+            return SpanExportResult.SUCCESS
+
+        def shutdown(self) -> None:
+            pass
+
+
+def configure_tracing(
+    service_name: str,
+    service_version: str,
+    exporter: str = OTLP_EXPORTER,
+    otlp_endpoint: str = "http://localhost:4318/v1/traces",
+    file_path: str = "traces.jsonl",
+    sample_ratio: float = 1.0
+) -> bool:
+    """
+    Install a tracer provider that batches spans to an OTLP collector or a file.
+
+    Args:
+        service_name: service.name resource attribute
+        service_version: service.version resource attribute
+        exporter: "otlp" (OTLP over HTTP) or "file" (JSON lines)
+        otlp_endpoint: OTLP/HTTP traces URL
+        file_path: Output file of the file exporter
+        sample_ratio: Fraction of new traces to record (incoming sampled traces are always followed)
+
+    Returns:
+        Whether tracing is enabled (False if OpenTelemetry is not installed)
+    """
+    global _enabled
+    if not OTEL_AVAILABLE:
+        logger.warning("Tracing requested but OpenTelemetry is not installed")
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name, "service.version": service_version}),
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio))
+    )
+    if exporter == FILE_EXPORTER:
+        span_exporter = FileSpanExporter(file_path)
+    else:
+        span_exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
+    provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    trace.set_tracer_provider(provider)
+
+    _enabled = True
+    logger.info("Tracing enabled: %s exporter, sample ratio %s", exporter, sample_ratio)
+    return True
+
+
+def is_enabled() -> bool:
+    """Whether configure_tracing installed a tracer provider."""
+    return _enabled
+
+
+def start_span(name: str, kind: str = "internal", attributes: Optional[Dict[str, Any]] = None):
+    """
+    Context manager for a span that becomes the current span.
+
+    Without OpenTelemetry this yields a no-op span; without a configured
+    provider the span is a cheap non-recording one.
+
+    Args:
+        name: Span name
+        kind: "internal", "server" or "client"
+        attributes: Initial span attributes
+    """
+    if not OTEL_AVAILABLE:
+        return nullcontext(_NOOP_SPAN)
+    return trace.get_tracer(__name__).start_as_current_span(
+        name,
+        kind=getattr(SpanKind, kind.upper()),
+        attributes=attributes
+    )
+
+
+def inject_trace_headers(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    Add W3C traceparent/tracestate headers for the current span.
+
+    Args:
+        headers: Outgoing headers to extend (a new dict is created if None)
+
+    Returns:
+        The headers, with trace context when a span is recording
+    """
+    headers = dict(headers or {})
+    if _enabled:
+        propagate.inject(headers)
+    return headers
+
+
+class TracingMiddleware:
+    """
+    Start a server span per HTTP request, continuing any incoming W3C trace context.
+
+    The span is named after the route template once routing has run, and
+    records the response status.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _enabled:
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+        token = otel_context.attach(propagate.extract(carrier))
+        try:
+            with start_span(f"{scope['method']} request", kind="server") as span:
+                span.set_attribute("http.method", scope["method"])
+                span.set_attribute("http.target", scope["path"])
+
+                async def send_with_status(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        span.set_attribute("http.status_code", message["status"])
+                        if message["status"] >= 500:
+                            span.set_status(Status(StatusCode.ERROR))
+                    await send(message)
+
+                try:
+                    await self.app(scope, receive, send_with_status)
+                finally:
+                    endpoint = route_template(scope)
+                    span.update_name(f"{scope['method']} {endpoint}")
+                    span.set_attribute("http.route", endpoint)
+        finally:
+            otel_context.detach(token)
+
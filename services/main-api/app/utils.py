@@ -1,7 +1,11 @@
 """
 Utility functions for the Main API service.
 """
-from typing import Dict, Any
+import hashlib
+import json
+from functools import lru_cache
+from typing import Dict, Any, AsyncIterator, Optional
+from urllib.parse import urlencode
 
 
 def add_version_info(data: Dict[str, Any], version: str = "1.0.0") -> Dict[str, Any]:
@@ -20,3 +24,117 @@ def add_version_info(data: Dict[str, Any], version: str = "1.0.0") -> Dict[str,
         "version": version,
         "api": "main-api"
     }
+
+
+def build_request_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a stable key for an upstream request.
+    
+    Query parameters are normalized so that ordering and empty values don't
+    produce different keys for the same request.
+    
+    Args:
+        endpoint: Endpoint path on auxiliary service
+        params: Query parameters
+        
+    Returns:
+        Key in the form "<endpoint>?<sorted query string>"
+    """
+    normalized = sorted(
+        (str(key), str(value).lower() if isinstance(value, bool) else str(value))
+        for key, value in (params or {}).items()
+        if value is not None and value != ""
+    )
+    
+    if not normalized:
+        return endpoint
+    
+    return f"{endpoint}?{urlencode(normalized)}"
+
+
+async def splice_json_fields(chunks: AsyncIterator[bytes], fields: Dict[str, Any]) -> AsyncIterator[bytes]:
+    """
+    Add fields to a streamed JSON object without parsing it.
+    
+    The fields are inserted right after the opening brace; everything after
+    that is passed through untouched. Bodies that are not JSON objects are
+    passed through unchanged.
+    
+    Args:
+        chunks: Raw body chunks of a JSON document
+        fields: Fields to add to the top-level object
+        
+    Yields:
+        Body chunks with the fields spliced in
+    """
+    members = json.dumps(fields, separators=(",", ":"))[1:-1].encode()
+    buffered = b""
+    spliced = False
+    
+    async for chunk in chunks:
+        if spliced:
+            yield chunk
+            continue
+        
+        buffered += chunk
+        stripped = buffered.lstrip()
+        if not stripped:
+            continue
+        
+        if not stripped.startswith(b"{"):
+            spliced = True
+            yield buffered
+            continue
+        
+        # Look past the brace to know whether the object is empty
+        rest = stripped[1:].lstrip()
+        if not rest:
+            continue
+        
+        separator = b"" if rest.startswith(b"}") else b","
+        spliced = True
+        yield b"{" + members + separator + rest
+    
+    if not spliced and buffered:
+        yield buffered
+
+
+@lru_cache(maxsize=4096)
+def derive_etag(upstream_etag: str, version: str) -> str:
+    """
+    Derive the ETag of a main API response from the upstream ETag.
+    
+    The main API adds its own version to every body, so the version is
+    folded into the validator. Memoized, since cache hits re-derive the
+    ETag of the same few entries over and over.
+    
+    Args:
+        upstream_etag: ETag returned by the auxiliary service
+        version: Main API version
+        
+    Returns:
+        Quoted ETag value
+    """
+    digest = hashlib.sha256(f"{upstream_etag}\x1f{version}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against the current ETag.
+    
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current ETag
+        
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    
+    return etag.removeprefix("W/") in {candidate.removeprefix("W/") for candidate in candidates}
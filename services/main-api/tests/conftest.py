@@ -11,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.main import app
+from app.services.health import health_prober
 
 
 @pytest.fixture
@@ -22,46 +23,50 @@ def client():
 @pytest.fixture
 def mock_auxiliary_service():
     """Mock auxiliary service responses."""
-    with patch('app.main.httpx.AsyncClient') as mock:
-        async_client = Mock()
-        mock.return_value.__aenter__.return_value = async_client
-        
-        # Mock version endpoint
-        version_response = Mock()
-        version_response.status_code = 200
-        version_response.json.return_value = {
-            "service": "auxiliary-service",
-            "version": "1.0.0",
-            "environment": "test"
-        }
-        
-        # Mock health endpoint
-        health_response = Mock()
-        health_response.status_code = 200
-        health_response.json.return_value = {"status": "healthy"}
-        
-        async def mock_get(url):
-            if "version" in url:
-                return version_response
-            elif "health" in url:
-                return health_response
-            return Mock(status_code=404)
-        
-        async_client.get.side_effect = mock_get
-        
+    async_client = Mock()
+    
+    # Mock version endpoint
+    version_response = Mock()
+    version_response.status_code = 200
+    version_response.json.return_value = {
+        "service": "auxiliary-service",
+        "version": "1.0.0",
+        "environment": "test"
+    }
+    
+    # Mock health endpoint
+    health_response = Mock()
+    health_response.status_code = 200
+    health_response.json.return_value = {"status": "healthy"}
+    
+    async def mock_get(url, **kwargs):
+        if "version" in url:
+            return version_response
+        elif "health" in url:
+            return health_response
+        return Mock(status_code=404)
+    
+    async_client.get.side_effect = mock_get
+    
+    # Health results are cached; drop those taken against another mock
+    health_prober.reset()
+    with patch.object(app.state, 'http_client', async_client, create=True):
         yield async_client
+    health_prober.reset()
 
 
 @pytest.fixture
 def mock_auxiliary_service_down():
     """Mock auxiliary service being down."""
-    with patch('app.main.httpx.AsyncClient') as mock:
-        async_client = Mock()
-        mock.return_value.__aenter__.return_value = async_client
-        
-        async def mock_get_error(url):
-            raise Exception("Connection refused")
-        
-        async_client.get.side_effect = mock_get_error
-        
+    async_client = Mock()
+    
+    async def mock_get_error(url, **kwargs):
+        raise Exception("Connection refused")
+    
+    async_client.get.side_effect = mock_get_error
+    
+    # Health results are cached; drop those taken against another mock
+    health_prober.reset()
+    with patch.object(app.state, 'http_client', async_client, create=True):
         yield async_client
+    health_prober.reset()
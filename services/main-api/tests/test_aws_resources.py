@@ -2,7 +2,11 @@
 Tests for AWS resource endpoints (S3, SSM).
 """
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import AsyncMock, patch, Mock
+
+from fastapi.responses import StreamingResponse
+
+from app.services.http_client import UpstreamResponse
 
 
 @pytest.fixture
@@ -131,3 +135,87 @@ def test_list_parameters_with_prefix(client):
         
         # Should accept the prefix parameter
         assert response.status_code in [200, 500]  # 500 if auxiliary service is mocked incorrectly
+
+
+def test_list_parameters_forwards_pagination(client):
+    """Test that limit and cursor are forwarded to the auxiliary service."""
+    upstream = AsyncMock(return_value=UpstreamResponse(data={"parameters": [], "count": 0, "next_cursor": "abc"}))
+    
+    with patch("app.routers.aws_resources.call_auxiliary_service", upstream):
+        response = client.get("/api/v1/parameters?path_prefix=/app&limit=10&cursor=xyz")
+    
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] == "abc"
+    upstream.assert_awaited_once()
+    assert upstream.await_args.args[2] == {"path_prefix": "/app", "limit": 10, "cursor": "xyz"}
+
+
+def test_list_parameters_rejects_invalid_limit(client):
+    """Test that out-of-range page sizes are rejected."""
+    response = client.get("/api/v1/parameters?limit=0")
+    
+    assert response.status_code == 422
+
+
+def test_get_parameter_values_batch(client):
+    """Test that batch requests are forwarded as one upstream POST."""
+    upstream = AsyncMock(return_value=UpstreamResponse(data={
+        "parameters": [{"name": "/app/a", "value": "1"}],
+        "count": 1,
+        "invalid_parameters": ["/app/missing"]
+    }))
+    
+    with patch("app.routers.aws_resources.fetch_auxiliary_service", upstream):
+        response = client.post("/api/v1/parameters/values", json={"names": ["/app/a", "/app/missing"]})
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["invalid_parameters"] == ["/app/missing"]
+    assert "main_api_version" in data
+    assert upstream.await_args.kwargs["json"] == {"names": ["/app/a", "/app/missing"], "decrypt": True}
+
+
+def test_get_parameter_values_rejects_oversized_batch(client):
+    """Test that batches over the auxiliary service's limit are rejected before proxying."""
+    upstream = AsyncMock()
+    names = [f"/app/p{i}" for i in range(501)]
+    
+    with patch("app.routers.aws_resources.fetch_auxiliary_service", upstream):
+        response = client.post("/api/v1/parameters/values", json={"names": names})
+    
+    assert response.status_code == 422
+    upstream.assert_not_awaited()
+
+
+def test_list_s3_buckets_forwards_details(client):
+    """Test that the details flag is forwarded to the auxiliary service."""
+    upstream = AsyncMock(return_value=UpstreamResponse(data={"buckets": [], "count": 0}))
+    
+    with patch("app.routers.aws_resources.call_auxiliary_service", upstream):
+        response = client.get("/api/v1/s3/buckets?details=true")
+    
+    assert response.status_code == 200
+    assert upstream.await_args.args[2] == {"details": True}
+
+
+def test_list_s3_objects_streams_from_auxiliary_service(client):
+    """Test that object listings are relayed as a stream with their filters."""
+    upstream = AsyncMock(return_value=StreamingResponse(
+        iter([b'{"key": "a.txt"}\n']), media_type="application/x-ndjson"
+    ))
+    
+    with patch("app.routers.aws_resources.stream_auxiliary_service", upstream):
+        response = client.get("/api/v1/s3/buckets/my-bucket/objects?prefix=logs/&continuation_token=tok")
+    
+    assert response.status_code == 200
+    assert response.text == '{"key": "a.txt"}\n'
+    assert upstream.await_args.args[1] == "/aws/s3/buckets/my-bucket/objects"
+    assert upstream.await_args.args[2] == {"page_size": 1000, "prefix": "logs/", "continuation_token": "tok"}
+    assert upstream.await_args.kwargs["splice_version"] is False
+
+
+def test_list_s3_objects_rejects_invalid_bucket_name(client):
+    """Test that invalid bucket names are rejected without calling upstream."""
+    response = client.get("/api/v1/s3/buckets/Bad_Bucket/objects")
+    
+    assert response.status_code == 422
@@ -0,0 +1,145 @@
+"""
+Tests for the auxiliary service circuit breaker, retry budget and retries.
+"""
+import httpx
+import pytest
+from unittest.mock import patch
+
+from app.services import http_client
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.retry_budget import RetryBudget, backoff_delay
+
+
+@pytest.fixture
+def breaker():
+    """Breaker that opens quickly."""
+    return CircuitBreaker(
+        upstream="test",
+        failure_rate_threshold=0.5,
+        slow_call_duration=1.0,
+        window_size=4,
+        minimum_calls=4,
+        open_duration=30,
+        half_open_max_calls=2
+    )
+
+
+def test_breaker_opens_on_failure_rate(breaker):
+    """Test that the breaker opens and fails fast once the error rate is reached."""
+    for success in (True, True, False, False):
+        breaker.before_call()
+        breaker.record(success=success, duration=0.01)
+    
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after > 0
+
+
+def test_breaker_opens_on_slow_calls(breaker):
+    """Test that calls over the latency threshold open the breaker."""
+    for _ in range(4):
+        breaker.before_call()
+        breaker.record(success=True, duration=2.0)
+    
+    assert breaker.state == "open"
+
+
+def test_breaker_half_open_recovery(breaker):
+    """Test the open -> half-open -> closed cycle."""
+    breaker._transition("open")
+    breaker._opened_at -= 31
+    
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    breaker.before_call()
+    
+    # Only half_open_max_calls probes are let through
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    
+    breaker.record(success=True, duration=0.01)
+    breaker.record(success=True, duration=0.01)
+    assert breaker.state == "closed"
+
+
+def test_breaker_half_open_failure_reopens(breaker):
+    """Test that a failed probe re-opens the breaker."""
+    breaker._transition("half_open")
+    breaker.before_call()
+    breaker.record(success=False, duration=0.01)
+    
+    assert breaker.state == "open"
+
+
+def test_retry_budget_caps_retries():
+    """Test that retries stop once the budget is spent."""
+    budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2)
+    
+    assert budget.try_withdraw()
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+    
+    # Two original requests earn one retry
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_withdraw()
+
+
+def test_backoff_delay_is_capped():
+    """Test that jittered backoff never exceeds the cap."""
+    for attempt in range(1, 10):
+        assert 0 <= backoff_delay(attempt, base=0.1, cap=0.5) <= 0.5
+
+
+async def test_send_upstream_retries_idempotent_requests():
+    """Test that a GET is retried after a 503 and succeeds."""
+    statuses = iter([503, 200])
+    transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses), json={}))
+    
+    with patch.object(http_client, "auxiliary_breaker", CircuitBreaker("test")), \
+            patch.object(http_client, "retry_budget", RetryBudget()), \
+            patch.object(http_client.settings, "retry_base_backoff", 0):
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await http_client.send_upstream(client, "GET", "http://aux/aws/parameters")
+    
+    assert response.status_code == 200
+
+
+async def test_send_upstream_does_not_retry_post():
+    """Test that non-idempotent requests are never retried."""
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+    
+    with patch.object(http_client, "auxiliary_breaker", CircuitBreaker("test")):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            response = await http_client.send_upstream(client, "POST", "http://aux/x", json={})
+    
+    assert response.status_code == 503
+    assert len(calls) == 1
+
+
+async def test_upstream_duration_recorded_per_endpoint():
+    """Test that every upstream attempt is timed under the calling endpoint."""
+    from prometheus_client import REGISTRY
+    
+    labels = {"endpoint": "/api/v1/test", "method": "GET", "outcome": "5xx"}
+    before = REGISTRY.get_sample_value("main_api_upstream_request_duration_seconds_count", labels) or 0
+    statuses = iter([503, 200])
+    transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses), json={}))
+    
+    with patch.object(http_client, "auxiliary_breaker", CircuitBreaker("test")), \
+            patch.object(http_client, "retry_budget", RetryBudget()), \
+            patch.object(http_client.settings, "retry_base_backoff", 0):
+        async with httpx.AsyncClient(transport=transport) as client:
+            await http_client.send_upstream(
+                client, "GET", "http://aux/aws/parameters", extensions={"endpoint": "/api/v1/test"}
+            )
+    
+    assert REGISTRY.get_sample_value("main_api_upstream_request_duration_seconds_count", labels) == before + 1
+    assert REGISTRY.get_sample_value(
+        "main_api_upstream_request_duration_seconds_count", {**labels, "outcome": "2xx"}
+    ) >= 1
@@ -0,0 +1,38 @@
+"""
+Tests for the background health prober.
+"""
+import asyncio
+
+from unittest.mock import patch
+
+from app.services.health import HealthProber
+
+
+async def test_slow_check_times_out():
+    """Test that a hanging dependency is reported unhealthy after the timeout."""
+    prober = HealthProber(interval=10, timeout=0.05)
+    
+    async def hang():
+        await asyncio.sleep(10)
+    
+    prober.register("slow", hang)
+    results = await prober.run_checks()
+    
+    assert results["slow"].healthy is False
+    assert "Timed out" in results["slow"].error
+    assert prober.is_ready is False
+
+
+async def test_stale_results_are_not_ready():
+    """Test that results stop counting once the prober falls behind."""
+    prober = HealthProber(interval=10, timeout=1)
+    
+    async def ok():
+        return None
+    
+    prober.register("dep", ok)
+    await prober.run_checks()
+    assert prober.is_ready is True
+    
+    with patch("app.services.health.time.monotonic", return_value=prober.results["dep"].checked_at + 60):
+        assert prober.is_ready is False
@@ -0,0 +1,73 @@
+"""
+Tests for the shared auxiliary service HTTP client.
+"""
+import pytest
+from unittest.mock import patch
+
+from app.config import get_settings
+from app.services import http_client
+
+
+def test_timeouts_are_split_per_phase():
+    """Test that connect/read/pool timeouts come from their own settings."""
+    settings = get_settings()
+    timeout = http_client.build_timeout()
+    
+    assert timeout.connect == settings.auxiliary_service_connect_timeout
+    assert timeout.read == settings.auxiliary_service_read_timeout
+    assert timeout.pool == settings.auxiliary_service_pool_timeout
+
+
+async def test_http2_falls_back_without_h2():
+    """Test that HTTP/2 is disabled when the h2 package is missing."""
+    with patch.object(http_client.settings, 'auxiliary_service_http2', True), \
+            patch.object(http_client, 'http2_available', return_value=False):
+        client = http_client.create_http_client()
+    
+    try:
+        assert client._transport._pool._http2 is False
+    finally:
+        await client.aclose()
+
+
+async def test_client_requests_compressed_bodies():
+    """Test that the client only asks for encodings it can decode."""
+    client = http_client.create_http_client()
+    
+    try:
+        accepted = client.headers["Accept-Encoding"].split(", ")
+        assert "gzip" in accepted
+        assert set(accepted) <= set(http_client.DECODABLE_ENCODINGS)
+    finally:
+        await client.aclose()
+
+
+def test_pool_metrics_without_client():
+    """Test that pool metrics tolerate a missing client."""
+    http_client.update_pool_metrics(None)
+
+
+async def test_pool_metrics_track_connections():
+    """Test that pool gauges follow the pinned httpcore pool internals."""
+    import asyncio
+    from prometheus_client import REGISTRY
+    
+    async def serve(reader, writer):
+        # Minimal keep-alive HTTP/1.1 responder
+        while await reader.readuntil(b"\r\n\r\n"):
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+    
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = http_client.create_http_client()
+    try:
+        assert (await client.get(f"http://127.0.0.1:{port}/")).status_code == 200
+        http_client.update_pool_metrics(client)
+        
+        assert REGISTRY.get_sample_value("main_api_upstream_pool_connections", {"state": "idle"}) == 1
+        assert REGISTRY.get_sample_value("main_api_upstream_pool_connections", {"state": "active"}) == 0
+        assert REGISTRY.get_sample_value("main_api_upstream_pool_pending_requests") == 0
+    finally:
+        await client.aclose()
+        server.close()
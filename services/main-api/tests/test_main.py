@@ -99,3 +99,72 @@ def test_root_redirect(client):
     
     # Should redirect to /docs or return some info
     assert response.status_code in [200, 307, 308]
+
+
+def test_liveness_has_no_dependencies(client, mock_auxiliary_service_down):
+    """Test that liveness stays up while the auxiliary service is down."""
+    response = client.get("/health/live")
+    
+    assert response.status_code == 200
+    assert response.json()["status"] == "alive"
+    mock_auxiliary_service_down.get.assert_not_called()
+
+
+def test_readiness_served_from_cache(client, mock_auxiliary_service):
+    """Test that readiness checks dependencies once and then reuses the result."""
+    first = client.get("/health/ready")
+    second = client.get("/health/ready")
+    
+    assert first.status_code == 200
+    assert second.json()["checks"]["auxiliary_service"]["healthy"] is True
+    assert mock_auxiliary_service.get.call_count == 1
+
+
+def test_readiness_fails_when_dependency_down(client, mock_auxiliary_service_down):
+    """Test that readiness reports 503 with the failing check."""
+    response = client.get("/health/ready")
+    
+    assert response.status_code == 503
+    assert response.json()["checks"]["auxiliary_service"]["error"] == "Connection refused"
+
+
+def test_metrics_use_route_templates(client):
+    """Test that request metrics are labelled by route template, not raw path."""
+    from prometheus_client import REGISTRY
+    
+    client.get("/no/such/path/12345")
+    client.get("/api/v1/s3/buckets/Bad_Bucket/objects")
+    
+    assert REGISTRY.get_sample_value(
+        "main_api_requests_total", {"method": "GET", "endpoint": "unmatched", "status": "404"}
+    ) >= 1
+    assert REGISTRY.get_sample_value(
+        "main_api_requests_total",
+        {"method": "GET", "endpoint": "/api/v1/s3/buckets/{bucket}/objects", "status": "422"}
+    ) >= 1
+    assert REGISTRY.get_sample_value(
+        "main_api_response_size_bytes_count", {"method": "GET", "endpoint": "unmatched"}
+    ) >= 1
+    assert "/no/such/path/12345" not in client.get("/metrics").text
+
+
+def test_middleware_on_streaming_response(client):
+    """Test that streamed bodies get headers on the start message and are fully measured."""
+    from unittest.mock import AsyncMock, patch
+    from fastapi.responses import StreamingResponse
+    from prometheus_client import REGISTRY
+    
+    labels = {"method": "GET", "endpoint": "/api/v1/s3/buckets/{bucket}/objects"}
+    before = REGISTRY.get_sample_value("main_api_response_size_bytes_sum", labels) or 0
+    upstream = AsyncMock(return_value=StreamingResponse(
+        iter([b'{"key": "a"}\n', b'{"key": "b"}\n']), media_type="application/x-ndjson"
+    ))
+    
+    with patch("app.routers.aws_resources.stream_auxiliary_service", upstream):
+        response = client.get("/api/v1/s3/buckets/my-bucket/objects", headers={"Accept-Encoding": "identity"})
+    
+    assert response.text == '{"key": "a"}\n{"key": "b"}\n'
+    assert response.headers["X-Main-API-Version"]
+    assert "X-Auxiliary-Service-Version" in response.headers
+    assert response.headers["Server-Timing"].startswith("app;dur=")
+    assert REGISTRY.get_sample_value("main_api_response_size_bytes_sum", labels) == before + len(response.content)
@@ -0,0 +1,56 @@
+"""
+Tests for multi-worker (Prometheus multiprocess) metrics.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from prometheus_client.parser import text_string_to_metric_families
+
+from app.metrics import render_metrics
+
+SERVICE_DIR = Path(__file__).parent.parent
+
+# Each worker serves some requests and sets a live gauge, then exits
+WORKER = """
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.http_client import POOL_MAX_CONNECTIONS
+
+client = TestClient(app)
+for _ in range({requests}):
+    assert client.get("/health/live").status_code == 200
+POOL_MAX_CONNECTIONS.set(10)
+"""
+
+
+def sample(text, name, labels):
+    """Value of one sample in exposition text, or None."""
+    for family in text_string_to_metric_families(text):
+        for metric in family.samples:
+            if metric.name == name and all(metric.labels.get(k) == v for k, v in labels.items()):
+                return metric.value
+    return None
+
+
+def test_counters_sum_across_worker_processes(tmp_path, monkeypatch):
+    """Test that a scrape aggregates every worker and drops live gauges of dead ones."""
+    workers, requests = 3, 4
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    processes = [
+        subprocess.Popen([sys.executable, "-c", WORKER.format(requests=requests)], cwd=SERVICE_DIR, env=env)
+        for _ in range(workers)
+    ]
+    assert all(process.wait(timeout=60) == 0 for process in processes)
+    assert len(list(tmp_path.glob("gauge_live*"))) >= workers
+    
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    text = render_metrics().decode()
+    labels = {"method": "GET", "endpoint": "/health/live"}
+    
+    assert sample(text, "main_api_requests_total", {**labels, "status": "200"}) == workers * requests
+    assert sample(text, "main_api_request_duration_seconds_count", labels) == workers * requests
+    assert sample(text, "main_api_request_duration_seconds_bucket", {**labels, "le": "+Inf"}) == workers * requests
+    assert sample(text, "main_api_upstream_pool_max_connections", {}) is None
+    assert not list(tmp_path.glob("gauge_live*"))
@@ -0,0 +1,132 @@
+"""
+Tests for the sampling profiler and the /debug endpoints.
+"""
+import asyncio
+import threading
+
+import pytest
+from unittest.mock import patch
+
+from app.main import settings
+from app.profiler import Profile, ProfileInProgress, Sampler, dump_tasks
+
+
+def busy_wait(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def debug_enabled():
+    """Enable the debug endpoints."""
+    with patch.object(settings, 'debug_endpoints_enabled', True):
+        yield
+
+
+def test_sampler_covers_worker_threads():
+    """Test that stacks of other threads are sampled, root first."""
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_wait, args=(stop,), name="busy-worker")
+    worker.start()
+    try:
+        profile = Sampler().sample(0.2, 0.005)
+    finally:
+        stop.set()
+        worker.join()
+
+    stacks = [frames for (thread, frames), _ in profile.samples.items() if thread == "busy-worker"]
+    assert stacks
+    assert any(frame[0] == "busy_wait" for frames in stacks for frame in frames)
+    assert all(frames[0][0] == "_bootstrap" for frames in stacks)
+
+
+def test_one_profile_at_a_time():
+    """Test that a second profile is rejected while one is running."""
+    sampler = Sampler()
+    thread = threading.Thread(target=sampler.sample, args=(0.3, 0.01))
+    thread.start()
+    try:
+        with pytest.raises(ProfileInProgress):
+            threading.Event().wait(0.05)
+            sampler.sample(0.1, 0.01)
+    finally:
+        thread.join()
+
+
+def test_profile_output_formats():
+    """Test collapsed stack and speedscope output."""
+    profile = Profile(interval=0.01)
+    main = ("main", "app.py", 1)
+    handler = ("handler", "app.py", 10)
+    profile.samples[("MainThread", (main, handler))] = 3
+    profile.samples[("MainThread", (main,))] = 1
+
+    assert profile.to_collapsed() == (
+        "MainThread;main (app.py:1);handler (app.py:10) 3\n"
+        "MainThread;main (app.py:1) 1\n"
+    )
+
+    document = profile.to_speedscope("test")
+    assert [frame["name"] for frame in document["shared"]["frames"]] == ["main", "handler"]
+    (thread_profile,) = document["profiles"]
+    assert thread_profile["samples"] == [[0, 1], [0]]
+    assert thread_profile["weights"] == pytest.approx([0.03, 0.01])
+
+
+async def test_dump_tasks_stacks():
+    """Test that the running task's stack ends at the caller and suspended tasks show what they await."""
+    async def waiting():
+        await asyncio.sleep(10)
+
+    async def inspect_tasks():
+        return dump_tasks()
+
+    task = asyncio.create_task(waiting(), name="waiting")
+    await asyncio.sleep(0)
+    try:
+        tasks = {task["name"]: task for task in await inspect_tasks()}
+    finally:
+        task.cancel()
+
+    (current,) = [task for task in tasks.values() if task["current"]]
+    assert current["stack"][-1].endswith("in inspect_tasks")
+    assert [frame.rsplit(" in ", 1)[1] for frame in tasks["waiting"]["stack"]] == ["waiting", "sleep"]
+
+
+def test_debug_endpoints_disabled_by_default(client):
+    """Test that debug endpoints are hidden unless enabled."""
+    assert client.get("/debug/profile?seconds=0.1").status_code == 404
+    assert client.get("/debug/tasks").status_code == 404
+
+
+def test_debug_token_required_when_configured(client, debug_enabled):
+    """Test that a configured debug token must be sent."""
+    with patch.object(settings, 'debug_token', "secret"):
+        assert client.get("/debug/tasks").status_code == 403
+        assert client.get("/debug/tasks", headers={"X-Debug-Token": "secret"}).status_code == 200
+
+
+def test_debug_profile_endpoint(client, debug_enabled):
+    """Test collapsed and speedscope profiles over HTTP."""
+    response = client.get("/debug/profile?seconds=0.1")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in response.text.splitlines())
+
+    response = client.get("/debug/profile?seconds=0.1&format=speedscope")
+    assert response.status_code == 200
+    assert response.json()["profiles"]
+
+    assert client.get(f"/debug/profile?seconds={settings.debug_profile_max_seconds + 1}").status_code == 422
+
+
+def test_debug_tasks_endpoint(client, debug_enabled):
+    """Test that the request's own task is listed with its await chain."""
+    response = client.get("/debug/tasks")
+
+    assert response.status_code == 200
+    data = response.json()
+    current = [task for task in data["tasks"] if task["current"]]
+    assert data["count"] == len(data["tasks"])
+    assert len(current) == 1
+    assert any("debug_tasks" in frame for frame in current[0]["stack"])
@@ -0,0 +1,184 @@
+"""
+Tests for the main API response cache.
+"""
+import asyncio
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.services.http_client import UpstreamResponse
+from app.services.response_cache import (
+    CacheBackend,
+    CacheEntry,
+    CachePolicy,
+    LRUCacheBackend,
+    ResponseCache,
+    response_cache,
+)
+from app.utils import build_request_key
+
+
+@pytest.fixture
+def cache():
+    """Fresh cache with a small size bound."""
+    return ResponseCache(LRUCacheBackend(max_bytes=1024))
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_cache():
+    """Keep the application cache from leaking between tests."""
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
+
+def test_request_key_is_normalized():
+    """Test that param order and empty values don't change the key."""
+    assert build_request_key("/aws/parameters", {"b": "2", "a": "1"}) == \
+        build_request_key("/aws/parameters", {"a": "1", "b": "2", "c": None})
+    assert build_request_key("/aws/parameters", {}) == "/aws/parameters"
+    assert build_request_key("/x", {"decrypt": True}) == "/x?decrypt=true"
+
+
+async def test_miss_then_hit(cache):
+    """Test that a second lookup is served from cache."""
+    loader = AsyncMock(return_value=UpstreamResponse(data={"count": 1}))
+    policy = CachePolicy(ttl=60)
+    
+    render = Mock(side_effect=orjson.dumps)
+    
+    first = await cache.get_or_fetch("k", policy, loader, "test", render)
+    second = await cache.get_or_fetch("k", policy, loader, "test", render)
+    
+    assert first.result == "miss"
+    assert second.result == "hit"
+    assert second.body == b'{"count":1}'
+    assert loader.await_count == 1
+    assert render.call_count == 1
+
+
+async def test_stale_while_revalidate(cache):
+    """Test that stale entries are served while refreshed in the background."""
+    policy = CachePolicy(ttl=10, stale_while_revalidate=60)
+    cache.backend.set("k", CacheEntry(body=b'{"v":"old"}', stored_at=0))
+    loader = AsyncMock(return_value=UpstreamResponse(data={"v": "new"}))
+    
+    with patch("app.services.response_cache.time.monotonic", return_value=30):
+        result = await cache.get_or_fetch("k", policy, loader, "test", orjson.dumps)
+        await asyncio.sleep(0)
+    
+    assert result.result == "stale"
+    assert result.body == b'{"v":"old"}'
+    assert result.age == 30
+    assert cache.backend.get("k").body == b'{"v":"new"}'
+
+
+async def test_stale_if_error(cache):
+    """Test that upstream 5xx errors fall back to expired entries."""
+    policy = CachePolicy(ttl=10, stale_if_error=300)
+    cache.backend.set("k", CacheEntry(body=b'{"v":"old"}', stored_at=0))
+    loader = AsyncMock(side_effect=HTTPException(status_code=503, detail="down"))
+    
+    with patch("app.services.response_cache.time.monotonic", return_value=100):
+        result = await cache.get_or_fetch("k", policy, loader, "test", orjson.dumps)
+    
+    assert result.result == "stale-if-error"
+    assert result.body == b'{"v":"old"}'
+    
+    # Client errors are never masked by stale data
+    loader.side_effect = HTTPException(status_code=404, detail="not found")
+    with patch("app.services.response_cache.time.monotonic", return_value=100):
+        with pytest.raises(HTTPException):
+            await cache.get_or_fetch("k", policy, loader, "test", orjson.dumps)
+
+
+async def test_expired_entry_revalidated_with_etag(cache):
+    """Test that a 304 from upstream refreshes an expired entry without a new body."""
+    policy = CachePolicy(ttl=10)
+    cache.backend.set("k", CacheEntry(body=b'{"v":"old"}', stored_at=0, etag='"abc"'))
+    loader = AsyncMock(return_value=UpstreamResponse(data=None, etag='"abc"', not_modified=True))
+    
+    with patch("app.services.response_cache.time.monotonic", return_value=100):
+        result = await cache.get_or_fetch("k", policy, loader, "test", orjson.dumps)
+    
+    loader.assert_awaited_once_with('"abc"')
+    assert result.result == "revalidated"
+    assert result.body == b'{"v":"old"}'
+    assert cache.backend.get("k").stored_at == 100
+
+
+def test_lru_evicts_by_size():
+    """Test that the backend stays within its byte bound."""
+    backend = LRUCacheBackend(max_bytes=100)
+    backend.set("a", CacheEntry(body=b"a" * 40, stored_at=0))
+    backend.set("b", CacheEntry(body=b"b" * 40, stored_at=0))
+    backend.get("a")
+    backend.set("c", CacheEntry(body=b"c" * 40, stored_at=0))
+    
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.size_bytes == 80
+
+
+def test_cached_endpoint_headers(client):
+    """Test that cached routes expose Cache-Control, Age and X-Cache."""
+    upstream = AsyncMock(return_value=UpstreamResponse(data={"buckets": [], "count": 0}))
+    
+    with patch("app.routers.aws_resources.call_auxiliary_service", upstream):
+        first = client.get("/api/v1/s3/buckets")
+        second = client.get("/api/v1/s3/buckets")
+    
+    assert first.status_code == 200
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.headers["content-type"] == "application/json"
+    assert second.json() == {"buckets": [], "count": 0, "main_api_version": first.json()["main_api_version"]}
+    assert "max-age=" in second.headers["Cache-Control"]
+    assert "Age" in second.headers
+    assert upstream.await_count == 1
+
+
+def test_conditional_get_returns_not_modified(client):
+    """Test that a matching If-None-Match is answered with 304 and no body."""
+    upstream = AsyncMock(return_value=UpstreamResponse(data={"buckets": [], "count": 0}, etag='"v1"'))
+    
+    with patch("app.routers.aws_resources.call_auxiliary_service", upstream):
+        first = client.get("/api/v1/s3/buckets")
+        etag = first.headers["ETag"]
+        second = client.get("/api/v1/s3/buckets", headers={"If-None-Match": etag})
+    
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+
+def test_decrypted_values_not_cached(client):
+    """Test that decrypted parameter values bypass the response cache."""
+    value = {"name": "/app/secret", "value": "s3cr3t", "type": "SecureString"}
+    upstream = AsyncMock(return_value=UpstreamResponse(data=value, etag='"v1"'))
+    
+    with patch("app.routers.aws_resources.call_auxiliary_service", upstream):
+        first = client.get("/api/v1/parameters/value?name=/app/secret&decrypt=true")
+        second = client.get("/api/v1/parameters/value?name=/app/secret&decrypt=true")
+        client.get("/api/v1/parameters/value?name=/app/secret&decrypt=false")
+        client.get("/api/v1/parameters/value?name=/app/secret&decrypt=false")
+    
+    assert first.headers["Cache-Control"] == "no-store"
+    assert "X-Cache" not in second.headers
+    assert second.json()["value"] == "s3cr3t"
+    assert "ETag" in second.headers
+    assert upstream.await_count == 3
+    assert len(response_cache.backend) == 1
+
+
+def test_backend_interface_is_abstract():
+    """Test that a backend must implement the whole storage interface."""
+    class Incomplete(CacheBackend):
+        def get(self, key):
+            return None
+    
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,90 @@
+"""
+Tests for coalescing of concurrent upstream calls.
+"""
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_upstream_call():
+    """Test that identical concurrent calls run the upstream call once."""
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+    
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"count": 1}
+    
+    waiters = [asyncio.create_task(flight.do("key", fetch)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+    
+    assert calls == 1
+    assert all(result == {"count": 1} for result in results)
+    assert len(flight) == 0
+
+
+async def test_errors_are_fanned_out():
+    """Test that every waiter sees the upstream error."""
+    flight = SingleFlight()
+    
+    async def fetch():
+        await asyncio.sleep(0)
+        raise RuntimeError("upstream failed")
+    
+    results = await asyncio.gather(
+        *(flight.do("key", fetch) for _ in range(3)),
+        return_exceptions=True
+    )
+    
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    """Test that one cancelled caller leaves the call running for the others."""
+    flight = SingleFlight()
+    release = asyncio.Event()
+    
+    async def fetch():
+        await release.wait()
+        return "done"
+    
+    first = asyncio.create_task(flight.do("key", fetch))
+    second = asyncio.create_task(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_abandoned_call_is_cancelled():
+    """Test that the shared call is cancelled once every caller is gone."""
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+    
+    async def fetch():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+    
+    waiter = asyncio.create_task(flight.do("key", fetch))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    
+    assert cancelled.is_set()
+    assert len(flight) == 0
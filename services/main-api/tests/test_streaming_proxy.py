@@ -0,0 +1,114 @@
+"""
+Tests for the streaming passthrough proxy mode.
+"""
+import json
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from app.main import app
+from app.routers import aws_resources
+from app.services import http_client
+from app.services.circuit_breaker import CircuitBreaker
+from app.utils import splice_json_fields
+
+
+async def collect(chunks, fields):
+    """Run splice_json_fields over a list of chunks and join the output."""
+    async def source():
+        for chunk in chunks:
+            yield chunk
+    
+    return b"".join([part async for part in splice_json_fields(source(), fields)])
+
+
+@pytest.mark.parametrize("chunks", [
+    [b'{"count": 2, "items": [1, 2]}'],
+    [b" ", b"{", b'"count"', b": 2, ", b'"items": [1, 2]}'],
+])
+async def test_splice_across_chunk_boundaries(chunks):
+    """Test that fields are spliced regardless of how the body is chunked."""
+    body = await collect(chunks, {"main_api_version": "1.0.0"})
+    
+    assert json.loads(body) == {"main_api_version": "1.0.0", "count": 2, "items": [1, 2]}
+
+
+async def test_splice_empty_object_and_non_object():
+    """Test edge cases: empty objects get no trailing comma, arrays are untouched."""
+    assert json.loads(await collect([b"{}"], {"v": 1})) == {"v": 1}
+    assert await collect([b"[1, 2]"], {"v": 1}) == b"[1, 2]"
+
+
+@pytest.fixture
+def streaming_upstream():
+    """Shared client backed by a fake auxiliary service, with streaming mode on."""
+    def handler(request):
+        if request.url.path == "/aws/parameters":
+            return httpx.Response(
+                200,
+                stream=httpx.ByteStream(b'{"parameters": [], "count": 0, "path_prefix": "/app"}'),
+                headers={"content-type": "application/json", "X-Auxiliary-Service-Version": "1.0.0"}
+            )
+        return httpx.Response(500, content=b"boom")
+    
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch.object(app.state, "http_client", client, create=True), \
+            patch.object(aws_resources.settings, "proxy_streaming_enabled", True), \
+            patch.object(http_client, "auxiliary_breaker", CircuitBreaker("test")):
+        yield client
+
+
+def test_streaming_list_parameters(client, streaming_upstream):
+    """Test that the streamed body carries upstream data plus main_api_version."""
+    response = client.get("/api/v1/parameters?path_prefix=/app")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["path_prefix"] == "/app"
+    assert data["main_api_version"]
+    assert "X-Cache" not in response.headers
+
+
+def test_streaming_upstream_error(client, streaming_upstream):
+    """Test that upstream errors still map to HTTP errors before streaming starts."""
+    response = client.get("/api/v1/s3/buckets")
+    
+    assert response.status_code == 500
+    assert "boom" in response.json()["detail"]
+
+
+def test_streaming_parameters_by_path(client):
+    """Test that NDJSON subtrees are relayed untouched."""
+    body = b'{"name": "/app/prod/a", "value": "1"}\n{"name": "/app/prod/b", "value": "2"}\n'
+    
+    def handler(request):
+        assert request.url.params["path"] == "/app/prod"
+        return httpx.Response(200, stream=httpx.ByteStream(body), headers={"content-type": "application/x-ndjson"})
+    
+    upstream = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch.object(app.state, "http_client", upstream, create=True), \
+            patch.object(http_client, "auxiliary_breaker", CircuitBreaker("test")):
+        response = client.get("/api/v1/parameters/by-path?path=/app/prod")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.content == body
+
+
+def test_streaming_body_shape_independent_of_accept_encoding(client, streaming_upstream):
+    """Test that upstream is asked for identity and the version is spliced for every client."""
+    sent = []
+    original = streaming_upstream.send
+    
+    async def record(request, **kwargs):
+        sent.append(request.headers["accept-encoding"])
+        return await original(request, **kwargs)
+    
+    with patch.object(streaming_upstream, "send", record):
+        for encoding in ("gzip", "identity"):
+            response = client.get("/api/v1/parameters?path_prefix=/app", headers={"Accept-Encoding": encoding})
+            assert response.status_code == 200
+            assert response.json()["main_api_version"]
+    
+    assert sent == ["identity", "identity"]
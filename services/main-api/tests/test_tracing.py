@@ -0,0 +1,83 @@
+"""
+Tests for request tracing and Server-Timing phases.
+"""
+import httpx
+import pytest
+from unittest.mock import patch
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from app import server_timing, tracing
+from app.main import app
+
+INCOMING_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+@pytest.fixture
+def upstream():
+    """Auxiliary service stub that records request headers and reports its own phases."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            stream=httpx.ByteStream(b'{"key": "a.txt", "size": 1}\n'),
+            headers={"Content-Type": "application/x-ndjson", "Server-Timing": "aws;dur=12.5, queue;dur=0.5"}
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch.object(app.state, 'http_client', client, create=True):
+        yield requests
+
+
+@pytest.fixture
+def spans():
+    """Record spans with a local tracer provider instead of the global one."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with patch.object(tracing, '_enabled', True), \
+            patch.object(tracing.trace, 'get_tracer', provider.get_tracer):
+        yield exporter
+
+
+def test_server_timing_header_format():
+    """Test that repeated phases are summed and relayed entries are prefixed."""
+    timing = server_timing.ServerTiming()
+    timing.record("upstream", 0.010)
+    timing.record("upstream", 0.005)
+    timing.relay('aws;dur=4.25;desc="S3", bad;dur=x, cache', prefix="aux-")
+
+    assert timing.header_value() == 'upstream;dur=15.0;desc="2 calls", aux-aws;dur=4.2'
+
+
+def test_server_timing_relays_upstream_phases(client, upstream):
+    """Test that responses report app, upstream and the auxiliary service's phases."""
+    response = client.get("/api/v1/s3/buckets/my-bucket/objects", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    phases = [entry.split(";")[0] for entry in response.headers["Server-Timing"].split(", ")]
+    assert phases == ["upstream", "aux-aws", "aux-queue", "app"]
+
+
+def test_trace_context_propagated_upstream(client, upstream, spans):
+    """Test that the incoming trace is continued and passed on to the auxiliary service."""
+    traceparent = f"00-{INCOMING_TRACE_ID}-00f067aa0ba902b7-01"
+    response = client.get("/api/v1/s3/buckets/my-bucket/objects", headers={"traceparent": traceparent})
+
+    assert response.status_code == 200
+    finished = {span.name: span for span in spans.get_finished_spans()}
+    server = finished["GET /api/v1/s3/buckets/{bucket}/objects"]
+    upstream_call = finished["GET auxiliary-service"]
+
+    assert format(server.context.trace_id, "032x") == INCOMING_TRACE_ID
+    assert upstream_call.parent.span_id == server.context.span_id
+    assert upstream_call.attributes["http.status_code"] == 200
+
+    sent = upstream[0].headers["traceparent"]
+    assert sent.split("-")[1] == INCOMING_TRACE_ID
+    assert sent.split("-")[2] == format(upstream_call.context.span_id, "016x")
@@ -0,0 +1,55 @@
+"""
+Tests for the cached auxiliary service version.
+"""
+import time
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.services.version_info import AuxiliaryVersionInfo
+
+
+@pytest.fixture
+def version_holder():
+    """Fresh version holder, not attached to any client."""
+    return AuxiliaryVersionInfo(ttl=60, refresh_interval=60)
+
+
+def test_version_unknown_before_first_refresh(version_holder):
+    """Test that the holder reports unknown until a version is seen."""
+    assert version_holder.version == "unknown"
+    assert version_holder.is_stale
+
+
+def test_observe_updates_version(version_holder):
+    """Test that versions seen on proxied responses are recorded."""
+    version_holder.observe("1.2.3")
+    
+    assert version_holder.version == "1.2.3"
+    assert not version_holder.is_stale
+    
+    # Missing or unknown header values never overwrite a known version
+    version_holder.observe(None)
+    version_holder.observe("unknown")
+    assert version_holder.version == "1.2.3"
+
+
+def test_stale_value_is_still_served(version_holder):
+    """Test that an expired value falls back to the last known version."""
+    version_holder.observe("1.2.3")
+    version_holder._updated_at = time.monotonic() - 120
+    
+    assert version_holder.is_stale
+    assert version_holder.version == "1.2.3"
+
+
+async def test_refresh_keeps_last_known_on_error(version_holder):
+    """Test that a failed refresh keeps the last known version."""
+    client = Mock()
+    client.get = AsyncMock(return_value=Mock(status_code=200, json=Mock(return_value={"version": "2.0.0"})))
+    version_holder._client = client
+    
+    assert await version_holder.refresh() == "2.0.0"
+    
+    client.get = AsyncMock(side_effect=Exception("Connection refused"))
+    assert await version_holder.refresh() == "2.0.0"